@@ -1 +1,4 @@
 # Dash app package init
+
+# 앱 버전 (보고서 렌더링 캐시 키에 포함, 보고서 컴포넌트 변경 시 올릴 것)
+__version__ = "1.1.0"
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+인재풀 분석 집계
+- 분석 스냅샷(analytics_snapshot)의 후보자 × 5대 차원 점수 행렬을 그룹별로 집계합니다.
+- 후보자별 보고서를 다시 읽거나 파이썬 반복문으로 계산하지 않고 NumPy/pandas 연산만 사용합니다.
+"""
+
+from typing import Dict, List, TypedDict
+
+import numpy as np
+import pandas as pd
+
+from .analytics_snapshot import DIMENSION_COLUMNS, load_snapshot
+from .dimension_scores import DIMENSIONS
+
+# 그룹 기준 (컬럼명: 화면 표시명)
+GROUP_KEYS = {"organization": "지원조직", "position": "지원직급", "month": "면접월"}
+
+# 채용추천 표시 순서 (report_schema.ComprehensiveReport.recommendation)
+RECOMMENDATION_ORDER = ("강력 추천", "추천", "고려", "보류", "비추천")
+
+# 점수 분포 구간 (0~100, 10점 단위)
+SCORE_BINS = np.arange(0, 101, 10)
+
+# 지원조직/지원직급은 인원이 많은 순으로 이 개수까지만 나누고 나머지는 '기타'로 묶음
+MAX_GROUPS = 15
+OTHER_LABEL = "기타"
+UNKNOWN_LABEL = "미상"
+
+_FRAME_COLUMNS = (
+    "id", "organization", "position", "interview_date",
+    "overall_score", "recommendation", *DIMENSION_COLUMNS,
+)
+
+
+class PoolAnalytics(TypedDict):
+    group_by: str
+    total: int
+    mean_score: float
+    recommend_ratio: float
+    groups: List[str]
+    counts: List[int]
+    dimension_means: pd.DataFrame      # 그룹 × 5대 차원 평균
+    score_quantiles: pd.DataFrame      # 그룹 × (min, q1, median, q3, max)
+    score_histogram: Dict[str, List]   # 전체 종합점수 분포 {"edges", "counts"}
+    recommendation_mix: pd.DataFrame   # 그룹 × 채용추천 비율(%)
+
+
+def load_pool_frame() -> pd.DataFrame:
+    """스냅샷에서 집계에 필요한 컬럼만 DataFrame으로 변환합니다. (보고서 변환에 실패한 후보자 제외)"""
+    table = load_snapshot("candidates").select(list(_FRAME_COLUMNS))
+    df = table.to_pandas()
+    df = df[df[list(DIMENSION_COLUMNS)].notna().any(axis=1)]
+    # 면접일 표기가 제각각이라 날짜로 읽을 수 있는 값만 월로 변환
+    # (행마다 strftime하면 느리므로 중복 없는 월만 문자열로 만들고, 읽지 못한 값(-1)은 '미상')
+    dates = pd.to_datetime(df["interview_date"], errors="coerce")
+    codes, months = pd.factorize(dates.dt.to_period("M"))
+    labels = np.array([str(month) for month in months] + [UNKNOWN_LABEL], dtype=object)
+    return df.assign(month=labels[codes])
+
+
+def _group_labels(df: pd.DataFrame, group_by: str) -> pd.Series:
+    labels = df[group_by].replace("", UNKNOWN_LABEL).fillna(UNKNOWN_LABEL)
+    if group_by == "month":
+        return labels
+    top = labels.value_counts().index[:MAX_GROUPS]
+    return labels.where(labels.isin(top), OTHER_LABEL)
+
+
+def _group_order(labels: pd.Series, group_by: str) -> List[str]:
+    """월은 시간순, 나머지는 인원 많은 순 ('기타'/'미상'은 맨 뒤)"""
+    counts = labels.value_counts()
+    if group_by == "month":
+        order = sorted(counts.index)
+    else:
+        order = list(counts.index)
+    tail = [label for label in (OTHER_LABEL, UNKNOWN_LABEL) if label in order]
+    return [label for label in order if label not in tail] + tail
+
+
+def compute_pool_analytics(df: pd.DataFrame, group_by: str = "organization") -> PoolAnalytics:
+    """후보자 DataFrame(load_pool_frame)을 group_by 기준으로 집계합니다."""
+    if group_by not in GROUP_KEYS:
+        raise ValueError(f"알 수 없는 그룹 기준: {group_by}")
+
+    labels = _group_labels(df, group_by)
+    order = _group_order(labels, group_by)
+    scores = df["overall_score"]
+    grouped = pd.DataFrame(
+        df[list(DIMENSION_COLUMNS)].to_numpy(), columns=list(DIMENSIONS), index=labels
+    ).groupby(level=0)
+
+    dimension_means = grouped.mean().reindex(order)
+    score_quantiles = (
+        scores.groupby(labels.to_numpy())
+        .quantile([0, 0.25, 0.5, 0.75, 1])
+        .unstack()
+        .reindex(order)
+    )
+    score_quantiles.columns = ["min", "q1", "median", "q3", "max"]
+
+    recommendation_mix = pd.crosstab(
+        labels.to_numpy(), df["recommendation"].to_numpy(), normalize="index"
+    ).reindex(index=order, columns=list(RECOMMENDATION_ORDER), fill_value=0) * 100
+
+    histogram_counts, edges = np.histogram(scores.dropna(), bins=SCORE_BINS)
+    recommend = df["recommendation"].isin(RECOMMENDATION_ORDER[:2]).to_numpy()
+
+    return {
+        "group_by": group_by,
+        "total": int(len(df)),
+        "mean_score": float(scores.mean()) if len(df) else 0.0,
+        "recommend_ratio": float(recommend.mean() * 100) if len(df) else 0.0,
+        "groups": order,
+        "counts": [int(n) for n in labels.value_counts().reindex(order)],
+        "dimension_means": dimension_means,
+        "score_quantiles": score_quantiles,
+        "score_histogram": {"edges": edges.tolist(), "counts": histogram_counts.tolist()},
+        "recommendation_mix": recommendation_mix,
+    }
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+"""
+후보자 분석 결과 컬럼형 스냅샷 (Arrow IPC)
+- candidates.arrow: 후보자 1명당 1행 (목록 컬럼 + 종합점수 + 5대 차원 평균 + 가중평균 + 강점/리스크 제목)
+- items.arrow: 분석 항목 1개당 1행 (candidate_id, 항목 순서, 차원, 제목, 점수)
+- 저장된 report_json에서 만들며 LLM 원문은 다시 파싱하지 않습니다.
+- 저장/삭제 시 해당 id의 행만 바꿔 다시 쓰고(update_snapshot), 읽을 때는 메모리 맵으로 복사 없이 엽니다.
+- 파일은 DB 파일 옆 <DB 이름>_analytics/ 디렉터리에 있으며, 언제든 지우고 다시 만들 수 있습니다.
+- 갱신(DB 읽기 → 기존 파일 읽기 → 새 파일 쓰기)은 디렉터리의 잠금 파일(filelock)로 프로세스 간에도
+  한 번에 하나만 수행하므로, 여러 워커나 CLI import가 동시에 저장해도 행을 잃지 않습니다.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from filelock import FileLock
+
+from . import db
+from .dimension_scores import DIMENSIONS, dimension_means, weighted_score
+from .serialization import JSONDecodeError, loads
+
+# 스키마가 바뀌면 올려서 기존 스냅샷을 다시 만들게 함
+SNAPSHOT_VERSION = "2"
+
+# 차원별 평균 컬럼명 (예: dim_capability)
+DIMENSION_COLUMNS = tuple(f"dim_{dimension.lower()}" for dimension in DIMENSIONS)
+
+_METADATA = {b"snapshot_version": SNAPSHOT_VERSION.encode()}
+
+CANDIDATE_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("name", pa.string()),
+        ("organization", pa.string()),
+        ("position", pa.string()),
+        ("interview_date", pa.string()),
+        ("created_at", pa.string()),
+        ("content_hash", pa.string()),
+        ("recommendation", pa.string()),
+        ("overall_score", pa.float64()),
+        ("weighted_score", pa.float64()),
+        *[(column, pa.float64()) for column in DIMENSION_COLUMNS],
+        ("item_count", pa.int32()),
+        ("strengths", pa.list_(pa.string())),
+        ("risks", pa.list_(pa.string())),
+    ],
+    metadata=_METADATA,
+)
+
+ITEM_SCHEMA = pa.schema(
+    [
+        ("candidate_id", pa.string()),
+        ("item_index", pa.int32()),
+        ("category", pa.string()),
+        ("title", pa.string()),
+        ("score", pa.float64()),
+    ],
+    metadata=_METADATA,
+)
+
+SNAPSHOT_FILES = {"candidates": "candidates.arrow", "items": "items.arrow"}
+_SCHEMAS = {"candidates": CANDIDATE_SCHEMA, "items": ITEM_SCHEMA}
+# 이 파일이 있으면 증분 갱신이 실패했던 것이므로 다음 조회 때 전체를 다시 만듦
+_STALE_MARKER = "STALE"
+
+_SOURCE_COLUMNS = (
+    "SELECT id, name, organization, position, interview_date, created_at, "
+    "content_hash, recommendation, overall_score, report_json FROM candidate_analysis "
+)
+_BATCH_SIZE = 500
+
+# 갱신 잠금 파일과 대기 시간 (초, 전체 재생성이 끝나기를 기다릴 수 있을 만큼)
+_LOCK_FILE = ".lock"
+SNAPSHOT_LOCK_TIMEOUT = 120
+
+_snapshot_lock = threading.Lock()
+
+
+def snapshot_dir() -> str:
+    """현재 DB_PATH에 대응하는 스냅샷 디렉터리 (예: candidates.db -> candidates_analytics/)"""
+    return os.path.splitext(db.DB_PATH)[0] + "_analytics"
+
+
+def _path(kind: str) -> str:
+    return os.path.join(snapshot_dir(), SNAPSHOT_FILES[kind])
+
+
+@contextmanager
+def _locked() -> Iterator[None]:
+    """
+    스냅샷 갱신 잠금 (같은 프로세스의 스레드와 다른 프로세스 모두)
+    SNAPSHOT_LOCK_TIMEOUT 안에 잡지 못하면 filelock.Timeout이 발생합니다.
+    """
+    os.makedirs(snapshot_dir(), exist_ok=True)
+    file_lock = FileLock(os.path.join(snapshot_dir(), _LOCK_FILE), timeout=SNAPSHOT_LOCK_TIMEOUT)
+    with _snapshot_lock, file_lock:
+        yield
+
+
+def _load_report(report_json: Optional[str]) -> Dict[str, Any]:
+    if not report_json:
+        return {}
+    try:
+        report = loads(report_json)
+    except JSONDecodeError:
+        return {}
+    return report if isinstance(report, dict) else {}
+
+
+def _report_items(report: Dict[str, Any]) -> List[Dict[str, Any]]:
+    items = report.get("analysis_items")
+    return [item for item in items or [] if isinstance(item, dict)]
+
+
+def _decision_titles(report: Dict[str, Any], key: str) -> List[str]:
+    """decision_points의 강점(strengths)/리스크(risks) 제목 목록"""
+    points = report.get("decision_points")
+    entries = points.get(key) if isinstance(points, dict) else None
+    return [str(entry.get("title", "")) for entry in entries or [] if isinstance(entry, dict)]
+
+
+def _build_batches(rows: Sequence[Tuple[Any, ...]]) -> Tuple[pa.RecordBatch, pa.RecordBatch]:
+    """DB 행 묶음을 (후보자 배치, 분석 항목 배치)로 변환합니다."""
+    candidates: Dict[str, List[Any]] = {field.name: [] for field in CANDIDATE_SCHEMA}
+    items: Dict[str, List[Any]] = {field.name: [] for field in ITEM_SCHEMA}
+    means = np.full((len(rows), len(DIMENSIONS)), np.nan)
+
+    for i, (cid, name, organization, position, interview_date, created_at,
+            content_hash, recommendation, overall_score, report_json) in enumerate(rows):
+        report = _load_report(report_json)
+        report_items = _report_items(report)
+        categories = [item.get("category", "") for item in report_items]
+        scores = [float(item.get("score") or 0) for item in report_items]
+        means[i] = dimension_means(categories, scores)
+
+        for key, value in (
+            ("id", cid), ("name", name), ("organization", organization),
+            ("position", position), ("interview_date", interview_date),
+            ("created_at", created_at), ("content_hash", content_hash),
+            ("recommendation", recommendation), ("overall_score", overall_score),
+            ("item_count", len(report_items)),
+            ("strengths", _decision_titles(report, "strengths")),
+            ("risks", _decision_titles(report, "risks")),
+        ):
+            candidates[key].append(value)
+
+        items["candidate_id"].extend([cid] * len(report_items))
+        items["item_index"].extend(range(len(report_items)))
+        items["category"].extend(categories)
+        items["title"].extend(str(item.get("title", "")) for item in report_items)
+        items["score"].extend(scores)
+
+    # 보고서 변환에 실패한 행(항목 없음)은 가중평균도 비워 둠
+    has_items = np.asarray(candidates["item_count"]) > 0
+    candidates["weighted_score"] = np.where(has_items, weighted_score(means), np.nan)
+    for j, column in enumerate(DIMENSION_COLUMNS):
+        candidates[column] = means[:, j]
+
+    return (
+        pa.record_batch(
+            [pa.array(candidates[f.name], type=f.type, from_pandas=True) for f in CANDIDATE_SCHEMA],
+            schema=CANDIDATE_SCHEMA,
+        ),
+        pa.record_batch(
+            [pa.array(items[f.name], type=f.type) for f in ITEM_SCHEMA],
+            schema=ITEM_SCHEMA,
+        ),
+    )
+
+
+def _iter_source_batches(
+    ids: Optional[Sequence[str]] = None,
+) -> Iterator[Tuple[pa.RecordBatch, pa.RecordBatch]]:
+    """DB 행을 _BATCH_SIZE개씩 읽어 스냅샷 배치로 변환합니다. (ids가 있으면 해당 id만)"""
+    with db.db_session() as conn:
+        if ids is None:
+            cursor = conn.execute(_SOURCE_COLUMNS + "ORDER BY rowid")
+            while True:
+                rows = cursor.fetchmany(_BATCH_SIZE)
+                if not rows:
+                    break
+                yield _build_batches(rows)
+            return
+        for start in range(0, len(ids), _BATCH_SIZE):
+            chunk = ids[start:start + _BATCH_SIZE]
+            rows = conn.execute(
+                _SOURCE_COLUMNS + f"WHERE id IN ({', '.join('?' * len(chunk))}) ORDER BY rowid",
+                chunk,
+            ).fetchall()
+            if rows:
+                yield _build_batches(rows)
+
+
+def _write_snapshot(
+    kept: Dict[str, Optional[pa.Table]],
+    batches: Iterable[Tuple[pa.RecordBatch, pa.RecordBatch]],
+) -> int:
+    """
+    기존 행(kept)과 새 배치를 임시 파일에 쓴 뒤 교체합니다. 반환값은 후보자 행 수입니다.
+    두 파일을 모두 쓴 다음 파일별로 os.replace하므로 읽는 쪽이 쓰다 만 파일을 보지는 않습니다.
+    """
+    directory = snapshot_dir()
+    os.makedirs(directory, exist_ok=True)
+    tmp_paths = {kind: _path(kind) + f".{os.getpid()}.tmp" for kind in SNAPSHOT_FILES}
+    writers = {
+        kind: pa.ipc.new_file(tmp_paths[kind], _SCHEMAS[kind]) for kind in SNAPSHOT_FILES
+    }
+    total = 0
+    try:
+        for kind, table in kept.items():
+            if table is not None and table.num_rows:
+                # 갱신할 때마다 작은 배치가 쌓이지 않도록 하나로 합쳐서 기록
+                writers[kind].write_table(table.combine_chunks())
+        if kept.get("candidates") is not None:
+            total += kept["candidates"].num_rows
+        for candidate_batch, item_batch in batches:
+            writers["candidates"].write_batch(candidate_batch)
+            writers["items"].write_batch(item_batch)
+            total += candidate_batch.num_rows
+        for writer in writers.values():
+            writer.close()
+        for kind in SNAPSHOT_FILES:
+            os.replace(tmp_paths[kind], _path(kind))
+    finally:
+        for kind, writer in writers.items():
+            if os.path.exists(tmp_paths[kind]):
+                try:
+                    writer.close()
+                except Exception:
+                    pass
+                os.remove(tmp_paths[kind])
+    return total
+
+
+def _mark_stale() -> None:
+    try:
+        os.makedirs(snapshot_dir(), exist_ok=True)
+        open(os.path.join(snapshot_dir(), _STALE_MARKER), "w").close()
+    except OSError as e:
+        print(f"[SNAPSHOT] 갱신 필요 표시 실패: {e}")
+
+
+def _is_current() -> bool:
+    """스냅샷 파일이 모두 있고, 현재 버전이며, 갱신 실패 표시가 없는지 확인합니다."""
+    if os.path.exists(os.path.join(snapshot_dir(), _STALE_MARKER)):
+        return False
+    for kind in SNAPSHOT_FILES:
+        path = _path(kind)
+        if not os.path.exists(path):
+            return False
+        try:
+            with pa.memory_map(path) as source:
+                metadata = pa.ipc.open_file(source).schema.metadata or {}
+        except (OSError, pa.ArrowInvalid):
+            return False
+        if metadata.get(b"snapshot_version") != SNAPSHOT_VERSION.encode():
+            return False
+    return True
+
+
+def rebuild_snapshot() -> int:
+    """DB 전체로 스냅샷을 다시 만들고 후보자 수를 반환합니다."""
+    with _locked():
+        total = _write_snapshot({}, _iter_source_batches())
+        marker = os.path.join(snapshot_dir(), _STALE_MARKER)
+        if os.path.exists(marker):
+            os.remove(marker)
+    print(f"[SNAPSHOT] 전체 재생성: 후보자 {total}명")
+    return total
+
+
+def update_snapshot(candidate_ids: Iterable[str]) -> Optional[List[pa.RecordBatch]]:
+    """
+    저장/삭제된 후보자 id의 행만 DB에서 다시 읽어 교체합니다. (삭제된 id는 빠짐)
+    스냅샷이 아직 없으면 처음 조회할 때 만들므로 파일은 건드리지 않습니다.
+    실패해도 저장/삭제를 막지 않고, 다음 조회 때 전체를 다시 만들도록 표시만 합니다.
+    반환값은 다시 읽은 후보자 배치이며 코호트 백분위 색인 갱신에 사용합니다. (실패 시 None)
+    """
+    ids = list(dict.fromkeys(candidate_ids))
+    if not ids:
+        return []
+    try:
+        # 다른 프로세스가 같은 id를 먼저 읽고 늦게 쓰지 않도록 DB 읽기부터 잠금 안에서 수행
+        with _locked():
+            batches = list(_iter_source_batches(ids))
+            if _is_current():
+                id_set = pa.array(ids, type=pa.string())
+                kept: Dict[str, Optional[pa.Table]] = {}
+                for kind, key in (("candidates", "id"), ("items", "candidate_id")):
+                    table = _read_table(kind)
+                    kept[kind] = table.filter(pc.invert(pc.is_in(table[key], value_set=id_set)))
+                _write_snapshot(kept, batches)
+    except Exception as e:
+        print(f"[SNAPSHOT] 증분 갱신 실패, 다음 조회 시 재생성: {e}")
+        _mark_stale()
+        return None
+    return [candidate_batch for candidate_batch, _ in batches]
+
+
+def _read_table(kind: str) -> pa.Table:
+    """Arrow 파일을 메모리 맵으로 엽니다. (버퍼를 복사하지 않음)"""
+    with pa.memory_map(_path(kind)) as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def load_snapshot(kind: str = "candidates") -> pa.Table:
+    """
+    스냅샷 테이블(kind: 'candidates' 또는 'items')을 반환합니다.
+    파일이 없거나 오래된 버전이면 먼저 전체를 다시 만듭니다.
+    """
+    if kind not in SNAPSHOT_FILES:
+        raise ValueError(f"알 수 없는 스냅샷 종류: {kind}")
+    if not _is_current():
+        rebuild_snapshot()
+    return _read_table(kind)
@@ -4,21 +4,23 @@ import dash
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
-from .db import init_db
-
 # 콜백 등록 함수들 임포트
 from .callbacks.llm_callbacks import register_llm_callbacks
 from .callbacks.report_callbacks import register_report_callbacks
 from .callbacks.prompt_callbacks import register_prompt_callbacks
 from .callbacks.routing_callbacks import register_routing_callbacks
+from .callbacks.analytics_callbacks import register_analytics_callbacks
+from .callbacks.comparison_callbacks import register_comparison_callbacks
 from .ui_candidate import register_candidate_callbacks
+from .candidate_export import register_export_routes
+from .pdf_report import register_pdf_routes
+from .pdf_packet import register_packet_routes
+from .static_report import register_print_routes
+from .prompt_tokens import preload_encoding
 
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ASSETS_PATH = os.path.join(ROOT_DIR, "assets")
 
-# 앱 시작 시 DB 테이블 자동 생성
-init_db()
-
 # app 인스턴스는 단 한 번만 생성
 app = dash.Dash(
     __name__,
@@ -61,8 +63,22 @@ register_llm_callbacks(app)
 register_report_callbacks(app)
 register_prompt_callbacks(app)
 register_candidate_callbacks(app)
+register_analytics_callbacks(app)
+register_comparison_callbacks(app)
 register_routing_callbacks(app)
 
+# -------------------- 서버 경로 등록 --------------------
+# 후보자 목록 내보내기 (/export/candidates.<csv|xlsx|parquet>)
+register_export_routes(server)
+# 보고서 PDF (/pdf-report/<후보자 id>/<comprehensive|executive|hr>.pdf)
+register_pdf_routes(server)
+# 여러 후보자 보고서 묶음 (/pdf-packet/<작업 id>)
+register_packet_routes(server)
+# 인쇄용 보고서 정적 HTML (/print-report/<후보자 id>/<comprehensive|executive|hr>)
+register_print_routes(server)
+# 프롬프트 토큰 예산 표시용 tiktoken 인코딩은 첫 요청 때 백그라운드에서 불러옴 (임포트 시간과 콜백 밖)
+server.before_request(preload_encoding)
+
 # -------------------- 앱 실행 --------------------
 if __name__ == "__main__":
     app.run(debug=True)
@@ -0,0 +1,33 @@
+"""인재풀 분석 탭 관련 콜백 함수들"""
+
+from dash import Output, Input
+import dash_bootstrap_components as dbc
+
+
+def register_analytics_callbacks(app):
+    """인재풀 분석 콜백들을 앱에 등록합니다."""
+
+    @app.callback(
+        Output("analytics-content", "children"),
+        [
+            Input("analytics-group-by", "value"),
+            Input("save-signal-store", "data"),
+        ],
+    )
+    def update_analytics(group_by, save_signal):
+        """스냅샷의 점수 행렬을 그룹별로 집계해 KPI와 그래프를 갱신합니다."""
+        from ..analytics import compute_pool_analytics, load_pool_frame
+        from ..ui_analytics import render_analytics_content
+
+        try:
+            df = load_pool_frame()
+        except Exception as e:
+            print(f"[ANALYTICS] 스냅샷 로드 실패: {e}")
+            return dbc.Alert(f"분석 데이터를 불러오지 못했습니다: {e}", color="danger")
+        if df.empty:
+            return dbc.Alert(
+                "보고서로 변환된 후보자가 없습니다. LLM 분석 결과를 먼저 저장하세요.",
+                color="info",
+            )
+        result = compute_pool_analytics(df, group_by or "organization")
+        return render_analytics_content(result)
@@ -0,0 +1,131 @@
+"""후보자 비교 탭 관련 콜백 함수들"""
+
+from dash import Output, Input, State, html
+import dash
+import dash_bootstrap_components as dbc
+
+
+def render_comparison(candidate_ids):
+    """선택한 후보자 id 목록으로 비교 화면(또는 안내 메시지)을 만듭니다."""
+    from ..comparison import MAX_COMPARE_CANDIDATES, MIN_COMPARE_CANDIDATES, load_comparison
+    from ..components.candidate_comparison import render_candidate_comparison
+
+    ids = list(dict.fromkeys(candidate_ids or []))
+    if not MIN_COMPARE_CANDIDATES <= len(ids) <= MAX_COMPARE_CANDIDATES:
+        return dbc.Alert(
+            f"비교할 후보자를 {MIN_COMPARE_CANDIDATES}~{MAX_COMPARE_CANDIDATES}명 선택하세요. "
+            f"(현재 {len(ids)}명)",
+            color="info",
+        )
+    try:
+        comparison = load_comparison(ids)
+    except Exception as e:
+        print(f"[COMPARE] 비교 데이터 로드 실패: {e}")
+        return dbc.Alert(f"비교 데이터를 불러오지 못했습니다: {e}", color="danger")
+
+    missing = len(ids) - len(comparison["candidates"])
+    notice = (
+        html.Div(
+            f"보고서가 없거나 삭제된 후보자 {missing}명은 제외했습니다.",
+            className="text-muted small mb-2",
+        )
+        if missing else None
+    )
+    if len(comparison["candidates"]) < MIN_COMPARE_CANDIDATES:
+        return dbc.Alert("비교할 수 있는 후보자가 부족합니다.", color="warning")
+    return html.Div([notice, render_candidate_comparison(comparison)])
+
+
+def register_comparison_callbacks(app):
+    """후보자 비교 콜백들을 앱에 등록합니다."""
+
+    @app.callback(
+        Output("comparison-candidates", "options"),
+        Input("comparison-candidates", "search_value"),
+        State("comparison-candidates", "value"),
+    )
+    def update_comparison_options(search_value, selected_ids):
+        """검색어에 맞는 후보자와 이미 선택한 후보자만 옵션으로 내려보냅니다."""
+        from ..comparison import search_candidate_options
+
+        try:
+            return search_candidate_options((search_value or "").strip(), selected_ids or [])
+        except Exception as e:
+            print(f"[COMPARE] 후보자 검색 실패: {e}")
+            return dash.no_update
+
+    @app.callback(
+        Output("comparison-content", "children"),
+        [
+            Input("comparison-candidates", "value"),
+            Input("save-signal-store", "data"),
+        ],
+    )
+    def update_comparison(candidate_ids, save_signal):
+        """스냅샷의 차원 벡터로 레이더/히트맵/강점·리스크 비교 화면을 갱신합니다."""
+        return render_comparison(candidate_ids)
+
+    @app.callback(
+        [
+            Output("packet-job-store", "data"),
+            Output("packet-poll", "disabled"),
+            Output("packet-result", "children"),
+        ],
+        Input("packet-start-btn", "n_clicks"),
+        [
+            State("comparison-candidates", "value"),
+            State("packet-report-types", "value"),
+            State("packet-format", "value"),
+        ],
+        prevent_initial_call=True,
+    )
+    def start_packet(n_clicks, candidate_ids, report_types, fmt):
+        """선택한 후보자 PDF 묶음 작업을 백그라운드에서 시작합니다."""
+        from ..pdf_packet import PACKET_MAX_CANDIDATES, start_packet_job
+
+        if not n_clicks:
+            raise dash.exceptions.PreventUpdate
+        if not candidate_ids:
+            return None, True, dbc.Alert("묶을 후보자를 선택하세요.", color="warning")
+        if len(candidate_ids) > PACKET_MAX_CANDIDATES:
+            return None, True, dbc.Alert(
+                f"한 번에 {PACKET_MAX_CANDIDATES}명까지 묶을 수 있습니다.", color="warning"
+            )
+        if not report_types:
+            return None, True, dbc.Alert("보고서 유형을 하나 이상 선택하세요.", color="warning")
+        job_id = start_packet_job(candidate_ids, report_types, fmt or "pdf")
+        return job_id, False, ""
+
+    @app.callback(
+        [
+            Output("packet-progress", "value"),
+            Output("packet-progress", "label"),
+            Output("packet-progress", "style"),
+            Output("packet-result", "children", allow_duplicate=True),
+            Output("packet-poll", "disabled", allow_duplicate=True),
+        ],
+        Input("packet-poll", "n_intervals"),
+        State("packet-job-store", "data"),
+        prevent_initial_call=True,
+    )
+    def poll_packet(n_intervals, job_id):
+        """작업 상태 파일을 읽어 진행률을 표시하고, 끝나면 다운로드 링크를 보여줍니다."""
+        from ..pdf_packet import load_packet_status, packet_url
+
+        status = load_packet_status(job_id) if job_id else None
+        if status is None:
+            return 0, "", {"display": "none"}, dbc.Alert("작업 상태를 찾을 수 없습니다.", color="danger"), True
+        total = max(status["total"], 1)
+        percent = round(status["done"] * 100 / total)
+        label = f"{status['done']}/{status['total']}"
+        if status["state"] == "running":
+            return percent, label, {"display": "flex"}, dash.no_update, False
+        if status["state"] == "error":
+            return percent, label, {"display": "flex"}, dbc.Alert(
+                f"묶음 생성 실패: {status['message']}", color="danger"
+            ), True
+        link = html.Div([
+            html.A("📥 묶음 파일 다운로드", href=packet_url(job_id), className="btn btn-success btn-sm me-2"),
+            html.Span(status["message"], className="text-muted small"),
+        ])
+        return 100, label, {"display": "flex"}, link, True
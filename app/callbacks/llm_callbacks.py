@@ -1,7 +1,7 @@
 """LLM 분석 결과 입력 관련 콜백 함수들"""
 
 import dash
-from dash import Output, Input, State
+from dash import Output, Input, State, html
 import dash_bootstrap_components as dbc
 from datetime import datetime
 
@@ -65,7 +65,23 @@ def register_llm_callbacks(app):
 
         return (dash.no_update,) * 6
 
-    @app.callback(
+    # 입력칸 잠금/해제는 disabled만 바꾸므로 브라우저에서 처리 (서버 왕복 없음)
+    app.clientside_callback(
+        """
+        function() {
+            // 분석 시작/최종 저장 후에는 잠그고, 수정 버튼을 누르면 해제
+            var triggered = window.dash_clientside.callback_context.triggered;
+            var triggeredId = triggered.length ? triggered[0].prop_id.split(".")[0] : "";
+            if (triggeredId === "start-analysis-btn" || triggeredId === "final-save-btn") {
+                return [true, true, true];
+            }
+            if (triggeredId === "edit-analysis-btn") {
+                return [false, false, false];
+            }
+            var noUpdate = window.dash_clientside.no_update;
+            return [noUpdate, noUpdate, noUpdate];
+        }
+        """,
         [
             Output("llm-org-input", "disabled"),
             Output("llm-position-input", "disabled"),
@@ -78,23 +94,6 @@ def register_llm_callbacks(app):
         ],
         prevent_initial_call=True
     )
-    def toggle_input_fields_disabled(
-        start_clicks: int | None, edit_clicks: int | None, save_clicks: int | None
-    ):
-        ctx = dash.callback_context
-        if not ctx.triggered:
-            return (dash.no_update,) * 3
-
-        triggered_id = ctx.triggered[0]["prop_id"].split(".")[0]
-
-        if triggered_id == "start-analysis-btn":
-            return True, True, True
-        if triggered_id == "edit-analysis-btn":
-            return False, False, False
-        if triggered_id == "final-save-btn":
-            return True, True, True
-
-        return (dash.no_update,) * 3
 
     @app.callback(
         [
@@ -143,4 +142,38 @@ def register_llm_callbacks(app):
             return (
                 dbc.Alert(f"저장 중 오류 발생: {e}", color="danger"),
                 dash.no_update,
-            ) 
\ No newline at end of file
+            ) 
+
+    @app.callback(
+        [
+            Output("llm-bulk-upload-msg", "children"),
+            Output("save-signal-store", "data", allow_duplicate=True),
+        ],
+        [Input("llm-bulk-upload", "contents")],
+        [State("llm-bulk-upload", "filename")],
+        prevent_initial_call=True,
+    )
+    def bulk_import_uploads(contents: list[str] | None, filenames: list[str] | None):
+        from ..importer import format_import_summary, import_records, iter_uploads
+
+        if not contents or not filenames:
+            return dash.no_update, dash.no_update
+
+        # 웹 서버 작업자 안에서 프로세스를 fork하지 않도록 현재 프로세스에서 파싱 (건당 수 ms)
+        try:
+            summary = import_records(iter_uploads(filenames, contents), workers=1)
+        except Exception as e:
+            return dbc.Alert(f"일괄 가져오기 중 오류 발생: {e}", color="danger"), dash.no_update
+
+        rejected = summary["rejected"]
+        color = "success" if not rejected else ("warning" if summary["imported"] else "danger")
+        children = [html.Div(format_import_summary(summary))]
+        if rejected:
+            children.append(html.Ul(
+                [html.Li(f"{source}: {reason}") for source, reason in rejected],
+                className="mb-0 mt-2",
+            ))
+        return (
+            dbc.Alert(children, color=color),
+            datetime.now().isoformat() if summary["imported"] else dash.no_update,
+        )
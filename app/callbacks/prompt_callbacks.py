@@ -4,7 +4,8 @@ import dash
 from dash import Output, Input, State
 from datetime import datetime
 
-from ..prompt_logic import generate_custom_prompt
+from ..config import MATERIAL_LABELS, MODEL_TOKEN_BUDGETS
+from ..prompt_logic import plan_custom_prompt
 
 
 def normalize_date(date_str: str) -> str:
@@ -34,6 +35,20 @@ def normalize_date(date_str: str) -> str:
     return date_str
 
 
+def selected_materials(material_values: list[bool] | None) -> list[str]:
+    """자료 체크박스 값 목록을 선택된 자료 이름 목록으로 변환합니다."""
+    return [
+        MATERIAL_LABELS[i]
+        for i, selected in enumerate(material_values or [])
+        if selected and i < len(MATERIAL_LABELS)
+    ]
+
+
+def model_budget(model: str | None) -> int:
+    """선택한 모델의 입력 토큰 한도 (알 수 없으면 첫 번째 모델)"""
+    return MODEL_TOKEN_BUDGETS.get(model, next(iter(MODEL_TOKEN_BUDGETS.values())))
+
+
 def register_prompt_callbacks(app):
     """프롬프트 관련 콜백들을 앱에 등록합니다."""
     
@@ -52,6 +67,8 @@ def register_prompt_callbacks(app):
             State("prompt-candidate-career-input", "value"),
             State({"type": "prompt-upload-material", "index": dash.ALL}, "value"),
             State("prompt-upload-materials-etc", "value"),
+            State("prompt-token-model", "value"),
+            State("prompt-auto-trim", "value"),
         ],
     )
     def generate_prompt_callback(
@@ -64,6 +81,8 @@ def register_prompt_callbacks(app):
         career: str,
         material_values: list[bool],
         etc_input: str | None,
+        model: str | None,
+        auto_trim: bool | None,
     ) -> tuple[str, str]:
         """프롬프트 생성 버튼 클릭 시 실행되는 콜백"""
         if not n_clicks:
@@ -79,34 +98,88 @@ def register_prompt_callbacks(app):
         # 날짜 정규화
         normalized_date = normalize_date(date)
 
-        # material_flags를 uploaded_materials_list로 변환
-        from ..config import MATERIAL_LABELS
-        uploaded_materials = []
-        if material_values:
-            for i, selected in enumerate(material_values):
-                if selected and i < len(MATERIAL_LABELS):
-                    uploaded_materials.append(MATERIAL_LABELS[i])
-        
-        # 프롬프트 생성
+        # 프롬프트 생성 (자동 맞춤 모드면 모델 예산에 맞게 자료를 제외)
         try:
-            prompt = generate_custom_prompt(
+            plan = plan_custom_prompt(
                 name=name,
                 organization=org,
                 position=position,
                 interview_date=normalized_date,
                 salary=salary,
                 career_year=career,
-                uploaded_materials_list=uploaded_materials,
+                uploaded_materials_list=selected_materials(material_values),
                 extra_instructions=etc_input or "",
+                budget=model_budget(model),
+                auto_trim=bool(auto_trim),
             )
-            return prompt, ""
         except Exception as e:
             return (
                 "",
                 f"❌ 프롬프트 생성 중 오류가 발생했습니다: {str(e)}",
             )
+        if plan["dropped_materials"]:
+            return plan["prompt"], f"⚠️ 토큰 예산에 맞추기 위해 제외한 자료: {', '.join(plan['dropped_materials'])}"
+        return plan["prompt"], ""
 
     @app.callback(
+        Output("prompt-token-budget", "children"),
+        [
+            Input({"type": "prompt-upload-material", "index": dash.ALL}, "value"),
+            Input("prompt-upload-materials-etc", "value"),
+            Input("prompt-candidate-name-input", "value"),
+            Input("prompt-candidate-org-input", "value"),
+            Input("prompt-candidate-position-input", "value"),
+            Input("prompt-candidate-date-input", "value"),
+            Input("prompt-candidate-salary-input", "value"),
+            Input("prompt-candidate-career-input", "value"),
+            Input("prompt-token-model", "value"),
+            Input("prompt-auto-trim", "value"),
+        ],
+    )
+    def update_token_budget(
+        material_values, etc_input, name, org, position, date, salary, career, model, auto_trim
+    ):
+        """
+        생성될 프롬프트의 토큰 사용량을 표시합니다.
+        글자 입력칸은 debounce=True이므로 키 입력마다가 아니라 입력을 마칠 때(Enter/포커스 이동) 호출됩니다.
+        """
+        from ..dash_prompt_generator import render_token_budget
+
+        plan = plan_custom_prompt(
+            name=name,
+            organization=org,
+            position=position,
+            interview_date=normalize_date(date),
+            salary=salary,
+            career_year=career,
+            uploaded_materials_list=selected_materials(material_values),
+            extra_instructions=etc_input or "",
+            budget=model_budget(model),
+            auto_trim=bool(auto_trim),
+        )
+        return render_token_budget(plan)
+
+    # 탭/아코디언 전환은 className과 열림 상태만 바꾸므로 브라우저에서 처리 (서버 왕복 없음)
+    app.clientside_callback(
+        """
+        function() {
+            // HR 프로필 탭 전환: 클릭한 탭만 활성화 (처음에는 personal 탭)
+            var tabs = ["personal", "career", "personality", "expertise", "weaknesses"];
+            var triggered = window.dash_clientside.callback_context.triggered;
+            var triggeredId = triggered.length ? triggered[0].prop_id.split(".")[0] : "";
+            var active = tabs.indexOf(triggeredId.replace("btn-", ""));
+            if (active < 0) {
+                active = 0;
+            }
+            var contentClasses = tabs.map(function(tab, i) {
+                return i === active ? "tab-content active" : "tab-content";
+            });
+            var buttonClasses = tabs.map(function(tab, i) {
+                return i === active ? "btn btn-primary active" : "btn btn-outline-primary";
+            });
+            return contentClasses.concat(buttonClasses);
+        }
+        """,
         [
             Output("content-personal", "className"),
             Output("content-career", "className"),
@@ -127,56 +200,23 @@ def register_prompt_callbacks(app):
             Input("btn-weaknesses", "n_clicks"),
         ],
     )
-    def update_hr_profile_tabs(
-        personal_clicks: int | None,
-        career_clicks: int | None,
-        personality_clicks: int | None,
-        expertise_clicks: int | None,
-        weaknesses_clicks: int | None,
-    ):
-        """HR 프로필 탭 전환을 처리합니다."""
-        ctx = dash.callback_context
-        if not ctx.triggered:
-            # 기본값: personal 탭 활성화
-            return (
-                "tab-content active",
-                "tab-content",
-                "tab-content",
-                "tab-content",
-                "tab-content",
-                "btn btn-primary active",
-                "btn btn-outline-primary",
-                "btn btn-outline-primary",
-                "btn btn-outline-primary",
-                "btn btn-outline-primary",
-            )
-
-        triggered_id = ctx.triggered[0]["prop_id"].split(".")[0]
-        
-        # 모든 탭을 비활성화 상태로 초기화
-        content_classes = ["tab-content"] * 5
-        btn_classes = ["btn btn-outline-primary"] * 5
-        
-        # 클릭된 탭만 활성화
-        if triggered_id == "btn-personal":
-            content_classes[0] = "tab-content active"
-            btn_classes[0] = "btn btn-primary active"
-        elif triggered_id == "btn-career":
-            content_classes[1] = "tab-content active"
-            btn_classes[1] = "btn btn-primary active"
-        elif triggered_id == "btn-personality":
-            content_classes[2] = "tab-content active"
-            btn_classes[2] = "btn btn-primary active"
-        elif triggered_id == "btn-expertise":
-            content_classes[3] = "tab-content active"
-            btn_classes[3] = "btn btn-primary active"
-        elif triggered_id == "btn-weaknesses":
-            content_classes[4] = "tab-content active"
-            btn_classes[4] = "btn btn-primary active"
-        
-        return (*content_classes, *btn_classes)
 
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(n_clicks, is_open, class_name) {
+            // 아코디언 토글: 열림 상태를 뒤집고 버튼의 collapsed 클래스를 맞춤
+            if (n_clicks === null || n_clicks === undefined) {
+                return [window.dash_clientside.no_update, window.dash_clientside.no_update];
+            }
+            var classes = (class_name || "").split(" ").filter(function(name) {
+                return name && name !== "collapsed";
+            });
+            if (is_open) {
+                classes.push("collapsed");
+            }
+            return [!is_open, classes.join(" ")];
+        }
+        """,
         [
             Output({"type": "collapse", "index": dash.MATCH}, "is_open"),
             Output({"type": "collapse-button", "index": dash.MATCH}, "className"),
@@ -188,23 +228,6 @@ def register_prompt_callbacks(app):
         ],
         prevent_initial_call=True,
     )
-    def toggle_accordion(n_clicks, is_open, class_name):
-        """아코디언 토글을 처리합니다."""
-        if n_clicks is None:
-            return dash.no_update, dash.no_update
-
-        new_is_open = not is_open
-        
-        # 버튼 클래스 업데이트
-        if new_is_open:
-            new_class = class_name.replace("collapsed", "").strip()
-        else:
-            if "collapsed" not in class_name:
-                new_class = f"{class_name} collapsed"
-            else:
-                new_class = class_name
-        
-        return new_is_open, new_class
 
     app.clientside_callback(
         """
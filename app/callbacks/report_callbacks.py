@@ -3,114 +3,98 @@
 import dash
 from dash import Output, Input, State, html
 import dash_bootstrap_components as dbc
-import pandas as pd
-import json
+import math
+from datetime import datetime
 
-from ..db import load_candidates, delete_candidate
-from ..ui_report import update_report_content
-from ..llm_report_parser import parse_llm_report
-
-
-def parse_row(row):
-    """테이블의 각 행을 파싱하여 동적 컬럼(json_data, evaluator)을 처리합니다."""
-    # json_data 파싱
-    try:
-        json_text = row['json_data']
-        json_data = (
-            json.loads(json_text)
-            if json_text and json_text != 'NULL' else {}
-        )
-    except (json.JSONDecodeError, TypeError):
-        json_data = {}
-
-    # 'info' 키 없이 직접 접근하도록 수정
-    row['organization'] = json_data.get('organization', '')
-    row['position'] = json_data.get('position', '')
-
-    # evaluator 파싱 - LLM 원문 텍스트를 파싱하여 평점과 추천 추출
-    try:
-        raw_llm_text = row['evaluator']
-        if raw_llm_text and raw_llm_text.strip():
-            parsed_result = parse_llm_report(raw_llm_text)
-            # 파싱 결과가 ReportData 객체인지 확인
-            if hasattr(parsed_result, 'comprehensive_report') and parsed_result.comprehensive_report:
-                row['overall_score'] = parsed_result.comprehensive_report.score
-                row['recommendation'] = parsed_result.comprehensive_report.recommendation
-            elif isinstance(parsed_result, dict):
-                # Dict 형태로 반환된 경우
-                comp_report = parsed_result.get('comprehensive_report', {})
-                if comp_report:
-                    row['overall_score'] = comp_report.get('score', 0)
-                    row['recommendation'] = comp_report.get('recommendation', 'N/A')
-                else:
-                    row['overall_score'] = 0
-                    row['recommendation'] = 'N/A'
-            else:
-                row['overall_score'] = 0
-                row['recommendation'] = 'N/A'
-        else:
-            row['overall_score'] = 0
-            row['recommendation'] = 'N/A'
-    except Exception:
-        # 파싱 실패 시 기본값 설정
-        row['overall_score'] = 0
-        row['recommendation'] = 'N/A'
-        
-    return row
+from ..db import delete_candidate, query_candidate_page
 
 
 def register_report_callbacks(app):
     """보고서 관련 콜백들을 앱에 등록합니다."""
     
     @app.callback(
-        Output("candidate-table", "data", allow_duplicate=True),
+        [
+            Output("candidate-query-store", "data"),
+            Output("candidate-table", "page_current", allow_duplicate=True),
+        ],
         [
             Input("filter-btn", "n_clicks"),
             Input("delete-btn", "n_clicks"),
             Input("save-signal-store", "data"),  # 저장 신호를 여기서 감지
+            Input("candidate-table", "filter_query"),
         ],
         [
             State("filter-name", "value"),
             State("filter-org", "value"),
             State("filter-pos", "value"),
+            State("filter-text", "value"),
             State("candidate-table", "selected_rows"),
             State("candidate-table", "data"),
+            State("candidate-query-store", "data"),
         ],
         prevent_initial_call=True
     )
-    def update_candidate_table(
-        filter_clicks, delete_clicks, save_signal, name, org, pos,
-        selected_rows, table_data
+    def update_candidate_query(
+        filter_clicks, delete_clicks, save_signal, filter_query, name, org, pos,
+        search, selected_rows, table_data, query
     ):
-        """후보자 목록 테이블을 필터링, 삭제, 갱신합니다."""
+        """조회 조건을 갱신(필터 적용, 삭제, 저장 신호)하고 첫 페이지로 이동합니다."""
         ctx = dash.callback_context
         if not ctx.triggered:
             raise dash.exceptions.PreventUpdate
-            
+
         triggered_id = ctx.triggered[0]["prop_id"].split(".")[0]
+        query = dict(query or {})
 
-        # 삭제 로직
+        # 삭제 로직 (selected_rows는 현재 페이지 기준 인덱스)
         if triggered_id == "delete-btn" and selected_rows and table_data:
-            selected_id = table_data[selected_rows[0]].get("id")
-            if selected_id:
-                delete_candidate(selected_id)
+            if selected_rows[0] < len(table_data):
+                selected_id = table_data[selected_rows[0]].get("id")
+                if selected_id:
+                    delete_candidate(selected_id)
 
-        # 데이터 로딩 및 파싱
-        df = load_candidates()
-        if not df.empty:
-            df = df.apply(parse_row, axis=1)
-            # 필터링 로직
-            if triggered_id == "filter-btn":
-                if name:
-                    df = df[df["name"].str.contains(name, case=False, na=False)]
-                if org:
-                    df = df[
-                        df["organization"].str.contains(org, case=False, na=False)
-                    ]
-                if pos:
-                    df = df[df["position"].str.contains(pos, case=False, na=False)]
+        if triggered_id == "filter-btn":
+            query.update({
+                "name": name or "",
+                "organization": org or "",
+                "position": pos or "",
+                "search": search or "",
+            })
+        query["filter_query"] = filter_query or ""
+        # 같은 조건이어도 목록을 다시 불러오도록 갱신 시각을 기록
+        query["refreshed_at"] = datetime.now().isoformat()
+        return query, 0
 
-        return df.to_dict("records")
+    @app.callback(
+        [
+            Output("candidate-table", "data", allow_duplicate=True),
+            Output("candidate-table", "page_count"),
+            Output("candidate-table", "selected_rows", allow_duplicate=True),
+        ],
+        [
+            Input("candidate-query-store", "data"),
+            Input("candidate-table", "page_current"),
+            Input("candidate-table", "page_size"),
+            Input("candidate-table", "sort_by"),
+        ],
+        prevent_initial_call=True
+    )
+    def update_candidate_table(query, page_current, page_size, sort_by):
+        """조회 조건에 맞는 현재 페이지의 행만 SQLite에서 불러옵니다."""
+        query = query or {}
+        page_size = page_size or 10
+        rows, total = query_candidate_page(
+            page_current=page_current or 0,
+            page_size=page_size,
+            sort_by=sort_by,
+            filter_query=query.get("filter_query"),
+            name=query.get("name"),
+            organization=query.get("organization"),
+            position=query.get("position"),
+            search=query.get("search"),
+        )
+        page_count = max(math.ceil(total / page_size), 1)
+        return rows, page_count, []
 
     @app.callback(
         Output("report-content-area", "children"),
@@ -152,6 +136,8 @@ def register_report_callbacks(app):
 
             # 보고서 생성 시도 - 안전한 방식으로
             try:
+                from ..ui_report import update_report_content
+
                 report_content = update_report_content(selected_candidate_id, report_type)
                 
                 # 보고서 생성 성공 시 반환
@@ -188,21 +174,22 @@ def register_report_callbacks(app):
             ], color="danger", className="mt-4")
 
     @app.callback(
-        Output("download-excel", "data"),
-        Input("export-btn", "n_clicks"),
-        State("candidate-table", "data"),
-        prevent_initial_call=True,
+        [
+            Output("export-xlsx-link", "href"),
+            Output("export-csv-link", "href"),
+            Output("export-parquet-link", "href"),
+        ],
+        Input("candidate-query-store", "data"),
     )
-    def download_excel(n_clicks, table_data):
-        """후보자 목록을 Excel 파일로 다운로드합니다."""
-        if n_clicks is None:
-            return dash.no_update
-        
-        if not table_data:
-            return dash.no_update
-            
-        df = pd.DataFrame(table_data)
-        return dash.dcc.send_data_frame(df.to_excel, "candidates.xlsx", index=False)
+    def update_export_links(query):
+        """
+        내보내기 링크에 현재 조회 조건을 담습니다.
+        파일은 서버 경로(/export/candidates.<형식>)가 SQLite에서 바로 스트리밍하므로
+        콜백 응답에 파일 내용이 실리지 않습니다.
+        """
+        from ..candidate_export import export_url
+
+        return export_url("xlsx", query), export_url("csv", query), export_url("parquet", query)
 
     @app.callback(
         Output("report-content-area", "children", allow_duplicate=True),
@@ -228,8 +215,32 @@ def register_report_callbacks(app):
         if not candidate_id:
             return dbc.Alert("선택된 후보자의 ID를 찾을 수 없습니다.", color="danger")
         
-        output_type = "PDF" if btn_id == "report-pdf-btn" else "PPT"
-        color = "primary" if btn_id == "report-pdf-btn" else "success"
+        if btn_id == "report-pdf-btn":
+            # PDF는 서버에서 reportlab으로 바로 생성 (같은 원문은 디스크 캐시에서 전송)
+            from ..pdf_report import PDF_REPORT_TYPES, pdf_url
+
+            return dbc.Alert([
+                html.H5("PDF 다운로드", className="alert-heading"),
+                html.P(f"{candidate_name} 후보자의 보고서를 PDF 파일로 내려받습니다."),
+                html.Div([
+                    dbc.Button(
+                        f"📄 {title}",
+                        href=pdf_url(candidate_id, report_type),
+                        external_link=True,
+                        target="_blank",
+                        color="primary",
+                        outline=True,
+                        size="sm",
+                        className="me-2 mb-2"
+                    )
+                    for report_type, title in PDF_REPORT_TYPES.items()
+                ])
+            ], color="primary", className="mt-3")
+
+        from ..static_report import print_url
+
+        output_type = "PPT"
+        color = "success"
         
         return dbc.Alert([
             html.H5(f"{output_type} 출력 준비 완료", className="alert-heading"),
@@ -238,8 +249,9 @@ def register_report_callbacks(app):
             html.Div([
                 dbc.Button(
                     f"📊 종합 대시보드 {output_type}",
-                    href=f"/print-report/{candidate_id}/comprehensive",
+                    href=print_url(candidate_id, "comprehensive"),
                     target="_blank",
+                    external_link=True,
                     color=color,
                     outline=True,
                     size="sm",
@@ -247,8 +259,9 @@ def register_report_callbacks(app):
                 ),
                 dbc.Button(
                     f"📈 임원용 보고서 {output_type}",
-                    href=f"/print-report/{candidate_id}/executive",
+                    href=print_url(candidate_id, "executive"),
                     target="_blank",
+                    external_link=True,
                     color=color,
                     outline=True,
                     size="sm",
@@ -256,8 +269,9 @@ def register_report_callbacks(app):
                 ),
                 dbc.Button(
                     f"👥 HR 보고서 {output_type}",
-                    href=f"/print-report/{candidate_id}/hr",
+                    href=print_url(candidate_id, "hr"),
                     target="_blank",
+                    external_link=True,
                     color=color,
                     outline=True,
                     size="sm",
@@ -1,9 +1,10 @@
 """페이지 라우팅 관련 콜백 함수들"""
 
-import dash
 from dash import Output, Input, html, Dash
 from typing import Any
 
+from ..layout_cache import static_layout
+
 
 def render_main_layout():
     """메인 애플리케이션 레이아웃을 렌더링합니다."""
@@ -106,6 +107,8 @@ def render_main_layout():
                 dcc.Tab(label="📋 프롬프트 생성", value="tab-prompt"),
                 dcc.Tab(label="📝 LLM 분석 결과 입력", value="tab-result"),
                 dcc.Tab(label="📊 면접자 조회", value="tab-report"),
+                dcc.Tab(label="👥 후보자 비교", value="tab-comparison"),
+                dcc.Tab(label="📈 인재풀 분석", value="tab-analytics"),
                 dcc.Tab(label="📖 가이드", value="tab-guide"),
             ],
             id="main-tabs",
@@ -129,91 +132,36 @@ def register_routing_callbacks(app: Dash):
         Output('page-content', 'children'),
         Input('url', 'pathname')
     )
-    def display_page(pathname: str) -> html.Div:
-        """URL 경로에 따라 페이지를 렌더링합니다."""
-        if pathname and pathname.startswith('/print-report/'):
-            try:
-                import urllib.parse
-                parts = pathname.split('/')
-                candidate_id = urllib.parse.unquote(parts[2])
-                report_type = parts[3]
-                
-                from ..components.print_optimized_reports import (
-                    render_print_optimized_report
-                )
-                from ..report_schema import ReportData
-                from ..utils import try_parse_json
-                from ..db import get_candidate_by_id
-                
-                candidate = get_candidate_by_id(candidate_id)
-                if not candidate:
-                    return html.Div(f"후보자를 찾을 수 없습니다. (ID: {candidate_id})")
-                
-                evaluator_data = candidate.get('evaluator', '{}')
-                json_data = try_parse_json(evaluator_data)
-                
-                if json_data is None:
-                    try:
-                        from ..llm_report_parser import parse_llm_report
-                        report_data = parse_llm_report(evaluator_data)
-                    except Exception as e:
-                        error_detail = (
-                            "분석 데이터를 읽을 수 없습니다. "
-                            f"Error: {e}, Data: {evaluator_data[:100]}..."
-                        )
-                        return html.Div(error_detail)
-                else:
-                    report_data = ReportData.model_validate(json_data)
-                
-                return render_print_optimized_report(report_data, report_type)
-                
-            except Exception as e:
-                import traceback
-                traceback.print_exc()
-                
-                cid = locals().get('candidate_id', 'N/A')
-                rtype = locals().get('report_type', 'N/A')
-                
-                return html.Div([
-                    html.H3("보고서 생성 중 오류가 발생했습니다"),
-                    html.P(f"오류 메시지: {str(e)}"),
-                    html.P(f"후보자 ID: {cid}"),
-                    html.P(f"보고서 타입: {rtype}")
-                ])
-        
-        else:
-            return render_main_layout()
+    def display_page(pathname: str) -> Any:
+        """URL 경로에 따라 페이지를 렌더링합니다. (프로세스마다 한 번 만든 레이아웃 재사용)"""
+        # /print-report/ 경로는 static_report가 Flask에서 정적 HTML로 응답함
+        return static_layout("main", render_main_layout)
 
     @app.callback(
-        Output("tab-content", "children"), 
-        [
-            Input("main-tabs", "value"),
-            Input("save-signal-store", "data")
-        ]
+        Output("tab-content", "children"),
+        Input("main-tabs", "value"),
     )
-    def render_tab(tab: str, save_signal: bool | None) -> html.Div:
-        """탭 전환 시 해당 탭의 내용을 렌더링합니다."""
+    def render_tab(tab: str) -> Any:
+        """
+        탭 전환 시 해당 탭의 레이아웃을 반환합니다. (프로세스마다 한 번 만든 레이아웃 재사용)
+        저장 신호(save-signal-store)는 각 탭의 목록/그래프 콜백이 직접 받아 갱신하므로
+        여기서 탭 전체를 다시 만들지 않습니다.
+        """
         from ..ui_llm_input import render_llm_input_tab
         from ..ui_report import render_report_tab
+        from ..ui_analytics import render_analytics_tab
+        from ..ui_comparison import render_comparison_tab
         from ..dash_prompt_guide import render_guide_tab
         from ..dash_prompt_generator import render_dash_prompt_generator
-        
-        ctx = dash.callback_context
-        if not ctx.triggered:
-            return render_report_tab()
-            
-        triggered_id = ctx.triggered[0]["prop_id"].split(".")[0]
-
-        if triggered_id == 'save-signal-store' and save_signal:
-            return render_report_tab()
 
-        if tab == "tab-prompt":
-            return render_dash_prompt_generator()
-        elif tab == "tab-result":
-            return render_llm_input_tab()
-        elif tab == "tab-report":
-            return render_report_tab()
-        elif tab == "tab-guide":
-            return render_guide_tab()
-        else:
-            return render_report_tab() 
\ No newline at end of file
+        builders = {
+            "tab-prompt": render_dash_prompt_generator,
+            "tab-result": render_llm_input_tab,
+            "tab-report": render_report_tab,
+            "tab-comparison": render_comparison_tab,
+            "tab-analytics": render_analytics_tab,
+            "tab-guide": render_guide_tab,
+        }
+        if tab not in builders:
+            tab = "tab-report"
+        return static_layout(tab, builders[tab])
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+후보자 목록 스트리밍 내보내기 (CSV / Excel / Parquet)
+- SQLite에서 일정 행 수씩 읽어 바로 기록하므로, 전체 보관 목록을 내보내도 메모리 사용량이 일정합니다.
+- Dash 서버(Flask)의 /export/candidates.<형식> 경로와 CLI export 명령이 함께 사용합니다.
+  조회 조건은 쿼리 파라미터로 전달합니다. (name, organization, position, filter_query, search)
+"""
+
+import csv
+import io
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from .db import CANDIDATE_EXPORT_COLUMNS, iter_candidate_rows
+
+EXPORT_URL_PREFIX = "/export/candidates"
+
+# 형식별 MIME 타입
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# 조회 조건 키 (candidate-query-store / 쿼리 파라미터 / load_candidates 인자 공통)
+FILTER_KEYS = ("name", "organization", "position", "filter_query", "search")
+
+# 임시 파일을 응답으로 흘려보낼 때의 읽기 단위
+_CHUNK_BYTES = 64 * 1024
+
+RowBatches = Iterator[List[Tuple[Any, ...]]]
+
+
+def export_filename(fmt: str) -> str:
+    return f"candidates_{datetime.now():%Y%m%d}.{fmt}"
+
+
+def export_url(fmt: str, query: Optional[Dict[str, Any]] = None) -> str:
+    """조회 조건(candidate-query-store 값)을 쿼리 파라미터로 담은 내보내기 URL을 만듭니다."""
+    params = {key: (query or {}).get(key) for key in FILTER_KEYS}
+    params = {key: value for key, value in params.items() if value}
+    url = f"{EXPORT_URL_PREFIX}.{fmt}"
+    return f"{url}?{urlencode(params)}" if params else url
+
+
+def iter_csv(batches: RowBatches) -> Iterator[bytes]:
+    """CSV를 행 묶음 단위로 인코딩하여 반환합니다. (Excel에서 한글이 깨지지 않도록 BOM 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CANDIDATE_EXPORT_COLUMNS)
+    first = True
+    for rows in batches:
+        writer.writerows(rows)
+        chunk = buffer.getvalue().encode("utf-8-sig" if first else "utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        first = False
+        yield chunk
+    if first:
+        yield buffer.getvalue().encode("utf-8-sig")
+
+
+def write_xlsx(batches: RowBatches, path: str) -> None:
+    """openpyxl write-only 모드로 기록합니다. (행을 바로 시트 XML로 내보내 셀 객체를 보관하지 않음)"""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("candidates")
+    sheet.append(CANDIDATE_EXPORT_COLUMNS)
+    for rows in batches:
+        for row in rows:
+            sheet.append(row)
+    workbook.save(path)
+
+
+def write_parquet(batches: RowBatches, path: str) -> None:
+    """행 묶음마다 row group 하나로 기록합니다. (결과가 없으면 스키마만 있는 파일)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        (column, pa.float64() if column == "overall_score" else pa.string())
+        for column in CANDIDATE_EXPORT_COLUMNS
+    ])
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        for rows in batches:
+            columns = list(zip(*rows))
+            writer.write_batch(pa.record_batch(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                schema=schema,
+            ))
+
+
+_FILE_WRITERS = {"xlsx": write_xlsx, "parquet": write_parquet}
+
+
+def write_export(fmt: str, path: str, filters: Optional[Dict[str, Any]] = None) -> int:
+    """조회 조건에 맞는 후보자 목록을 path에 fmt 형식으로 저장하고 행 수를 반환합니다."""
+    written = 0
+
+    def counted(batches: RowBatches) -> RowBatches:
+        nonlocal written
+        for rows in batches:
+            written += len(rows)
+            yield rows
+
+    batches = counted(iter_candidate_rows(**_filter_kwargs(filters)))
+    if fmt == "csv":
+        with open(path, "wb") as f:
+            for chunk in iter_csv(batches):
+                f.write(chunk)
+    else:
+        _FILE_WRITERS[fmt](batches, path)
+    return written
+
+
+def iter_export(fmt: str, filters: Optional[Dict[str, Any]] = None) -> Iterator[bytes]:
+    """
+    응답 본문으로 보낼 bytes 조각을 반환합니다.
+    xlsx/parquet은 파일 끝에 목차(zip 디렉터리/footer)가 있어 임시 파일에 먼저 기록한 뒤 나누어 읽습니다.
+    """
+    if fmt == "csv":
+        yield from iter_csv(iter_candidate_rows(**_filter_kwargs(filters)))
+        return
+
+    fd, path = tempfile.mkstemp(suffix=f".{fmt}")
+    os.close(fd)
+    try:
+        write_export(fmt, path, filters)
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(_CHUNK_BYTES)
+                if not chunk:
+                    break
+                yield chunk
+    finally:
+        os.remove(path)
+
+
+def _filter_kwargs(filters: Optional[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+    return {key: (filters or {}).get(key) or None for key in FILTER_KEYS}
+
+
+def register_export_routes(server) -> None:
+    """Dash 앱의 Flask 서버에 /export/candidates.<형식> 경로를 등록합니다."""
+    from flask import Response, abort, request
+
+    @server.route(f"{EXPORT_URL_PREFIX}.<fmt>")
+    def export_candidates(fmt: str):
+        if fmt not in EXPORT_FORMATS:
+            abort(404)
+        filters = {key: request.args.get(key) for key in FILTER_KEYS}
+        return Response(
+            iter_export(fmt, filters),
+            mimetype=EXPORT_FORMATS[fmt],
+            headers={
+                "Content-Disposition": f'attachment; filename="{export_filename(fmt)}"',
+                "Cache-Control": "no-store",
+            },
+        )
@@ -0,0 +1,500 @@
+# -*- coding: utf-8 -*-
+"""
+candidates.db 관리용 명령줄 도구
+
+사용 예:
+    python -m app.cli stats
+    python -m app.cli reparse --workers 4 --chunk-size 200
+    python -m app.cli reparse --only-failed
+    python -m app.cli reindex
+    python -m app.cli snapshot
+    python -m app.cli export --format xlsx --output candidates.xlsx --organization KCI
+    python -m app.cli import results/ extra.jsonl --workers 4
+    cat results.jsonl | python -m app.cli import -
+    python -m app.cli packet <id1> <id2> ... --types comprehensive hr --format pdf
+    python -m app.cli importtime --budget-ms 1200
+
+- reparse: 파서(llm_report_parser / utils_llm_parse)가 바뀐 뒤 저장된 LLM 원문 전체를
+  프로세스 풀에서 다시 파싱하고, 청크 단위 트랜잭션으로 report_json/종합점수/채용추천을 갱신합니다.
+- reindex: 전문 검색 색인(candidate_search)을 다시 만들고 통계(ANALYZE)를 갱신합니다.
+- snapshot: 후보자/분석 항목 컬럼형 스냅샷(app.analytics_snapshot)을 전체 다시 만듭니다.
+- stats: 행 수, 파싱 상태, 추천 분포, 색인/파일 크기를 출력합니다.
+- export: 조회 조건에 맞는 후보자 목록을 CSV/Excel/Parquet/JSON 파일로 저장합니다.
+- import: LLM 분석 결과 파일(디렉터리) 또는 JSONL 스트림을 일괄 저장합니다. (app.importer 참고)
+- packet: 여러 후보자의 보고서 PDF를 하나의 PDF 또는 zip으로 묶습니다. (app.pdf_packet 참고)
+- importtime: 웹 앱(app.app) 임포트 시간이 예산 안인지, 무거운 모듈이 기동 시 로드되지 않는지 확인합니다.
+  (gunicorn 워커 기동/재시작 시간 점검용, CI에서 실패 시 종료 코드 1)
+"""
+
+import argparse
+import functools
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from . import db
+from .serialization import dumps_bytes
+
+# (id, content_hash, raw_llm_text)
+ReparseRow = Tuple[str, Optional[str], Optional[str]]
+# (id, 기존 content_hash, 새 content_hash, report_json, overall_score, recommendation, 오류 메시지)
+ReparseResult = Tuple[
+    str, Optional[str], str, str, Optional[float], Optional[str], Optional[str]
+]
+
+# 웹 워커 기동(app.app 임포트) 시간 예산 (밀리초, -X importtime 누적 시간)
+IMPORT_TIME_BUDGET_MS = 1200
+# 기동 시 임포트되면 안 되는 무거운 모듈 (보고서/차트/분석 화면을 처음 쓸 때 로드)
+STARTUP_LAZY_MODULES = (
+    "pandas", "pyarrow", "numpy", "pydantic", "reportlab", "fitz",
+    "plotly.graph_objects", "app.report_schema", "app.ui_report", "app.analytics_snapshot",
+    "tiktoken",
+)
+
+
+def _configure_logging(verbose: bool) -> None:
+    """
+    파서 모듈의 행 단위 로그는 --verbose일 때만 출력합니다.
+    (행별 실패 원인은 reparse가 직접 출력하므로 기본값에서는 중복 출력하지 않음)
+    """
+    logging.getLogger("app").setLevel(logging.INFO if verbose else logging.CRITICAL)
+
+
+def _reparse_row(row: ReparseRow) -> ReparseResult:
+    """(프로세스 풀 작업자) LLM 원문 한 건을 파싱하여 저장할 값과 오류 메시지를 반환합니다."""
+    from .llm_report_parser import parse_llm_report
+    from .report_schema import ReportData
+
+    cid, row_hash, raw_llm_text = row
+    # 실패한 행은 report_json을 ''로 표시 (저장 시와 동일)
+    failed_hash = db.content_hash(raw_llm_text, "")
+    if not raw_llm_text or not raw_llm_text.strip():
+        return cid, row_hash, failed_hash, "", None, None, "LLM 원문이 비어 있습니다"
+    try:
+        parsed_result = parse_llm_report(raw_llm_text)
+    except Exception as e:
+        return cid, row_hash, failed_hash, "", None, None, f"{type(e).__name__}: {e}"
+    if not isinstance(parsed_result, ReportData):
+        error = parsed_result.get("error") if isinstance(parsed_result, dict) else None
+        return (
+            cid, row_hash, failed_hash, "", None, None,
+            error or "보고서 형식으로 변환할 수 없습니다",
+        )
+    report = parsed_result.comprehensive_report
+    report_json = parsed_result.model_dump_json()
+    return (
+        cid, row_hash, db.content_hash(raw_llm_text, report_json), report_json,
+        report.score, report.recommendation, None,
+    )
+
+
+def _iter_reparse_chunks(
+    chunk_size: int, only_failed: bool, ids: Optional[Sequence[str]]
+) -> Iterator[List[ReparseRow]]:
+    """rowid 기준 키셋 페이지네이션으로 원문을 chunk_size 행씩 읽습니다."""
+    conditions = ["rowid > ?"]
+    extra_params: List[str] = []
+    if only_failed:
+        conditions.append("(report_json IS NULL OR report_json = '')")
+    if ids:
+        conditions.append(f"id IN ({', '.join('?' * len(ids))})")
+        extra_params.extend(ids)
+    sql = (
+        "SELECT rowid, id, content_hash, raw_llm_text FROM candidate_analysis "
+        f"WHERE {' AND '.join(conditions)} ORDER BY rowid LIMIT ?"
+    )
+    last_rowid = 0
+    while True:
+        with db.db_session() as conn:
+            rows = conn.execute(sql, [last_rowid, *extra_params, chunk_size]).fetchall()
+        if not rows:
+            return
+        last_rowid = rows[-1][0]
+        yield [(cid, row_hash, raw) for _, cid, row_hash, raw in rows]
+
+
+def _count_reparse_rows(only_failed: bool, ids: Optional[Sequence[str]]) -> int:
+    conditions = ["1 = 1"]
+    params: List[str] = []
+    if only_failed:
+        conditions.append("(report_json IS NULL OR report_json = '')")
+    if ids:
+        conditions.append(f"id IN ({', '.join('?' * len(ids))})")
+        params.extend(ids)
+    with db.db_session() as conn:
+        return conn.execute(
+            f"SELECT COUNT(*) FROM candidate_analysis WHERE {' AND '.join(conditions)}", params
+        ).fetchone()[0]
+
+
+def _write_reparse_results(results: List[ReparseResult]) -> int:
+    """
+    한 청크의 결과를 하나의 트랜잭션으로 저장합니다.
+    content_hash도 새 report_json 기준으로 바꾸므로 보고서/렌더 캐시(실행 중인 서버 포함)는
+    다음 조회 때 새 보고서를 읽습니다. 파싱하는 동안 원문이 바뀐 행(content_hash 불일치)은
+    덮어쓰지 않으며, 반영된 행 수를 반환합니다.
+    """
+    with db.db_session() as conn:
+        cursor = conn.executemany(
+            "UPDATE candidate_analysis SET report_json = ?, overall_score = ?, "
+            "recommendation = ?, content_hash = ? WHERE id = ? AND content_hash IS ?",
+            [
+                (report_json, score, recommendation, new_hash, cid, row_hash)
+                for cid, row_hash, new_hash, report_json, score, recommendation, _ in results
+            ],
+        )
+        return cursor.rowcount
+
+
+def _remove_stale_files(results: List[ReparseResult]) -> int:
+    """보고서가 바뀐 행의 이전 content_hash로 만든 PDF/인쇄 HTML 캐시 파일을 지웁니다."""
+    from .pdf_report import pdf_cache_dir, remove_cached_files
+    from .static_report import print_cache_dir
+
+    stale = [row_hash for _, row_hash, new_hash, *_ in results if row_hash and row_hash != new_hash]
+    return remove_cached_files(pdf_cache_dir(), stale) + remove_cached_files(print_cache_dir(), stale)
+
+
+def cmd_reparse(args: argparse.Namespace) -> int:
+    total = _count_reparse_rows(args.only_failed, args.ids)
+    workers = max(args.workers or os.cpu_count() or 1, 1)
+    print(f"[reparse] 대상 {total}건, 작업자 {workers}개, 청크 {args.chunk_size}행")
+    if total == 0:
+        return 0
+
+    started = time.perf_counter()
+    done = failed = written = removed = 0
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_configure_logging, initargs=(args.verbose,)
+        )
+    try:
+        for chunk in _iter_reparse_chunks(args.chunk_size, args.only_failed, args.ids):
+            if executor is not None:
+                map_chunksize = max(len(chunk) // (workers * 4), 1)
+                results = list(executor.map(_reparse_row, chunk, chunksize=map_chunksize))
+            else:
+                results = [_reparse_row(row) for row in chunk]
+
+            for cid, *_, error in results:
+                if error:
+                    failed += 1
+                    print(f"[reparse] 실패 {cid}: {error}")
+            written += _write_reparse_results(results)
+            removed += _remove_stale_files(results)
+            done += len(results)
+            elapsed = time.perf_counter() - started
+            print(
+                f"[reparse] {done}/{total} ({done * 100 // total}%) "
+                f"실패 {failed}건, {elapsed:.1f}초 경과"
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    skipped = done - written
+    if written:
+        # report_json이 바뀌었으므로 분석 스냅샷도 다시 만듦
+        from .analytics_snapshot import rebuild_snapshot
+
+        rebuild_snapshot()
+    print(
+        f"[reparse] 완료: 성공 {done - failed}건, 실패 {failed}건"
+        + (f", 처리 중 변경되어 건너뜀 {skipped}건" if skipped else "")
+        + (f", 이전 PDF/인쇄 캐시 {removed}개 삭제" if removed else "")
+        + f" ({time.perf_counter() - started:.1f}초)"
+    )
+    return 1 if failed else 0
+
+
+def cmd_reindex(args: argparse.Namespace) -> int:
+    from .db_migrations import rebuild_search_index
+
+    started = time.perf_counter()
+    with db.db_session() as conn:
+        indexed = rebuild_search_index(conn)
+        conn.execute("ANALYZE")
+    if indexed == 0:
+        print("[reindex] 전문 검색 색인이 없거나 비어 있습니다. (FTS5 미지원 SQLite일 수 있음)")
+    print(f"[reindex] {indexed}건 색인, 통계 갱신 완료 ({time.perf_counter() - started:.1f}초)")
+    return 0
+
+
+def cmd_snapshot(args: argparse.Namespace) -> int:
+    from .analytics_snapshot import rebuild_snapshot, snapshot_dir
+
+    started = time.perf_counter()
+    total = rebuild_snapshot()
+    print(
+        f"[snapshot] 후보자 {total}명 -> {snapshot_dir()} "
+        f"({time.perf_counter() - started:.1f}초)"
+    )
+    return 0
+
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    from .db_migrations import get_schema_version
+
+    with db.db_session() as conn:
+        version = get_schema_version(conn)
+        total, parsed, failed, pending, avg_score = conn.execute(
+            "SELECT COUNT(*), "
+            "SUM(report_json IS NOT NULL AND report_json != ''), "
+            "SUM(report_json = ''), "
+            "SUM(report_json IS NULL), "
+            "AVG(overall_score) "
+            "FROM candidate_analysis"
+        ).fetchone()
+        recommendations = conn.execute(
+            "SELECT COALESCE(recommendation, 'N/A'), COUNT(*) FROM candidate_analysis "
+            "GROUP BY 1 ORDER BY 2 DESC"
+        ).fetchall()
+        has_index = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'candidate_search'"
+        ).fetchone()
+        indexed = (
+            conn.execute("SELECT COUNT(*) FROM candidate_search").fetchone()[0]
+            if has_index else None
+        )
+
+    size_bytes = sum(
+        os.path.getsize(db.DB_PATH + suffix)
+        for suffix in ("", "-wal")
+        if os.path.exists(db.DB_PATH + suffix)
+    )
+    print(f"DB 파일      : {db.DB_PATH} ({size_bytes / 1024 / 1024:.1f} MB)")
+    print(f"스키마 버전  : v{version}")
+    print(f"전체 후보자  : {total}건")
+    print(f"  보고서 변환: {parsed or 0}건")
+    print(f"  변환 실패  : {failed or 0}건")
+    print(f"  미처리     : {pending or 0}건")
+    print(f"평균 종합점수: {avg_score:.1f}" if avg_score is not None else "평균 종합점수: -")
+    print("채용추천 분포:")
+    for recommendation, count in recommendations:
+        print(f"  {recommendation}: {count}건")
+    print(f"검색 색인    : {indexed}건" if indexed is not None else "검색 색인    : 없음")
+    return 0
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    filters = {
+        "name": args.name,
+        "organization": args.organization,
+        "position": args.position,
+        "search": args.search,
+    }
+    output = args.output or f"candidates_{datetime.now():%Y%m%d}.{args.format}"
+    if args.format == "json":
+        df = db.load_candidates(**filters)
+        with open(output, "wb") as f:
+            f.write(dumps_bytes(df.to_dict(orient="records"), indent=True))
+        print(f"[export] {len(df)}건 -> {output}")
+        return 0
+
+    from .candidate_export import write_export
+
+    # CSV/Excel/Parquet은 행 묶음 단위로 기록 (전체 목록을 메모리에 올리지 않음)
+    started = time.perf_counter()
+    written = write_export(args.format, output, filters)
+    print(f"[export] {written}건 -> {output} ({time.perf_counter() - started:.1f}초)")
+    return 0
+
+
+def cmd_import(args: argparse.Namespace) -> int:
+    from .importer import format_import_summary, import_records, iter_jsonl, iter_paths
+
+    paths = [path for path in args.paths if path != "-"]
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        print(f"[import] 경로를 찾을 수 없습니다: {', '.join(missing)}")
+        return 2
+
+    def records():
+        yield from iter_paths(paths)
+        if "-" in args.paths:
+            yield from iter_jsonl(sys.stdin, source="stdin")
+
+    def progress(done: int, passed: int, rejected: int) -> None:
+        print(f"[import] {done}건 처리 (통과 {passed}건, 거부 {rejected}건)")
+
+    workers = max(args.workers or os.cpu_count() or 1, 1)
+    summary = import_records(
+        records(), workers=workers, chunk_size=args.chunk_size, progress=progress,
+        initializer=functools.partial(_configure_logging, args.verbose),
+    )
+    for source, reason in summary["rejected"]:
+        print(f"[import] 거부 {source}: {reason}")
+    print(f"[import] 완료: {format_import_summary(summary)}")
+    return 1 if summary["rejected"] else 0
+
+
+def cmd_packet(args: argparse.Namespace) -> int:
+    from .pdf_packet import build_packet, format_packet_summary
+
+    output = args.output or f"interview_reports_{datetime.now():%Y%m%d}.{args.format}"
+    workers = max(args.workers or os.cpu_count() or 1, 1)
+
+    def progress(done: int, total: int) -> None:
+        print(f"[packet] {done}/{total}")
+
+    summary = build_packet(
+        args.ids, args.types, output, fmt=args.format, workers=workers, progress=progress
+    )
+    for cid, report_type, reason in summary["failed"]:
+        print(f"[packet] 실패 {cid} ({report_type}): {reason}")
+    if not summary["documents"]:
+        print("[packet] 만들 수 있는 문서가 없습니다.")
+        return 1
+    print(f"[packet] 완료: {format_packet_summary(summary)} -> {output}")
+    return 1 if summary["failed"] else 0
+
+
+# (모듈 이름, 자체 시간 us, 누적 시간 us)
+ImportTimeEntry = Tuple[str, int, int]
+
+
+def measure_import_time(module: str = "app.app") -> List[ImportTimeEntry]:
+    """
+    새 인터프리터에서 `python -X importtime -c "import <모듈>"`을 실행해 모듈별 임포트 시간을 반환합니다.
+    임포트가 실패하면 RuntimeError (stderr 마지막 부분 포함)
+    """
+    import subprocess
+
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [root_dir, os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=root_dir, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} 임포트 실패\n{result.stderr[-2000:]}")
+
+    # "import time: self [us] | cumulative | imported package"
+    entries: List[ImportTimeEntry] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def cumulative_import_ms(entries: Sequence[ImportTimeEntry], module: str) -> float:
+    """measure_import_time 결과에서 module의 누적 임포트 시간 (밀리초)"""
+    return next(cumulative for name, _, cumulative in entries if name == module) / 1000
+
+
+def eager_lazy_modules(entries: Sequence[ImportTimeEntry]) -> List[str]:
+    """STARTUP_LAZY_MODULES 중 함께 임포트된 모듈"""
+    imported = {name for name, _, _ in entries}
+    return [module for module in STARTUP_LAZY_MODULES if module in imported]
+
+
+def cmd_importtime(args: argparse.Namespace) -> int:
+    """
+    measure_import_time으로 누적 임포트 시간과 지연 로드 대상 모듈이 딸려 오는지 확인합니다.
+    (예산 초과 시 1 반환, 같은 검사를 tests/test_import_time.py도 수행)
+    """
+    try:
+        entries = measure_import_time(args.module)
+    except RuntimeError as e:
+        print(e)
+        print(f"[importtime] {args.module} 임포트 실패")
+        return 1
+    total_ms = cumulative_import_ms(entries, args.module)
+
+    print(f"[importtime] {args.module}: {total_ms:.0f}ms (예산 {args.budget_ms}ms), 모듈 {len(entries)}개")
+    for name, self_us, cumulative_us in sorted(entries, key=lambda e: e[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f}ms  (누적 {cumulative_us / 1000:8.1f}ms)  {name}")
+
+    eager = eager_lazy_modules(entries)
+    if eager:
+        print(f"[importtime] 기동 시 로드되면 안 되는 모듈: {', '.join(eager)}")
+    if total_ms > args.budget_ms:
+        print(f"[importtime] 예산 초과: {total_ms:.0f}ms > {args.budget_ms}ms")
+    return 1 if eager or total_ms > args.budget_ms else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli", description="candidates.db 관리 도구"
+    )
+    parser.add_argument("--db", help=f"DB 파일 경로 (기본값: {db.DB_PATH})")
+    parser.add_argument("-v", "--verbose", action="store_true", help="파서 상세 로그 출력")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    reparse = subparsers.add_parser("reparse", help="저장된 LLM 원문 전체를 다시 파싱")
+    reparse.add_argument("--workers", type=int, default=None,
+                         help="프로세스 수 (기본값: CPU 수, 1이면 현재 프로세스에서 실행)")
+    reparse.add_argument("--chunk-size", type=int, default=200,
+                         help="한 번에 읽고 한 트랜잭션으로 저장할 행 수 (기본값: 200)")
+    reparse.add_argument("--only-failed", action="store_true",
+                         help="보고서 변환에 실패했거나 아직 처리되지 않은 행만 다시 파싱")
+    reparse.add_argument("--ids", nargs="+", help="특정 후보자 id만 다시 파싱")
+    reparse.set_defaults(func=cmd_reparse)
+
+    reindex = subparsers.add_parser("reindex", help="전문 검색 색인 재생성")
+    reindex.set_defaults(func=cmd_reindex)
+
+    snapshot = subparsers.add_parser("snapshot", help="분석 스냅샷(Arrow) 재생성")
+    snapshot.set_defaults(func=cmd_snapshot)
+
+    stats = subparsers.add_parser("stats", help="DB 현황 출력")
+    stats.set_defaults(func=cmd_stats)
+
+    export = subparsers.add_parser("export", help="후보자 목록 파일로 내보내기")
+    export.add_argument("--format", choices=["csv", "xlsx", "parquet", "json"], default="csv")
+    export.add_argument("--output", help="저장 경로 (기본값: candidates_YYYYMMDD.<형식>)")
+    export.add_argument("--name", help="이름 검색어")
+    export.add_argument("--organization", help="지원조직 검색어")
+    export.add_argument("--position", help="지원직급 검색어")
+    export.add_argument("--search", help="보고서 내용 검색어")
+    export.set_defaults(func=cmd_export)
+
+    import_ = subparsers.add_parser("import", help="LLM 분석 결과 파일/JSONL 일괄 저장")
+    import_.add_argument("paths", nargs="+",
+                         help="파일 또는 디렉터리 경로 (.txt/.md/.json/.jsonl), '-'는 표준입력 JSONL")
+    import_.add_argument("--workers", type=int, default=None,
+                         help="프로세스 수 (기본값: CPU 수, 1이면 현재 프로세스에서 실행)")
+    import_.add_argument("--chunk-size", type=int, default=200,
+                         help="한 번에 작업자에게 나눠 줄 레코드 수 (기본값: 200)")
+    import_.set_defaults(func=cmd_import)
+
+    packet = subparsers.add_parser("packet", help="여러 후보자 보고서 PDF 묶음 만들기")
+    packet.add_argument("ids", nargs="+", help="후보자 id (입력 순서대로 묶음)")
+    packet.add_argument("--types", nargs="+", choices=["comprehensive", "executive", "hr"],
+                        default=["comprehensive"], help="보고서 유형 (기본값: comprehensive)")
+    packet.add_argument("--format", choices=["pdf", "zip"], default="pdf",
+                        help="하나로 합친 PDF 또는 문서별 PDF zip (기본값: pdf)")
+    packet.add_argument("--output", help="저장 경로 (기본값: interview_reports_YYYYMMDD.<형식>)")
+    packet.add_argument("--workers", type=int, default=None,
+                        help="프로세스 수 (기본값: CPU 수, 1이면 현재 프로세스에서 실행)")
+    packet.set_defaults(func=cmd_packet)
+
+    importtime = subparsers.add_parser("importtime", help="웹 앱 기동 임포트 시간 예산 확인")
+    importtime.add_argument("--module", default="app.app", help="측정할 모듈 (기본값: app.app)")
+    importtime.add_argument("--budget-ms", type=int, default=IMPORT_TIME_BUDGET_MS,
+                            help=f"누적 임포트 시간 예산 (기본값: {IMPORT_TIME_BUDGET_MS}ms)")
+    importtime.add_argument("--top", type=int, default=15, help="자체 시간이 긴 모듈 출력 개수")
+    importtime.set_defaults(func=cmd_importtime)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    _configure_logging(args.verbose)
+    if args.db:
+        db.DB_PATH = os.path.abspath(args.db)
+    try:
+        return args.func(args)
+    finally:
+        db.close_db_pool()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+동일 코호트(지원조직 + 지원직급) 내 백분위 색인
+- 코호트별로 종합점수와 5대 차원 평균을 정렬된 리스트로 보관하고, 백분위는 bisect로 O(log n)에 구합니다.
+- 처음 조회할 때 분석 스냅샷(analytics_snapshot)에서 한 번 만들고,
+  이후 저장/삭제 시에는 바뀐 후보자만 빼고 다시 넣습니다. (db._refresh_analytics_snapshot)
+- 다른 프로세스(gunicorn 워커, CLI)가 스냅샷을 고쳤으면 다음 조회 때 스냅샷에서 다시 만듭니다.
+"""
+
+import os
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, TypedDict
+
+import pyarrow as pa
+
+from .analytics_snapshot import DIMENSION_COLUMNS, SNAPSHOT_FILES, load_snapshot, snapshot_dir
+from .dimension_scores import DIMENSIONS
+
+# 백분위를 보여줄 최소 코호트 인원 (본인 포함)
+MIN_COHORT_SIZE = 3
+
+# 지표 순서: 종합점수 + 5대 차원
+METRICS = ("overall", *DIMENSIONS)
+_METRIC_COLUMNS = ("overall_score", *DIMENSION_COLUMNS)
+
+Cohort = Tuple[str, str]
+Scores = Tuple[Optional[float], ...]
+
+
+class CohortPercentiles(TypedDict):
+    organization: str
+    position: str
+    cohort_size: int
+    overall: Optional[float]          # 코호트 내 종합점수 백분위 (0~100, 인원 부족 시 None)
+    dimensions: Dict[str, float]      # 차원별 백분위 (항목이 없는 차원은 제외)
+
+
+def percentile_rank(sorted_scores: Sequence[float], value: float) -> float:
+    """정렬된 점수 목록에서 value의 백분위 (같은 점수는 절반만 아래로 셈, 0~100)"""
+    below = bisect_left(sorted_scores, value)
+    equal = bisect_right(sorted_scores, value, lo=below) - below
+    return (below + equal / 2) / len(sorted_scores) * 100
+
+
+class CohortIndex:
+    """코호트별 정렬 점수 색인 (스레드 안전)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._scores: Dict[Cohort, Dict[str, List[float]]] = {}
+        self._sizes: Dict[Cohort, int] = {}
+        self._members: Dict[str, Tuple[Cohort, Scores]] = {}
+        # 마지막으로 반영한 스냅샷 파일 수정 시각 (None이면 아직 만들지 않음)
+        self._snapshot_mtime: Optional[int] = None
+
+    # ---- 내부 갱신 (잠금 안에서 호출) ----
+
+    def _insert(self, candidate_id: str, cohort: Cohort, scores: Scores) -> None:
+        self._remove(candidate_id)
+        lists = self._scores.setdefault(cohort, {metric: [] for metric in METRICS})
+        for metric, value in zip(METRICS, scores):
+            if value is not None:
+                insort(lists[metric], value)
+        self._sizes[cohort] = self._sizes.get(cohort, 0) + 1
+        self._members[candidate_id] = (cohort, scores)
+
+    def _remove(self, candidate_id: str) -> None:
+        entry = self._members.pop(candidate_id, None)
+        if entry is None:
+            return
+        cohort, scores = entry
+        lists = self._scores[cohort]
+        for metric, value in zip(METRICS, scores):
+            if value is not None:
+                del lists[metric][bisect_left(lists[metric], value)]
+        self._sizes[cohort] -= 1
+        if self._sizes[cohort] == 0:
+            del self._sizes[cohort]
+            del self._scores[cohort]
+
+    def _rows(self, table: pa.Table) -> Iterable[Tuple[str, Cohort, Scores]]:
+        """스냅샷 후보자 테이블에서 (id, 코호트, 점수)를 꺼냅니다. 보고서가 없는 행은 제외합니다."""
+        columns = [table[name].to_pylist() for name in ("id", "organization", "position")]
+        metrics = [table[name].to_pylist() for name in _METRIC_COLUMNS]
+        for i, (cid, organization, position) in enumerate(zip(*columns)):
+            scores = tuple(values[i] for values in metrics)
+            if all(value is None for value in scores[1:]):
+                continue
+            yield cid, (organization or "", position or ""), scores
+
+    def _rebuild(self) -> None:
+        table = load_snapshot("candidates")
+        scores: Dict[Cohort, Dict[str, List[float]]] = {}
+        sizes: Dict[Cohort, int] = {}
+        members: Dict[str, Tuple[Cohort, Scores]] = {}
+        for cid, cohort, values in self._rows(table):
+            lists = scores.setdefault(cohort, {metric: [] for metric in METRICS})
+            for metric, value in zip(METRICS, values):
+                if value is not None:
+                    lists[metric].append(value)
+            sizes[cohort] = sizes.get(cohort, 0) + 1
+            members[cid] = (cohort, values)
+        for lists in scores.values():
+            for values in lists.values():
+                values.sort()
+        self._scores, self._sizes, self._members = scores, sizes, members
+        self._snapshot_mtime = _snapshot_mtime()
+
+    def _ensure_current(self) -> None:
+        if self._snapshot_mtime is None or self._snapshot_mtime != _snapshot_mtime():
+            self._rebuild()
+
+    # ---- 공개 API ----
+
+    def apply(self, candidate_ids: Iterable[str], batches: Iterable[pa.RecordBatch]) -> None:
+        """
+        저장/삭제된 후보자를 반영합니다. batches는 DB에서 다시 읽은 후보자 행(삭제된 id는 없음)입니다.
+        아직 색인을 만들지 않았다면 처음 조회할 때 스냅샷에서 만들므로 아무것도 하지 않습니다.
+        """
+        with self._lock:
+            if self._snapshot_mtime is None:
+                return
+            for cid in candidate_ids:
+                self._remove(cid)
+            for batch in batches:
+                for cid, cohort, scores in self._rows(pa.Table.from_batches([batch])):
+                    self._insert(cid, cohort, scores)
+            self._snapshot_mtime = _snapshot_mtime()
+
+    def percentiles(self, candidate_id: str) -> Optional[CohortPercentiles]:
+        """후보자의 코호트 내 백분위를 반환합니다. 색인에 없는 후보자(보고서 없음)는 None"""
+        with self._lock:
+            self._ensure_current()
+            entry = self._members.get(candidate_id)
+            if entry is None:
+                return None
+            cohort, scores = entry
+            size = self._sizes[cohort]
+            result: CohortPercentiles = {
+                "organization": cohort[0],
+                "position": cohort[1],
+                "cohort_size": size,
+                "overall": None,
+                "dimensions": {},
+            }
+            if size < MIN_COHORT_SIZE:
+                return result
+            lists = self._scores[cohort]
+            if scores[0] is not None:
+                result["overall"] = percentile_rank(lists["overall"], scores[0])
+            for metric, value in zip(METRICS[1:], scores[1:]):
+                if value is not None:
+                    result["dimensions"][metric] = percentile_rank(lists[metric], value)
+            return result
+
+    def invalidate(self) -> None:
+        """다음 조회 때 스냅샷에서 다시 만들도록 비웁니다. (DB 파일 교체 등)"""
+        with self._lock:
+            self._scores, self._sizes, self._members = {}, {}, {}
+            self._snapshot_mtime = None
+
+
+def _snapshot_mtime() -> Optional[int]:
+    try:
+        return os.stat(os.path.join(snapshot_dir(), SNAPSHOT_FILES["candidates"])).st_mtime_ns
+    except OSError:
+        return None
+
+
+def percentile_fingerprint(percentiles: Optional[CohortPercentiles]) -> str:
+    """렌더링 캐시 키에 넣을 값 (화면에 보이는 반올림 값이 같으면 같은 문자열)"""
+    if not percentiles:
+        return ""
+    values: List[Any] = [percentiles["cohort_size"], percentiles["overall"]]
+    values += [percentiles["dimensions"].get(dimension) for dimension in DIMENSIONS]
+    return ",".join("-" if v is None else f"{v:.0f}" for v in values)
+
+
+cohort_index = CohortIndex()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+후보자 비교 데이터
+- 선택한 후보자들의 5대 차원 평균, 항목별 점수, 강점/리스크 제목을 분석 스냅샷에서 가져옵니다.
+- 비교 버튼을 누를 때 후보자별 원문이나 report_json을 다시 읽지 않습니다.
+"""
+
+from typing import Dict, List, Sequence, TypedDict
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .analytics_snapshot import DIMENSION_COLUMNS, load_snapshot
+from .dimension_scores import DIMENSIONS
+
+# 비교 가능한 인원 (위원회 최종 후보 비교 기준)
+MIN_COMPARE_CANDIDATES = 2
+MAX_COMPARE_CANDIDATES = 8
+
+# 후보자 선택 드롭다운에 한 번에 보여줄 검색 결과 수
+OPTION_LIMIT = 30
+
+_CANDIDATE_COLUMNS = (
+    "id", "name", "organization", "position", "overall_score",
+    "weighted_score", "recommendation", "strengths", "risks", *DIMENSION_COLUMNS,
+)
+
+
+class CandidateComparison(TypedDict):
+    labels: Dict[str, str]              # 후보자 id -> 표시명 (선택 순서 유지)
+    candidates: pd.DataFrame            # 후보자 id 인덱스, 목록 컬럼 + 차원 평균
+    dimension_scores: pd.DataFrame      # 후보자 id × 5대 차원 평균 (항목 없는 차원은 NaN)
+    item_scores: pd.DataFrame           # (차원, 항목 제목) × 후보자 id 점수 (없는 항목은 NaN)
+    strengths: Dict[str, List[str]]     # 후보자 id -> 강점 제목
+    risks: Dict[str, List[str]]         # 후보자 id -> 리스크 제목
+
+
+def _display_labels(candidates: pd.DataFrame) -> Dict[str, str]:
+    """이름이 겹치면 지원조직을 덧붙이고, 그래도 겹치면 순번을 붙여 구분합니다."""
+    names = [name or "(이름 없음)" for name in candidates["name"]]
+    labels: Dict[str, str] = {}
+    seen: Dict[str, int] = {}
+    for cid, name, organization in zip(candidates.index, names, candidates["organization"]):
+        label = f"{name} ({organization or '-'})" if names.count(name) > 1 else name
+        seen[label] = seen.get(label, 0) + 1
+        labels[cid] = label if seen[label] == 1 else f"{label} #{seen[label]}"
+    return labels
+
+
+def load_comparison(candidate_ids: Sequence[str]) -> CandidateComparison:
+    """
+    후보자 id 목록(선택 순서)의 비교 데이터를 만듭니다.
+    스냅샷에 없는 id(삭제됨)와 보고서로 변환되지 않은 후보자는 제외합니다.
+    """
+    ids = list(dict.fromkeys(candidate_ids))
+    id_set = pa.array(ids, type=pa.string())
+
+    table = load_snapshot("candidates").select(list(_CANDIDATE_COLUMNS))
+    table = table.filter(pc.is_in(table["id"], value_set=id_set))
+    candidates = table.to_pandas().set_index("id")
+    candidates = candidates[candidates[list(DIMENSION_COLUMNS)].notna().any(axis=1)]
+    candidates = candidates.reindex([cid for cid in ids if cid in candidates.index])
+
+    dimension_scores = candidates[list(DIMENSION_COLUMNS)].set_axis(list(DIMENSIONS), axis=1)
+
+    items = load_snapshot("items")
+    items = items.filter(
+        pc.is_in(items["candidate_id"], value_set=pa.array(list(candidates.index), type=pa.string()))
+    ).to_pandas()
+    # 행: 차원 순서 → 처음 나온 순서, 열: 선택 순서
+    items["category"] = pd.Categorical(items["category"], categories=list(DIMENSIONS))
+    item_scores = (
+        items.groupby(["category", "title", "candidate_id"], observed=True, sort=False)["score"]
+        .mean()
+        .unstack("candidate_id")
+        .sort_index(level="category", sort_remaining=False)
+        .reindex(columns=list(candidates.index))
+    )
+
+    return {
+        "labels": _display_labels(candidates),
+        "candidates": candidates,
+        "dimension_scores": dimension_scores,
+        "item_scores": item_scores,
+        "strengths": {cid: list(values) for cid, values in candidates["strengths"].items()},
+        "risks": {cid: list(values) for cid, values in candidates["risks"].items()},
+    }
+
+
+def _option_label(name: str, organization: str, position: str) -> str:
+    return f"{name or '(이름 없음)'} · {organization or '-'} · {position or '-'}"
+
+
+def search_candidate_options(query: str, selected_ids: Sequence[str]) -> List[Dict[str, str]]:
+    """
+    비교 대상 선택 드롭다운 옵션. 이름/지원조직/지원직급에 query가 들어간 후보자를
+    OPTION_LIMIT명까지 돌려주며, 이미 선택한 후보자는 항상 포함합니다.
+    (전체 후보자를 브라우저로 보내지 않기 위해 입력할 때마다 서버에서 검색)
+    """
+    table = load_snapshot("candidates").select(["id", "name", "organization", "position", "item_count"])
+    table = table.filter(pc.greater(table["item_count"], 0))
+    selected = pc.is_in(table["id"], value_set=pa.array(list(selected_ids), type=pa.string()))
+    matched = pc.invert(selected)
+    if query:
+        found = pc.or_(
+            pc.or_(
+                pc.match_substring(table["name"], query, ignore_case=True),
+                pc.match_substring(table["organization"], query, ignore_case=True),
+            ),
+            pc.match_substring(table["position"], query, ignore_case=True),
+        )
+        matched = pc.and_(matched, pc.fill_null(found, False))
+    rows = table.filter(selected).to_pylist() + table.filter(matched).slice(0, OPTION_LIMIT).to_pylist()
+    return [
+        {"label": _option_label(row["name"], row["organization"], row["position"]), "value": row["id"]}
+        for row in rows
+    ]
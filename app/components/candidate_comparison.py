@@ -0,0 +1,110 @@
+from dash import html, dcc
+import dash_bootstrap_components as dbc
+import plotly.graph_objects as go
+
+from ..comparison import CandidateComparison
+from .radar_chart import DIMENSION_MAP, create_overlay_radar_chart
+
+
+def create_comparison_summary_table(comparison: CandidateComparison) -> dbc.Table:
+    """후보자별 기본 정보와 종합점수/가중평균 요약 표"""
+    candidates = comparison["candidates"]
+    header = html.Thead(html.Tr([
+        html.Th("후보자"), html.Th("지원조직"), html.Th("지원직급"),
+        html.Th("종합평점", className="text-end"),
+        html.Th("차원 가중평균", className="text-end"),
+        html.Th("채용추천"),
+    ]))
+    rows = [
+        html.Tr([
+            html.Td(html.Strong(comparison["labels"][cid])),
+            html.Td(row["organization"]),
+            html.Td(row["position"]),
+            html.Td(_format_score(row["overall_score"]), className="text-end"),
+            html.Td(_format_score(row["weighted_score"]), className="text-end"),
+            html.Td(row["recommendation"]),
+        ])
+        for cid, row in candidates.iterrows()
+    ]
+    return dbc.Table([header, html.Tbody(rows)], bordered=True, hover=True, size="sm")
+
+
+def _format_score(value) -> str:
+    return "-" if value is None or value != value else f"{value:.1f}"
+
+
+def create_item_score_heatmap(comparison: CandidateComparison) -> go.Figure:
+    """분석 항목(행) × 후보자(열) 점수 히트맵. 해당 항목이 없는 후보자 칸은 비워 둡니다."""
+    item_scores = comparison["item_scores"]
+    labels = [comparison["labels"][cid] for cid in item_scores.columns]
+    rows = [
+        f"[{DIMENSION_MAP.get(category, category)}] {title}"
+        for category, title in item_scores.index
+    ]
+    values = item_scores.to_numpy().round(1)
+    fig = go.Figure(
+        go.Heatmap(
+            z=values,
+            x=labels,
+            y=rows,
+            text=values,
+            texttemplate="%{text}",
+            colorscale="Blues",
+            zmin=0,
+            zmax=100,
+            hoverongaps=False,
+            hovertemplate="%{x}<br>%{y}: %{z:.1f}점<extra></extra>",
+        )
+    )
+    fig.update_layout(
+        title="항목별 점수",
+        yaxis={"autorange": "reversed"},
+        xaxis={"side": "top"},
+        height=max(320, 28 * len(rows) + 140),
+        margin={"l": 10, "r": 10, "t": 90, "b": 10},
+    )
+    return fig
+
+
+def create_decision_points_comparison(comparison: CandidateComparison) -> dbc.Row:
+    """후보자별 강점/리스크 제목을 나란히 보여줍니다."""
+    def _titles(titles, empty_text):
+        if not titles:
+            return html.P(empty_text, className="text-muted small mb-0")
+        return html.Ul([html.Li(title) for title in titles], className="ps-3 mb-0 small")
+
+    columns = [
+        dbc.Col(
+            dbc.Card([
+                dbc.CardHeader(html.Strong(comparison["labels"][cid])),
+                dbc.CardBody([
+                    html.H6("👍 강점", className="text-primary"),
+                    _titles(comparison["strengths"].get(cid), "분석된 강점이 없습니다."),
+                    html.Hr(className="my-2"),
+                    html.H6("⚠️ 리스크", className="text-danger"),
+                    _titles(comparison["risks"].get(cid), "분석된 리스크가 없습니다."),
+                ]),
+            ], className="h-100"),
+            xs=12, md=6, lg=3,
+        )
+        for cid in comparison["candidates"].index
+    ]
+    return dbc.Row(columns, className="g-3")
+
+
+def render_candidate_comparison(comparison: CandidateComparison) -> html.Div:
+    """후보자 비교 화면 (요약 표, 5대 차원 레이더 겹쳐 보기, 항목별 히트맵, 강점/리스크)"""
+    dimension_scores = comparison["dimension_scores"]
+    radar = create_overlay_radar_chart({
+        comparison["labels"][cid]: list(scores)
+        for cid, scores in zip(dimension_scores.index, dimension_scores.to_numpy())
+    })
+    graph_config = {"displaylogo": False}
+    return html.Div([
+        create_comparison_summary_table(comparison),
+        html.H5("5대 차원 역량 프로필", className="mt-4"),
+        dcc.Graph(figure=radar, config=graph_config),
+        dcc.Graph(figure=create_item_score_heatmap(comparison), config=graph_config),
+        html.H5("강점 및 리스크", className="mt-4 mb-3"),
+        create_decision_points_comparison(comparison),
+    ], className="candidate-comparison")
@@ -1,27 +1,35 @@
 from dash import html
 import dash_bootstrap_components as dbc
-import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from app.dimension_scores import DimensionProfile, dimension_profile
 from app.report_schema import ReportData
+from app.cohort_index import CohortPercentiles
 
 # 상세 종합보고서 컴포넌트들 임포트
 from .full_report_header import create_full_report_header
 from .full_report_summary import create_full_report_summary
 from .full_report_by_material import create_full_report_by_material
 from .radar_chart import create_radar_chart
+from .executive_visual_report import create_competency_detail_table
 from .full_report_detailed_analysis import create_detailed_analysis_section
 from .decision_points_section import create_decision_points_section
 
 
-def create_comprehensive_visual_report(report_data: ReportData) -> html.Div:
+def create_comprehensive_visual_report(
+    report_data: ReportData, percentiles: Optional[CohortPercentiles] = None
+) -> html.Div:
     """
     종합 비주얼 리포트 전체 레이아웃을 생성합니다.
+    percentiles: 동일 조직·직급 내 백분위 (헤더에 표시)
     """
     if not report_data:
         return html.Div("보고서 데이터가 없습니다.", className="p-4")
 
+    # 5대 차원 집계는 보고서당 한 번 만들어 하위 컴포넌트에 넘김
+    profile = dimension_profile(report_data.analysis_items)
+
     # 각 섹션 생성
-    header_section = create_full_report_header(report_data.candidate_info)
+    header_section = create_full_report_header(report_data.candidate_info, percentiles)
     summary_section = create_full_report_summary(
         report_data.comprehensive_report
     )
@@ -33,9 +41,7 @@ def create_comprehensive_visual_report(report_data: ReportData) -> html.Div:
     decision_points = create_decision_points_section(
         report_data.decision_points
     )
-    radar_chart_section = create_radar_chart(
-        report_data.analysis_items, context="comprehensive"
-    )
+    radar_chart_section = create_radar_chart(profile, context="comprehensive")
     detailed_analysis_section = create_detailed_analysis_section(
         report_data.analysis_items
     )
@@ -72,7 +78,9 @@ def create_comprehensive_visual_report(report_data: ReportData) -> html.Div:
     )
 
 
-def _create_key_metrics_card(report_data: ReportData, status_map: Dict[str, Dict[str, str]]) -> dbc.Card:
+def _create_key_metrics_card(
+    report_data: ReportData, status_map: Dict[str, Dict[str, str]], profile: DimensionProfile
+) -> dbc.Card:
     """핵심 지표 카드를 생성합니다 (At a Glance)"""
     
     # 기본 정보 추출
@@ -89,18 +97,11 @@ def _create_key_metrics_card(report_data: ReportData, status_map: Dict[str, Dict
     
     if comprehensive_report.score >= 60:  # 기준 점수 (수정 가능)
         # 강점 찾기 - 점수가 높은 항목
-        if report_data.analysis_items:
-            df_items = pd.DataFrame([{
-                'title': item.title,
-                'score': item.score,
-                'analysis': item.analysis
-            } for item in report_data.analysis_items])
-            
-            if not df_items.empty:
-                top_item = df_items.loc[df_items['score'].idxmax()]
-                highlight_title = "✅ 최대 강점"
-                highlight_text = f"{top_item['title']}: {top_item['analysis'][:100]}..."
-                highlight_color = "success"
+        top_item = profile.top_item()
+        if top_item is not None:
+            highlight_title = "✅ 최대 강점"
+            highlight_text = f"{top_item.title}: {top_item.analysis[:100]}..."
+            highlight_color = "success"
     else:
         # 위험 요인 찾기 - executive_insights에서 위험 관련 항목 또는 점수가 낮은 항목
         risk_items = [item for item in report_data.executive_insights if "리스크" in item.insight or "위험" in item.insight]
@@ -110,16 +111,9 @@ def _create_key_metrics_card(report_data: ReportData, status_map: Dict[str, Dict
             highlight_text = risk_items[0].analysis[:100] + "..."
         elif report_data.analysis_items:
             # 점수가 가장 낮은 항목을 표시
-            df_items = pd.DataFrame([{
-                'title': item.title,
-                'score': item.score,
-                'analysis': item.analysis
-            } for item in report_data.analysis_items])
-            
-            if not df_items.empty:
-                bottom_item = df_items.loc[df_items['score'].idxmin()]
-                highlight_title = f"🚨 핵심 위험: {bottom_item['title']}"
-                highlight_text = bottom_item['analysis'][:100] + "..."
+            bottom_item = profile.bottom_item()
+            highlight_title = f"🚨 핵심 위험: {bottom_item.title}"
+            highlight_text = bottom_item.analysis[:100] + "..."
         
         highlight_color = "danger"
     
@@ -162,71 +156,17 @@ def _create_key_metrics_card(report_data: ReportData, status_map: Dict[str, Dict
     )
 
 
-def _create_executive_tab_content(report_data: ReportData, color_map: Dict[str, str]) -> List[Any]:
+def _create_executive_tab_content(
+    report_data: ReportData, color_map: Dict[str, str], profile: DimensionProfile
+) -> List[Any]:
     """Executive Summary 탭 콘텐츠를 생성합니다"""
     
     # 1. 세부 역량별 점수 표만 생성 (막대그래프 제거)
     if report_data.analysis_items:
-        df = pd.DataFrame([{
-            'category': item.category,
-            'score': item.score,
-            'title': item.title
-        } for item in report_data.analysis_items])
-        
-        # 5개 차원 한국어 매핑
-        dimension_names = {
-            'CAPABILITY': '역량',
-            'PERFORMANCE': '성과',
-            'POTENTIAL': '잠재력',
-            'PERSONALITY': '개인특성',
-            'FIT': '적합성'
-        }
-        
-        # 5개 차원만 필터링
-        df = df[df['category'].isin(dimension_names.keys())]
-        
-        # 세부 항목별 점수 표 생성
-        detail_table_rows = []
-        df['category_kr'] = df['category'].map(lambda x: dimension_names.get(x, x))
-        
-        # 카테고리별 평균 점수 계산해서 정렬
-        category_order = df.groupby('category_kr')['score'].mean().sort_values(ascending=False).index
-        
-        for category in category_order:
-            category_items = df[df['category_kr'] == category].sort_values('score', ascending=False)
-            
-            # 카테고리 헤더
-            detail_table_rows.append(
-                html.Tr([
-                    html.Td(category, className="fw-bold text-primary", colSpan=2),
-                    html.Td(f"{category_items['score'].mean():.1f}", className="fw-bold text-primary text-end")
-                ], className="table-primary")
-            )
-            
-            # 세부 항목들
-            for _, item in category_items.iterrows():
-                score_color = "text-success" if item['score'] >= 80 else "text-warning" if item['score'] >= 60 else "text-danger"
-                detail_table_rows.append(
-                    html.Tr([
-                        html.Td("", style={'width': '20px'}),  # 들여쓰기
-                        html.Td(item['title'], className="small"),
-                        html.Td(f"{item['score']:.1f}", className=f"text-end {score_color}")
-                    ])
-                )
-        
-        # 표만 표시 (차트 제거)
+        # 표만 표시 (차트 제거, 임원 보고서의 세부 점수 표와 같은 표)
         competency_content = html.Div([
             html.H5("5대 차원별 세부 점수", className="mb-3"),
-            dbc.Table([
-                html.Thead([
-                    html.Tr([
-                        html.Th("", style={'width': '20px'}),
-                        html.Th("역량 항목", style={'width': '70%'}),
-                        html.Th("점수", style={'width': '30%'}, className="text-end")
-                    ])
-                ]),
-                html.Tbody(detail_table_rows)
-            ], striped=True, hover=True, size="sm", className="mb-0")
+            create_competency_detail_table(profile)
         ])
         
     else:
@@ -268,14 +208,16 @@ def _create_executive_tab_content(report_data: ReportData, color_map: Dict[str,
     ]
 
 
-def _create_hr_tab_content(report_data: ReportData, color_map: Dict[str, str]) -> List[Any]:
+def _create_hr_tab_content(
+    report_data: ReportData, color_map: Dict[str, str], profile: DimensionProfile
+) -> List[Any]:
     """HR Deep Dive 탭에 상세 종합보고서의 모든 내용을 표시합니다"""
     
     # 상세 종합보고서의 모든 섹션들 생성
     header_section = create_full_report_header(report_data.candidate_info)
     summary_section = create_full_report_summary(report_data.comprehensive_report)
     by_material_section = create_full_report_by_material(report_data.material_analysis)
-    radar_chart_section = create_radar_chart(report_data.analysis_items)
+    radar_chart_section = create_radar_chart(profile)
     detailed_analysis_section = create_detailed_analysis_section(report_data.analysis_items)
     
     return [
@@ -3,10 +3,11 @@
 import dash_bootstrap_components as dbc
 from dash import html
 import plotly.graph_objects as go
-import pandas as pd
 from typing import List, Any
 
+from ..dimension_scores import DIMENSIONS, DimensionProfile, dimension_profile
 from ..report_schema import ReportData
+from .radar_chart import DIMENSION_COLORS, DIMENSION_MAP
 
 
 def create_executive_summary_card(report_data: ReportData) -> dbc.Card:
@@ -53,55 +54,28 @@ def create_executive_summary_card(report_data: ReportData) -> dbc.Card:
     ], className="mb-4 shadow-sm")
 
 
-def create_competency_chart(analysis_items: List[Any]) -> go.Figure:
+def create_competency_chart(profile: DimensionProfile) -> go.Figure:
     """역량 요약 바 차트를 생성합니다."""
-    if not analysis_items:
+    if not profile.items:
         return go.Figure()
     
-    # 카테고리별 평균 점수 계산
-    df = pd.DataFrame([{
-        'category': item.category,
-        'score': item.score,
-        'title': item.title
-    } for item in analysis_items])
-    
-    # 5개 차원만 필터링
-    dimension_names = {
-        'CAPABILITY': '역량',
-        'PERFORMANCE': '성과',
-        'POTENTIAL': '잠재력',
-        'PERSONALITY': '개인특성',
-        'FIT': '적합성'
-    }
-    
-    df = df[df['category'].isin(dimension_names.keys())]
-    category_scores = df.groupby('category')['score'].mean().reset_index()
-    category_scores = category_scores.sort_values('score', ascending=True)
-    
-    # 차원 이름 한글화
-    category_scores['category_kr'] = category_scores['category'].map(dimension_names)
-    
-    # 5개 차원별 고유 색상 매핑
-    dimension_colors = {
-        'CAPABILITY': '#1f77b4',    # 파란색 - 역량
-        'PERFORMANCE': '#ff7f0e',   # 주황색 - 성과
-        'POTENTIAL': '#2ca02c',     # 녹색 - 잠재력
-        'PERSONALITY': '#d62728',   # 빨간색 - 개인특성
-        'FIT': '#9467bd'            # 보라색 - 적합성
-    }
-    
+    # 5대 차원별 평균 점수 (낮은 순, 가로 막대는 아래부터 그려지므로 높은 점수가 위)
+    order = profile.ranked_dimensions()[::-1]
+    scores = profile.means[order].tolist()
+    categories = [DIMENSIONS[i] for i in order]
+
     # 각 차원별 색상 적용
-    bar_colors = [dimension_colors.get(cat, '#cccccc') for cat in category_scores['category']]
+    bar_colors = [DIMENSION_COLORS.get(cat, '#cccccc') for cat in categories]
     
     fig = go.Figure(go.Bar(
-        x=category_scores['score'],
-        y=category_scores['category_kr'],
+        x=scores,
+        y=[DIMENSION_MAP[cat] for cat in categories],
         orientation='h',
         marker=dict(
             color=bar_colors,
             line=dict(color='rgba(0,0,0,0.1)', width=0.5)
         ),
-        text=category_scores['score'].apply(lambda x: f'{x:.1f}'),
+        text=[f'{x:.1f}' for x in scores],
         textposition='outside',
         hovertemplate='<b>%{y}</b><br>점수: %{x:.1f}<extra></extra>'
     ))
@@ -121,62 +95,34 @@ def create_competency_chart(analysis_items: List[Any]) -> go.Figure:
     return fig
 
 
-def create_competency_detail_table(analysis_items: List[Any]) -> dbc.Table:
+def create_competency_detail_table(profile: DimensionProfile) -> dbc.Table:
     """세부 역량별 점수 테이블을 생성합니다."""
-    if not analysis_items:
+    if not profile.items:
         return dbc.Table()
     
-    # 카테고리별로 그룹화
-    df = pd.DataFrame([{
-        'category': item.category,
-        'title': item.title,
-        'score': item.score,
-        'analysis': item.analysis
-    } for item in analysis_items])
-    
-    # 5개 차원만 필터링
-    dimension_names = {
-        'CAPABILITY': '역량',
-        'PERFORMANCE': '성과',
-        'POTENTIAL': '잠재력',
-        'PERSONALITY': '개인특성',
-        'FIT': '적합성'
-    }
-    
-    # 5개 차원만 필터링
-    df = df[df['category'].isin(dimension_names.keys())]
-    
-    # 카테고리 이름 한글화
-    category_names = dimension_names
-    
-    df['category_kr'] = df['category'].map(
-        lambda x: category_names.get(x, x)
-    )
-    
-    # 카테고리별 평균 점수 계산해서 정렬
-    category_order = df.groupby('category_kr')['score'].mean().sort_values(ascending=False).index
+    # 5대 차원별 평균 점수 높은 순, 차원 안에서는 항목 점수 높은 순
     
     # 테이블 행 생성
     table_rows = []
-    for category in category_order:
-        category_items = df[df['category_kr'] == category].sort_values('score', ascending=False)
+    for index in profile.ranked_dimensions():
+        category_items = [profile.items[i] for i in profile.dimension_items(index)]
         
         # 카테고리 헤더
         table_rows.append(
             html.Tr([
-                html.Td(category, className="fw-bold text-primary", colSpan=2),
-                html.Td(f"{category_items['score'].mean():.1f}", className="fw-bold text-primary text-end")
+                html.Td(DIMENSION_MAP[DIMENSIONS[index]], className="fw-bold text-primary", colSpan=2),
+                html.Td(f"{profile.means[index]:.1f}", className="fw-bold text-primary text-end")
             ], className="table-primary")
         )
         
         # 세부 항목들
-        for _, item in category_items.iterrows():
-            score_color = "text-success" if item['score'] >= 80 else "text-warning" if item['score'] >= 60 else "text-danger"
+        for item in category_items:
+            score_color = "text-success" if item.score >= 80 else "text-warning" if item.score >= 60 else "text-danger"
             table_rows.append(
                 html.Tr([
                     html.Td("", style={'width': '20px'}),  # 들여쓰기
-                    html.Td(item['title'], className="small"),
-                    html.Td(f"{item['score']:.1f}", className=f"text-end {score_color}")
+                    html.Td(item.title, className="small"),
+                    html.Td(f"{item.score:.1f}", className=f"text-end {score_color}")
                 ])
             )
     
@@ -281,6 +227,8 @@ def create_material_analysis_accordion_content(material_analysis: List[Any]) ->
 
 def render_executive_visual_report(report_data: ReportData) -> html.Div:
     """임원 보고용 비주얼 리포트를 렌더링합니다."""
+    # 5대 차원 집계는 보고서당 한 번 만들어 하위 컴포넌트에 넘김
+    profile = dimension_profile(report_data.analysis_items)
     return html.Div([
         # 헤더
         dbc.Row([
@@ -316,7 +264,7 @@ def render_executive_visual_report(report_data: ReportData) -> html.Div:
             dbc.CardBody([
                 dbc.Accordion([
                     dbc.AccordionItem(
-                        create_competency_detail_table(report_data.analysis_items),
+                        create_competency_detail_table(profile),
                         title="1. 5대 차원별 상세 점수"
                     ),
                     dbc.AccordionItem(
@@ -1,4 +1,5 @@
 from dash import html
+from ..dimension_scores import dimension_profile
 from ..report_schema import ReportData
 
 # 컴포넌트 임포트
@@ -29,7 +30,7 @@ def render_full_report(report_data: ReportData) -> html.Div:
     decision_points = create_decision_points_section(
         report_data.decision_points
     )
-    radar_chart_section = create_radar_chart(report_data.analysis_items)
+    radar_chart_section = create_radar_chart(dimension_profile(report_data.analysis_items))
     detailed_analysis_section = create_detailed_analysis_section(
         report_data.analysis_items
     )
@@ -1,6 +1,9 @@
 from dash import html
 import dash_bootstrap_components as dbc
+from typing import Optional
 from ..report_schema import CandidateInfo
+from ..cohort_index import CohortPercentiles
+from .radar_chart import CORE_DIMENSIONS, DIMENSION_MAP
 
 
 def create_info_card(icon_class: str, title: str, content: str) -> dbc.Col:
@@ -33,9 +36,60 @@ def create_info_card(icon_class: str, title: str, content: str) -> dbc.Col:
     )
 
 
-def create_full_report_header(candidate_info: CandidateInfo) -> html.Div:
+def _percentile_badge(label: str, percentile: float, main: bool = False) -> dbc.Badge:
+    """백분위 배지 (상위 25% 이내 초록, 하위 25% 이내 빨강)"""
+    if percentile >= 75:
+        color = "success"
+    elif percentile < 25:
+        color = "danger"
+    else:
+        color = "secondary"
+    text = f"{label} 상위 {max(100 - percentile, 1):.0f}%" if main else f"{label} P{percentile:.0f}"
+    return dbc.Badge(
+        text, color=color, pill=True,
+        className="me-2 mb-1" + (" fs-6" if main else ""),
+    )
+
+
+def create_cohort_percentile_row(percentiles: Optional[CohortPercentiles]) -> html.Div:
+    """
+    동일 지원조직·지원직급 후보자 대비 종합점수/차원별 백분위를 표시합니다.
+    (P값은 코호트 내에서 해당 점수보다 낮은 후보자 비율)
+    """
+    if not percentiles:
+        return html.Div()
+    cohort = f"{percentiles['organization']} · {percentiles['position']}"
+    if percentiles["overall"] is None:
+        return html.Div(
+            f"동일 조직·직급({cohort}) 비교 대상이 부족합니다. "
+            f"(본인 포함 {percentiles['cohort_size']}명)",
+            className="cohort-percentiles text-muted small mt-3 text-center",
+        )
+    badges = [_percentile_badge("종합점수", percentiles["overall"], main=True)]
+    badges += [
+        _percentile_badge(DIMENSION_MAP[dimension], percentiles["dimensions"][dimension])
+        for dimension in CORE_DIMENSIONS
+        if dimension in percentiles["dimensions"]
+    ]
+    return html.Div(
+        [
+            html.Div(
+                f"동일 조직·직급({cohort}) {percentiles['cohort_size']}명 중",
+                className="text-muted small mb-1",
+            ),
+            html.Div(badges),
+        ],
+        className="cohort-percentiles mt-3 text-center",
+    )
+
+
+def create_full_report_header(
+    candidate_info: CandidateInfo,
+    percentiles: Optional[CohortPercentiles] = None,
+) -> html.Div:
     """
     상세 보고서의 헤더 섹션을 새로운 디자인으로 생성합니다.
+    percentiles가 주어지면 동일 조직·직급 내 백분위를 함께 표시합니다.
     """
     return html.Div(
         [
@@ -58,6 +112,7 @@ def create_full_report_header(candidate_info: CandidateInfo) -> html.Div:
                         f"지원 직무: {candidate_info.position}",
                         className="candidate-position",
                     ),
+                    create_cohort_percentile_row(percentiles),
                 ],
                 className="candidate-info-section",
             ),
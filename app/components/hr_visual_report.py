@@ -3,10 +3,12 @@
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 import plotly.graph_objects as go
-import pandas as pd
-from typing import List, Any
+from typing import List, Any, Optional
 
+from ..dimension_scores import DIMENSIONS, DimensionProfile, dimension_profile
 from ..report_schema import ReportData
+from ..cohort_index import CohortPercentiles
+from .full_report_header import create_cohort_percentile_row
 
 # 5개 차원 기반 색상 맵 (레이더 차트와 일치)
 CATEGORY_COLOR_MAP = {
@@ -57,8 +59,10 @@ def _create_empty_radar_chart() -> go.Figure:
     return fig
 
 
-def create_candidate_info_card(report_data: ReportData) -> dbc.Card:
-    """후보자 기본 정보 카드를 생성합니다."""
+def create_candidate_info_card(
+    report_data: ReportData, percentiles: Optional[CohortPercentiles] = None
+) -> dbc.Card:
+    """후보자 기본 정보 카드를 생성합니다. (percentiles: 동일 조직·직급 내 백분위)"""
     info = report_data.candidate_info
     
     return dbc.Card([
@@ -94,7 +98,8 @@ def create_candidate_info_card(report_data: ReportData) -> dbc.Card:
                         info.salary_info
                     ], className="mb-2")
                 ], width=12, md=6)
-            ])
+            ]),
+            create_cohort_percentile_row(percentiles)
         ])
     ], className="mb-4")
 
@@ -143,46 +148,14 @@ def create_recommendation_gauge(report_data: ReportData) -> dbc.Card:
     ], className="h-100")
 
 
-def create_competency_radar_chart(analysis_items: List[Any]) -> go.Figure:
+def create_competency_radar_chart(profile: DimensionProfile) -> go.Figure:
     """5개 차원별 레이더 차트를 생성합니다."""
-    if not analysis_items:
+    if not profile.items:
         return _create_empty_radar_chart()
     
     try:
-        # 데이터 준비 - 카테고리별 평균 점수 계산
-        df = pd.DataFrame([
-            {
-                'category': getattr(item, 'category', 'CAPABILITY'),
-                'score': getattr(item, 'score', 0)
-            } 
-            for item in analysis_items 
-            if hasattr(item, 'category') and hasattr(item, 'score')
-        ])
-        
-        if df.empty:
-            return _create_empty_radar_chart()
-        
-        category_scores = df.groupby('category')['score'].mean().reset_index()
-        
-        # 5개 차원만 필터링
-        category_scores = category_scores[
-            category_scores['category'].isin(DIMENSION_NAMES.keys())
-        ]
-        
-        # 누락된 차원에 대해 기본값 추가
-        missing_dimensions = set(DIMENSION_NAMES.keys()) - set(
-            category_scores['category']
-        )
-        for dim in missing_dimensions:
-            new_row = pd.DataFrame([{'category': dim, 'score': 0}])
-            category_scores = pd.concat(
-                [category_scores, new_row], ignore_index=True
-            )
-        
-        # 차원 이름 한글화
-        category_scores['category_kr'] = category_scores['category'].map(
-            DIMENSION_NAMES
-        )
+        # 5개 차원별 평균 점수 (5대 차원 순서, 누락된 차원은 0점)
+        category_scores = profile.filled_means.tolist()
         
         # 레이더 차트 생성
         fig = go.Figure()
@@ -190,12 +163,12 @@ def create_competency_radar_chart(analysis_items: List[Any]) -> go.Figure:
         # 카테고리별 색상 적용
         category_colors = [
             CATEGORY_COLOR_MAP.get(cat, '#cccccc') 
-            for cat in category_scores['category']
+            for cat in DIMENSIONS
         ]
         
         fig.add_trace(go.Scatterpolar(
-            r=category_scores['score'],
-            theta=category_scores['category_kr'],
+            r=category_scores,
+            theta=[DIMENSION_NAMES[cat] for cat in DIMENSIONS],
             fill='toself',
             name='역량 점수',
             line=dict(color='rgba(0, 85, 164, 0.8)', width=2),
@@ -386,8 +359,12 @@ def create_category_legend() -> dbc.Card:
     ], className="category-legend")
 
 
-def render_hr_visual_report(report_data: ReportData) -> html.Div:
+def render_hr_visual_report(
+    report_data: ReportData, percentiles: Optional[CohortPercentiles] = None
+) -> html.Div:
     """HR 담당자용 비주얼 리포트를 렌더링합니다."""
+    # 5대 차원 집계는 보고서당 한 번 만들어 하위 컴포넌트에 넘김
+    profile = dimension_profile(report_data.analysis_items)
     return html.Div([
         # 헤더
         dbc.Row([
@@ -405,7 +382,7 @@ def render_hr_visual_report(report_data: ReportData) -> html.Div:
         # 후보자 기본 정보
         dbc.Row([
             dbc.Col([
-                create_candidate_info_card(report_data)
+                create_candidate_info_card(report_data, percentiles)
             ], width=12)
         ]),
         
@@ -449,9 +426,7 @@ def render_hr_visual_report(report_data: ReportData) -> html.Div:
                     dbc.CardBody([
                         dcc.Graph(
                             id="hr-visual-competency-radar",
-                            figure=create_competency_radar_chart(
-                                report_data.analysis_items
-                            ),
+                            figure=create_competency_radar_chart(profile),
                             config={'displayModeBar': False}
                         )
                     ])
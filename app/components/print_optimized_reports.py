@@ -1,8 +1,10 @@
 """A4 사이즈 PDF/PPT 출력에 최적화된 레이아웃 컴포넌트"""
 
 from dash import html
-import pandas as pd
 
+from typing import Optional
+
+from ..dimension_scores import DIMENSIONS, DimensionProfile, dimension_profile
 from ..report_schema import ReportData
 
 
@@ -64,20 +66,22 @@ def create_print_header(candidate_name: str, report_type: str) -> html.Div:
     ])
 
 
-def create_print_executive_summary(report_data: ReportData) -> html.Div:
+# 5대 차원 차트 자리 (정적 HTML 렌더러가 이 id의 요소를 SVG 차트로 바꿈)
+PRINT_DIMENSION_CHART_ID = "print-dimension-chart"
+
+
+def create_print_dimension_chart() -> html.Div:
+    """5대 차원 차트 자리 표시 요소"""
+    return html.Div(id=PRINT_DIMENSION_CHART_ID, style=A4_STYLES['section'])
+
+
+def create_print_executive_summary(report_data: ReportData, profile: DimensionProfile) -> html.Div:
     """인쇄용 임원 요약 페이지"""
     if not report_data.comprehensive_report:
         return html.Div("종합 평가 데이터가 없습니다.")
     
-    # 5대 차원별 평균 점수 계산
-    df = pd.DataFrame([{
-        'category': item.category,
-        'score': item.score,
-        'title': item.title
-    } for item in report_data.analysis_items])
-    
-    # 5대 차원만 필터링
-    dimension_names = {
+    # 5대 차원별 평균 점수 (높은 순)
+    category_names = {
         'CAPABILITY': '역량',
         'PERFORMANCE': '성과',
         'POTENTIAL': '잠재력',
@@ -85,15 +89,6 @@ def create_print_executive_summary(report_data: ReportData) -> html.Div:
         'FIT': '적합성'
     }
     
-    df = df[df['category'].isin(dimension_names.keys())]
-    category_scores = df.groupby('category')['score'].mean().reset_index()
-    category_names = dimension_names
-    
-    category_scores['category_kr'] = category_scores['category'].map(
-        lambda x: category_names.get(x, x)
-    )
-    category_scores = category_scores.sort_values('score', ascending=False)
-    
     # 추천 등급별 색상
     recommendation_colors = {
         '강력 추천': '#28a745',
@@ -109,12 +104,13 @@ def create_print_executive_summary(report_data: ReportData) -> html.Div:
 
     # 역량 점수표의 tbody에 들어갈 행(Tr)들을 생성
     table_body_rows = []
-    for category_code in category_scores['category']:
-        category_name = category_names.get(category_code, category_code)
-        category_data = df[df['category'] == category_code]
+    for index in profile.ranked_dimensions():
+        category_name = category_names[DIMENSIONS[index]]
+        # 차원 안에서는 분석 항목 순서 그대로
+        category_data = [profile.items[i] for i in profile.dimension_items(index, by_score=False)]
 
         # 해당 카테고리의 첫 번째 행 (rowSpan 적용)
-        first_row_items = category_data.iloc[0]
+        first_row_items = category_data[0]
         table_body_rows.append(html.Tr([
             html.Td(
                 category_name,
@@ -122,24 +118,24 @@ def create_print_executive_summary(report_data: ReportData) -> html.Div:
                 rowSpan=len(category_data)
             ),
             html.Td(
-                first_row_items['title'],
+                first_row_items.title,
                 style={'padding': '3mm', 'fontSize': '9pt'}
             ),
             html.Td(
-                f"{first_row_items['score']:.1f}",
+                f"{first_row_items.score:.1f}",
                 style={'padding': '3mm', 'textAlign': 'center', 'fontSize': '9pt'}
             )
         ]))
 
         # 해당 카테고리의 나머지 행들
-        for _, other_row_items in category_data.iloc[1:].iterrows():
+        for other_row_items in category_data[1:]:
             table_body_rows.append(html.Tr([
                 html.Td(
-                    other_row_items['title'],
+                    other_row_items.title,
                     style={'padding': '3mm', 'fontSize': '9pt'}
                 ),
                 html.Td(
-                    f"{other_row_items['score']:.1f}",
+                    f"{other_row_items.score:.1f}",
                     style={'padding': '3mm', 'textAlign': 'center', 'fontSize': '9pt'}
                 )
             ]))
@@ -194,7 +190,9 @@ def create_print_executive_summary(report_data: ReportData) -> html.Div:
                     report_data.comprehensive_report.summary,
                     style={'fontSize': '10pt', 'lineHeight': '1.4', 'textAlign': 'justify'}
                 )
-            ], style=A4_STYLES['section'])
+            ], style=A4_STYLES['section']),
+
+            create_print_dimension_chart()
         ], style=A4_STYLES['page']),
         
         # 페이지 2: 역량 점수표
@@ -230,7 +228,7 @@ def create_print_executive_summary(report_data: ReportData) -> html.Div:
     ])
 
 
-def create_print_comprehensive_report(report_data: ReportData) -> html.Div:
+def create_print_comprehensive_report(report_data: ReportData, profile: DimensionProfile) -> html.Div:
     """인쇄용 종합 보고서"""
     return html.Div([
         create_print_header(report_data.candidate_info.name, "종합 분석 보고서"),
@@ -290,7 +288,9 @@ def create_print_comprehensive_report(report_data: ReportData) -> html.Div:
                     style={'fontSize': '10pt', 'lineHeight': '1.4',
                            'textAlign': 'justify'}
                 )
-            ], style=A4_STYLES['section'])
+            ], style=A4_STYLES['section']),
+
+            create_print_dimension_chart()
         ], style=A4_STYLES['page']),
         
         # 페이지 2: 주요 분석 항목
@@ -348,13 +348,14 @@ def create_print_comprehensive_report(report_data: ReportData) -> html.Div:
     ])
 
 
-def create_print_hr_report(report_data: ReportData) -> html.Div:
+def create_print_hr_report(report_data: ReportData, profile: DimensionProfile) -> html.Div:
     """인쇄용 HR 보고서"""
     return html.Div([
         create_print_header(report_data.candidate_info.name, "HR 상세 분석 보고서"),
 
         # 페이지 1: HR 핵심 의사결정 포인트
         html.Div([
+            create_print_dimension_chart(),
             html.H4(
                 "👍 강점 및 기회 요인",
                 style={'fontSize': '12pt', 'color': '#007bff',
@@ -412,25 +413,37 @@ def create_print_hr_report(report_data: ReportData) -> html.Div:
     ])
 
 
-def render_print_optimized_report(report_data: ReportData, report_type: str) -> html.Div:
-    """인쇄 최적화된 보고서 렌더링"""
+# 보고서 유형별 인쇄 레이아웃
+PRINT_REPORT_BUILDERS = {
+    "comprehensive": create_print_comprehensive_report,
+    "executive": create_print_executive_summary,
+    "hr": create_print_hr_report,
+}
+
+
+def render_print_optimized_report(
+    report_data: ReportData, report_type: str, profile: Optional[DimensionProfile] = None
+) -> html.Div:
+    """
+    인쇄 최적화된 보고서 렌더링
+    profile: 5대 차원 집계 (호출한 쪽에서 차트와 함께 쓰려고 이미 만들었으면 넘김)
+    """
     print_style = {
         'fontFamily': 'Pretendard, sans-serif',
         'backgroundColor': 'white',
         'color': 'black'
     }
     
-    if report_type == "executive":
-        content = create_print_executive_summary(report_data)
-    elif report_type == "comprehensive":
-        content = create_print_comprehensive_report(report_data)
-    elif report_type == "hr":
-        content = create_print_hr_report(report_data)
+    builder = PRINT_REPORT_BUILDERS.get(report_type)
+    if builder is not None:
+        if profile is None:
+            profile = dimension_profile(report_data.analysis_items)
+        content = builder(report_data, profile)
     else:
         content = html.Div("지원하지 않는 보고서 유형입니다.")
     
     return html.Div([
-        # 인쇄 안내 (화면에서만 보임)
+        # 인쇄 안내 (화면에서만 보임, no-print 클래스는 인쇄 시 숨김)
         html.Div([
             html.Div([
                 html.Strong("📄 인쇄 방법: "),
@@ -453,7 +466,7 @@ def render_print_optimized_report(report_data: ReportData, report_type: str) ->
                 'fontSize': '14px',
                 'boxShadow': '0 2px 5px rgba(0,0,0,0.1)'
             })
-        ], style={'display': 'block'}),
+        ], className="no-print", style={'display': 'block'}),
         
         # 실제 보고서 내용
         html.Div(content, style=print_style)
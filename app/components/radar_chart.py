@@ -1,9 +1,8 @@
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
-import pandas as pd
-from typing import List
-from ..report_schema import AnalysisItem
+from typing import Dict, Sequence
+from ..dimension_scores import DimensionProfile
 
 # 통합 인재 평가 모델 5대 차원 한글 매핑
 DIMENSION_MAP = {
@@ -27,15 +26,16 @@ DIMENSION_COLORS = {
 }
 
 def create_radar_chart(
-    analysis_items: List[AnalysisItem], context: str = "hr"
+    profile: DimensionProfile, context: str = "hr"
 ) -> html.Div:
     """
     통합 인재 평가 모델 5대 차원 레이더 차트를 생성합니다.
+    profile: 보고서 렌더러가 보고서당 한 번 만든 차원 집계 (dimension_profile)
     context에 따라 출력 형식을 다르게 설정합니다.
     - 'hr': 기존 HR 리포트 형식 (제목, 범례 포함)
     - 'comprehensive': 종합 대시보드 형식 (차트만)
     """
-    if not analysis_items:
+    if not profile.items:
         return html.Div([
             dbc.Alert(
                 "분석 항목이 없어 레이더 차트를 생성할 수 없습니다.",
@@ -44,13 +44,7 @@ def create_radar_chart(
             )
         ])
 
-    # 분석 항목을 DataFrame으로 변환
-    df = pd.DataFrame([item.model_dump() for item in analysis_items])
-    
-    # 5대 차원만 필터링
-    df_filtered = df[df['category'].isin(CORE_DIMENSIONS)]
-    
-    if df_filtered.empty:
+    if not profile.counts.any():
         return html.Div([
             dbc.Alert(
                 "5대 차원에 해당하는 분석 항목이 없습니다.",
@@ -59,32 +53,17 @@ def create_radar_chart(
             )
         ])
 
-    # 차원별 평균 점수 계산
-    dimension_scores = df_filtered.groupby('category')['score'].mean().reset_index()
-    dimension_scores['dimension_kr'] = dimension_scores['category'].map(DIMENSION_MAP)
-    
-    # 5대 차원 순서로 정렬
+    # 5대 차원 순서, 누락된 차원은 0점
     dimension_order = [DIMENSION_MAP[dim] for dim in CORE_DIMENSIONS]
-    dimension_scores = dimension_scores.set_index('dimension_kr').reindex(dimension_order, fill_value=0).reset_index()
-    
-    # 누락된 차원이 있는지 확인하고 0점으로 채움
-    for dim in CORE_DIMENSIONS:
-        dim_kr = DIMENSION_MAP[dim]
-        if dim_kr not in dimension_scores['dimension_kr'].values:
-            new_row = pd.DataFrame({
-                'dimension_kr': [dim_kr],
-                'category': [dim],
-                'score': [0]
-            })
-            dimension_scores = pd.concat([dimension_scores, new_row], ignore_index=True)
-    
+    dimension_scores = profile.filled_means.tolist()
+
     # 차트 생성
     fig = go.Figure()
 
     # 레이더 차트 추가
     fig.add_trace(go.Scatterpolar(
-        r=dimension_scores['score'],
-        theta=dimension_scores['dimension_kr'],
+        r=dimension_scores,
+        theta=dimension_order,
         fill='toself',
         name='역량 점수',
         line=dict(color='#0055A4', width=3),
@@ -177,26 +156,75 @@ def create_radar_chart(
     ], className="radar-chart-section")
 
 
-def create_dimension_detail_table(df: pd.DataFrame) -> dbc.Card:
+# 후보자 비교용 색상 (최대 8명)
+COMPARISON_COLORS = [
+    "#0055A4", "#E4572E", "#2CA02C", "#9467BD",
+    "#F2A541", "#17BECF", "#8C564B", "#E377C2",
+]
+
+
+def create_overlay_radar_chart(series: Dict[str, Sequence[float]]) -> go.Figure:
+    """
+    여러 후보자의 5대 차원 평균(CORE_DIMENSIONS 순서)을 한 레이더 차트에 겹쳐 그립니다.
+    series: {후보자 표시명: 차원별 점수 5개} (항목이 없는 차원은 NaN → 0점으로 표시)
+    """
+    theta = [DIMENSION_MAP[dim] for dim in CORE_DIMENSIONS]
+    fig = go.Figure()
+    for i, (label, scores) in enumerate(series.items()):
+        color = COMPARISON_COLORS[i % len(COMPARISON_COLORS)]
+        r = [0 if score != score else score for score in scores]
+        fig.add_trace(go.Scatterpolar(
+            # 다각형을 닫기 위해 첫 점을 끝에 한 번 더 추가
+            r=r + r[:1],
+            theta=theta + theta[:1],
+            name=label,
+            line=dict(color=color, width=2),
+            marker=dict(size=6, color=color),
+            hovertemplate=f'<b>{label}</b><br>%{{theta}}: %{{r:.1f}}<extra></extra>'
+        ))
+
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                tickvals=[20, 40, 60, 80, 100],
+                gridcolor='rgba(0,0,0,0.1)',
+                tickfont=dict(size=11, color='#666')
+            ),
+            angularaxis=dict(
+                direction="clockwise",
+                tickfont=dict(size=13, color='#333'),
+                rotation=90
+            )
+        ),
+        showlegend=True,
+        legend=dict(orientation="h", y=-0.1),
+        height=480,
+        margin=dict(l=60, r=60, t=40, b=60),
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Pretendard, -apple-system, BlinkMacSystemFont, sans-serif")
+    )
+    return fig
+
+
+def create_dimension_detail_table(profile: DimensionProfile) -> dbc.Card:
     """
     차원별 세부 점수 표를 생성합니다.
     """
-    # 차원별 평균 점수 계산 및 정렬
-    dimension_avg = df.groupby('category')['score'].mean().reset_index()
-    dimension_avg['dimension_kr'] = dimension_avg['category'].map(DIMENSION_MAP)
-    dimension_avg = dimension_avg.sort_values('score', ascending=False)
-    
+
     # 테이블 행 생성
     table_rows = []
-    
-    for _, row in dimension_avg.iterrows():
-        category = row['category']
-        dimension_kr = row['dimension_kr']
-        avg_score = row['score']
-        
-        # 해당 차원의 세부 항목들
-        category_items = df[df['category'] == category].sort_values('score', ascending=False)
-        
+
+    # 차원별 평균 점수 높은 순
+    for index in profile.ranked_dimensions():
+        category = CORE_DIMENSIONS[index]
+        dimension_kr = DIMENSION_MAP[category]
+        avg_score = float(profile.means[index])
+
+        # 해당 차원의 세부 항목들 (점수 높은 순)
+        category_items = [profile.items[i] for i in profile.dimension_items(index)]
+
         # 점수에 따른 색상 설정
         if avg_score >= 80:
             score_color = "success"
@@ -233,18 +261,18 @@ def create_dimension_detail_table(df: pd.DataFrame) -> dbc.Card:
         )
         
         # 세부 항목들
-        for _, item in category_items.iterrows():
-            score_badge_color = "success" if item['score'] >= 80 else "warning" if item['score'] >= 60 else "danger"
+        for item in category_items:
+            score_badge_color = "success" if item.score >= 80 else "warning" if item.score >= 60 else "danger"
             
             table_rows.append(
                 html.Tr([
                     html.Td([
                         html.Span("└─ ", className="text-muted"),
-                        item['title']
+                        item.title
                     ], className="ps-4 text-muted small"),
                     html.Td([
                         dbc.Badge(
-                            f"{item['score']:.1f}",
+                            f"{item.score:.1f}",
                             color=score_badge_color,
                             className="px-2 py-1"
                         )
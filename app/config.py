@@ -15,4 +15,46 @@ MATERIAL_LABELS = [
     "평판보고서",
     "BIG5 성격유형검사표",
     "인성검사표"
-] 
\ No newline at end of file
+] 
+
+# ---- 프롬프트 토큰 예산 ----
+
+# 모델(대화창)별 입력 컨텍스트 한도 (토큰). 첫 항목이 기본값
+# 자동 맞춤으로도 빼지 않는 자료(이력서, 1차 면접 자료) + 기본 프롬프트 + RESERVED_OUTPUT_TOKENS가
+# 들어가야 하므로 약 32K 미만인 모델은 넣지 않습니다.
+MODEL_TOKEN_BUDGETS = {
+    "GPT-4o (128K)": 128_000,
+    "Claude (200K)": 200_000,
+    "Gemini (1M)": 1_000_000,
+    "Copilot / Perplexity (32K)": 32_000,
+}
+
+# 분석 결과 JSON 응답을 위해 남겨 두는 토큰 (5대 차원 17개 항목 + 종합 의견)
+RESERVED_OUTPUT_TOKENS = 8_000
+
+# 자료별 예상 토큰 수 (텍스트로 붙여 넣었을 때의 대략적인 크기, 50분 면접 녹취록은 약 18,000자)
+MATERIAL_TOKEN_ESTIMATES = {
+    "이력서": 4_000,
+    "면접평가표(1차)": 2_000,
+    "면접평가표(2차)": 2_000,
+    "면접평가표(3차)": 2_000,
+    "면접 녹취록(1차)": 15_000,
+    "면접 녹취록(2차)": 15_000,
+    "면접 녹취록(3차)": 15_000,
+    "포트폴리오": 10_000,
+    "평판보고서": 12_000,
+    "BIG5 성격유형검사표": 3_000,
+    "인성검사표": 4_000,
+}
+
+# 자동 맞춤 모드에서 예산을 넘으면 이 순서대로 자료를 제외 (이력서와 1차 면접 자료는 제외하지 않음)
+MATERIAL_TRIM_ORDER = [
+    "포트폴리오",
+    "BIG5 성격유형검사표",
+    "면접 녹취록(3차)",
+    "면접평가표(3차)",
+    "인성검사표",
+    "평판보고서",
+    "면접 녹취록(2차)",
+    "면접평가표(2차)",
+]
@@ -1,6 +1,7 @@
 from dash import html, dcc
 import dash_bootstrap_components as dbc
-from .config import MATERIAL_LABELS
+from .config import MATERIAL_LABELS, MODEL_TOKEN_BUDGETS
+from .prompt_logic import PromptPlan
 
 
 def render_dash_prompt_generator():
@@ -38,7 +39,7 @@ def render_dash_prompt_generator():
             html.Div([
                 dbc.Label('기타(직접 입력)', html_for='prompt-upload-materials-etc'),
                 dbc.Input(
-                    id='prompt-upload-materials-etc',
+                    id='prompt-upload-materials-etc', debounce=True,
                     placeholder='예: 추가 자료명 입력'
                 ),
             ], className="etc-input-container")
@@ -48,19 +49,19 @@ def render_dash_prompt_generator():
             dbc.Col([
                 dbc.Label('이름', html_for='prompt-candidate-name-input'),
                 dbc.Input(
-                    id='prompt-candidate-name-input', placeholder='예: 홍길동'
+                    id='prompt-candidate-name-input', debounce=True, placeholder='예: 홍길동'
                 ),
             ], md=4),
             dbc.Col([
                 dbc.Label('지원조직', html_for='prompt-candidate-org-input'),
                 dbc.Input(
-                    id='prompt-candidate-org-input', placeholder='예: 삼양KCI'
+                    id='prompt-candidate-org-input', debounce=True, placeholder='예: 삼양KCI'
                 ),
             ], md=4),
             dbc.Col([
                 dbc.Label('지원직급', html_for='prompt-candidate-position-input'),
                 dbc.Input(
-                    id='prompt-candidate-position-input', placeholder='예: 팀장'
+                    id='prompt-candidate-position-input', debounce=True, placeholder='예: 팀장'
                 ),
             ], md=4),
         ], className="mb-2"),
@@ -68,23 +69,49 @@ def render_dash_prompt_generator():
             dbc.Col([
                 dbc.Label('면접일', html_for='prompt-candidate-date-input'),
                 dbc.Input(
-                    id='prompt-candidate-date-input', placeholder='예: 20250708'
+                    id='prompt-candidate-date-input', debounce=True, placeholder='예: 20250708'
                 ),
             ], md=4),
             dbc.Col([
                 dbc.Label('연봉(만원)', html_for='prompt-candidate-salary-input'),
                 dbc.Input(
-                    id='prompt-candidate-salary-input', placeholder='예: 6000'
+                    id='prompt-candidate-salary-input', debounce=True, placeholder='예: 6000'
                 ),
             ], md=4),
             dbc.Col([
                 dbc.Label('경력(년)', html_for='prompt-candidate-career-input'),
                 dbc.Input(
-                    id='prompt-candidate-career-input', placeholder='예: 10'
+                    id='prompt-candidate-career-input', debounce=True, placeholder='예: 10'
                 ),
             ], md=4),
         ]),
 
+        html.Div([
+            dbc.Row([
+                dbc.Col([
+                    dbc.Label('사용할 모델 (입력 토큰 한도)', html_for='prompt-token-model'),
+                    dcc.Dropdown(
+                        id='prompt-token-model',
+                        options=[
+                            {'label': f"{model} - {budget:,} 토큰", 'value': model}
+                            for model, budget in MODEL_TOKEN_BUDGETS.items()
+                        ],
+                        value=next(iter(MODEL_TOKEN_BUDGETS)),
+                        clearable=False,
+                    ),
+                ], md=6),
+                dbc.Col([
+                    dbc.Switch(
+                        id='prompt-auto-trim',
+                        label='예산을 넘으면 자료를 자동으로 제외',
+                        value=False,
+                    ),
+                ], md=6, className="d-flex align-items-end"),
+            ], className="mb-3"),
+            # 토큰 사용량 (입력이 바뀔 때마다 콜백에서 채움)
+            html.Div(id='prompt-token-budget'),
+        ], className="card-section form-section mt-4"),
+
         html.Div([
             dbc.Button(
                 '프롬프트 생성',
@@ -141,3 +168,43 @@ def render_dash_prompt_generator():
         ], className="llm-link-container"),
 
     ], className="page-container")
+
+
+def render_token_budget(plan: PromptPlan) -> html.Div:
+    """plan_custom_prompt 결과의 토큰 사용량 표시 (전체 막대 + 항목별 내역)"""
+    total, budget = plan["total_tokens"], plan["budget"]
+    percent = total / budget * 100 if budget else 100
+    color = "success" if percent <= 80 else "warning" if percent <= 100 else "danger"
+    material_total = sum(plan["material_tokens"].values())
+    unit = "토큰" if plan["exact"] else "토큰(추정)"
+
+    children = [
+        html.Div([
+            html.Strong(f"예상 사용량 {total:,} / {budget:,} {unit}"),
+            html.Span(f" ({percent:.0f}%)", className=f"text-{color} fw-bold"),
+        ]),
+        dbc.Progress(value=min(percent, 100), color=color, className="my-2", style={"height": "10px"}),
+        html.Div(
+            f"프롬프트 {plan['prompt_tokens']:,} · 자료 {material_total:,} · 응답 예약 {plan['reserved_tokens']:,}",
+            className="small text-muted",
+        ),
+    ]
+    if plan["material_tokens"]:
+        children.append(html.Div([
+            dbc.Badge(f"{material} {tokens:,}", color="light", text_color="dark", className="me-1 mt-1")
+            for material, tokens in plan["material_tokens"].items()
+        ]))
+    if plan["dropped_materials"]:
+        children.append(html.Div(
+            f"예산에 맞추기 위해 제외: {', '.join(plan['dropped_materials'])}",
+            className="small text-warning fw-bold mt-2",
+        ))
+    if plan["instructions_trimmed"]:
+        children.append(html.Div("기타 입력 내용을 예산에 맞게 줄였습니다.", className="small text-warning mt-1"))
+    if percent > 100:
+        children.append(html.Div(
+            "모델 한도를 넘습니다. 자료를 줄이거나 자동 제외를 켜세요." if not plan["dropped_materials"]
+            else "자료를 제외해도 모델 한도를 넘습니다. 더 큰 모델을 선택하세요.",
+            className="small text-danger fw-bold mt-2",
+        ))
+    return html.Div(children)
@@ -1,9 +1,22 @@
 # DB 연결 및 초기화 함수
 import sqlite3
-import pandas as pd
-from typing import Any, Dict, Optional
-import json
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+import hashlib
 import os
+import threading
+from contextlib import contextmanager
+
+from .db_migrations import run_migrations
+from .table_query import build_order_by, parse_filter_query
+from .search_query import FTS_TABLE, build_search_conditions
+from .db_pool import ConnectionPool
+from .report_cache import report_cache
+from . import serialization
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .report_schema import ReportData
 
 
 DB_PATH = os.path.join(
@@ -12,106 +25,481 @@ DB_PATH = os.path.join(
 )
 
 
-def get_db_connection() -> sqlite3.Connection:
-    """데이터베이스 커넥션을 반환합니다."""
-    return sqlite3.connect(DB_PATH)
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ConnectionPool:
+    """
+    현재 프로세스의 커넥션 풀을 반환합니다.
+    gunicorn이 워커를 fork했거나 DB_PATH가 바뀌었으면 새 풀을 만듭니다.
+    새 풀은 처음 만들 때 스키마를 최신 버전까지 마이그레이션하므로,
+    임포트 시점에 init_db()를 부를 필요가 없습니다. (이미 최신이면 user_version만 확인)
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.path != DB_PATH or not _pool.is_owned_by_current_process():
+            if _pool is not None:
+                _pool.close()
+                _pool = None
+            pool = ConnectionPool(DB_PATH)
+            conn = pool.acquire()
+            try:
+                run_migrations(conn)
+            finally:
+                pool.release(conn)
+            _pool = pool
+        return _pool
+
+
+@contextmanager
+def db_session() -> Iterator[sqlite3.Connection]:
+    """
+    풀에서 커넥션을 빌려 with 블록에 제공하고, 블록이 끝나면 반납합니다.
+    블록이 정상 종료되면 commit, 예외가 발생하면 rollback 합니다.
+    사용 예: with db_session() as conn: conn.execute(...)
+    """
+    pool = _get_pool()
+    conn = pool.acquire()
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        pool.release(conn)
+
+
+def close_db_pool() -> None:
+    """현재 프로세스의 커넥션 풀을 닫습니다. (종료 시 또는 DB 파일 교체 전)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
 
 def init_db() -> None:
-    """데이터베이스를 초기화하고 candidate_analysis 테이블을 생성합니다."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS candidate_analysis (
-            id TEXT PRIMARY KEY,
-            name TEXT,
-            evaluator TEXT,
-            interview_date TEXT,
-            json_data TEXT
+    """
+    데이터베이스를 초기화하고 최신 스키마 버전까지 마이그레이션합니다.
+    (첫 db_session()에서도 자동으로 수행되므로, 미리 만들어 두고 싶을 때만 호출)
+    """
+    with db_session() as conn:
+        run_migrations(conn)
+
+
+def build_report_fields(raw_llm_text: Optional[str]) -> Tuple[str, Optional[float], Optional[str]]:
+    """
+    LLM 원문을 한 번 파싱하여 (검증된 ReportData JSON, 종합점수, 채용추천)을 반환합니다.
+    파싱/검증에 실패하면 report_json은 빈 문자열('')로 표시하여 재시도하지 않습니다.
+    """
+    if not raw_llm_text or not raw_llm_text.strip():
+        return "", None, None
+    from .llm_report_parser import parse_llm_report
+
+    try:
+        parsed_result = parse_llm_report(raw_llm_text)
+    except Exception as e:
+        print(f"[DB] 보고서 파싱 실패: {e}")
+        return "", None, None
+    if not hasattr(parsed_result, "comprehensive_report"):
+        return "", None, None
+    report = parsed_result.comprehensive_report
+    return parsed_result.model_dump_json(), report.score, report.recommendation
+
+
+def content_hash(raw_llm_text: Optional[str], report_json: Optional[str] = "") -> str:
+    """
+    LLM 원문과 파싱 결과(report_json)의 sha256 (보고서/렌더/PDF/인쇄 캐시 키로 사용)
+    원문이 같아도 재파싱으로 report_json이 바뀌면 값이 바뀌므로 이전 캐시 항목은 쓰이지 않습니다.
+    """
+    digest = hashlib.sha256((raw_llm_text or "").encode("utf-8"))
+    digest.update(b"\0")
+    digest.update((report_json or "").encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _refresh_analytics_snapshot(candidate_ids: List[str]) -> None:
+    """저장/삭제된 후보자의 분석 스냅샷 행과 코호트 백분위 색인을 갱신합니다."""
+    from .analytics_snapshot import update_snapshot
+    from .cohort_index import cohort_index
+
+    batches = update_snapshot(candidate_ids)
+    if batches is None:
+        cohort_index.invalidate()
+    else:
+        cohort_index.apply(candidate_ids, batches)
+
+
+def backfill_report_columns(conn: sqlite3.Connection, raw_column: str = "raw_llm_text") -> int:
+    """
+    report_json이 아직 채워지지 않은(NULL) 행을 한 번만 파싱하여 비정규화 컬럼을 채웁니다.
+    커밋은 호출자가 담당하며, 반환값은 갱신된 행 수입니다.
+    """
+    rows = conn.execute(
+        f"SELECT id, {raw_column} FROM candidate_analysis WHERE report_json IS NULL"
+    ).fetchall()
+    for cid, raw_llm_text in rows:
+        report_json, score, recommendation = build_report_fields(raw_llm_text)
+        conn.execute(
+            "UPDATE candidate_analysis SET report_json = ?, overall_score = ?, "
+            "recommendation = ? WHERE id = ?",
+            (report_json, score, recommendation, cid)
         )
-    """)
-    conn.commit()
-    conn.close()
+    return len(rows)
+
 
 def save_candidate_data(data: Dict[str, Any]) -> None:
     """후보자 분석 결과를 데이터베이스에 저장합니다."""
-    conn = get_db_connection()
-    c = conn.cursor()
     cid = data.get("id")
-    name = data.get("name")
-    evaluator = data.get("evaluator")
-    interview_date = data.get("interview_date")
+    name = data.get("name") or ""
+    # 구버전 호출부는 LLM 원문을 evaluator 키로 전달합니다.
+    raw_llm_text = data.get("raw_llm_text", data.get("evaluator"))
+    interview_date = data.get("interview_date") or ""
     json_data = data.get("json_data")
 
     if isinstance(json_data, (dict, list)):
-        json_str = json.dumps(json_data, ensure_ascii=False)
+        json_str = serialization.dumps(json_data)
     elif isinstance(json_data, str):
         json_str = json_data
     else:
         json_str = "{}"
-    c.execute(
-        "INSERT OR REPLACE INTO candidate_analysis (id, name, evaluator, interview_date, json_data) VALUES (?, ?, ?, ?, ?)",
-        (cid, name, evaluator, interview_date, json_str)
+    # 원문이 바뀌면 보고서 컬럼도 함께 갱신해야 캐시/검색 색인이 어긋나지 않음
+    report_json, score, recommendation = build_report_fields(raw_llm_text)
+    # INSERT OR REPLACE는 삭제 트리거 없이 행을 교체해 검색 색인이 어긋나므로 UPSERT 사용
+    with db_session() as conn:
+        conn.execute(
+            "INSERT INTO candidate_analysis "
+            "(id, name, raw_llm_text, interview_date, json_data, "
+            "overall_score, recommendation, report_json, content_hash) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET "
+            "name = excluded.name, raw_llm_text = excluded.raw_llm_text, "
+            "interview_date = excluded.interview_date, json_data = excluded.json_data, "
+            "overall_score = excluded.overall_score, "
+            "recommendation = excluded.recommendation, "
+            "report_json = excluded.report_json, content_hash = excluded.content_hash",
+            (
+                cid, name, raw_llm_text, interview_date, json_str,
+                score, recommendation, report_json, content_hash(raw_llm_text, report_json)
+            )
+        )
+    report_cache.invalidate(cid)
+    _refresh_analytics_snapshot([cid])
+
+
+def _search_index_exists(conn: sqlite3.Connection) -> bool:
+    """전문 검색 색인(FTS5 테이블)이 만들어져 있는지 확인합니다."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (FTS_TABLE,)
+    ).fetchone()
+    return row is not None
+
+
+def _candidate_query_parts(
+    conn: sqlite3.Connection,
+    name: Optional[str] = None,
+    organization: Optional[str] = None,
+    position: Optional[str] = None,
+    filter_query: Optional[str] = None,
+    search: Optional[str] = None,
+) -> Tuple[str, List[Any], bool]:
+    """
+    검색 필터 입력값, 자유 검색어, DataTable filter_query를 하나의 FROM ... WHERE 절로 합칩니다.
+    반환값은 (SQL 절, 파라미터, 검색 순위(search_rank) 사용 여부)입니다.
+    """
+    match_expression, search_conditions, search_params = build_search_conditions(
+        search, name, organization, position,
+        fts_available=_search_index_exists(conn),
     )
-    conn.commit()
-    conn.close()
+    conditions, params = parse_filter_query(filter_query)
+    conditions += search_conditions
+    params += search_params
+
+    from_clause = "FROM candidate_analysis "
+    if match_expression:
+        # bm25 순위(rank)를 함께 가져와 정렬 기준이 없을 때 관련도 순으로 보여줌
+        from_clause += (
+            f"JOIN (SELECT rowid AS search_rowid, rank AS search_rank FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH ?) AS search "
+            "ON search.search_rowid = candidate_analysis.rowid "
+        )
+        params.insert(0, match_expression)
+    where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+    return from_clause + where, params, match_expression is not None
+
+
+_CANDIDATE_LIST_COLUMNS = (
+    "SELECT id, name, organization, position, interview_date, "
+    "COALESCE(overall_score, 0) AS overall_score, "
+    "COALESCE(recommendation, 'N/A') AS recommendation, "
+    "created_at "
+)
+
+
+def load_candidates(
+    name: Optional[str] = None,
+    organization: Optional[str] = None,
+    position: Optional[str] = None,
+    filter_query: Optional[str] = None,
+    search: Optional[str] = None,
+) -> "pd.DataFrame":
+    """
+    후보자 목록을 데이터프레임으로 불러옵니다. (저장 시 계산된 컬럼만 조회, 파싱 없음)
+    이름/지원조직/지원직급/자유 검색어가 주어지면 전문 검색 색인으로 필터링합니다.
+    """
+    import pandas as pd
 
-def load_candidates() -> pd.DataFrame:
-    """모든 후보자 데이터를 데이터프레임으로 불러옵니다."""
-    conn = get_db_connection()
     try:
-        df = pd.read_sql_query("SELECT * FROM candidate_analysis ORDER BY name ASC", conn)  # type: ignore
+        with db_session() as conn:
+            query_sql, params, ranked = _candidate_query_parts(
+                conn, name, organization, position, filter_query, search
+            )
+            order_by = "ORDER BY search_rank ASC, name ASC" if ranked else "ORDER BY name ASC"
+            return pd.read_sql_query(  # type: ignore
+                _CANDIDATE_LIST_COLUMNS + query_sql + order_by,
+                conn,
+                params=params,
+            )
     except sqlite3.DatabaseError:
-        df = pd.DataFrame()
-    conn.close()
-    return df
+        return pd.DataFrame()
+
+
+# 내보내기 컬럼 (_CANDIDATE_LIST_COLUMNS와 같은 순서)
+CANDIDATE_EXPORT_COLUMNS = (
+    "id", "name", "organization", "position", "interview_date",
+    "overall_score", "recommendation", "created_at",
+)
+
+
+def iter_candidate_rows(
+    name: Optional[str] = None,
+    organization: Optional[str] = None,
+    position: Optional[str] = None,
+    filter_query: Optional[str] = None,
+    search: Optional[str] = None,
+    batch_size: int = 500,
+) -> Iterator[List[Tuple[Any, ...]]]:
+    """
+    조회 조건에 맞는 후보자 목록을 batch_size행씩 나누어 반환합니다. (내보내기용, load_candidates와 같은 정렬)
+    전체 결과를 메모리에 올리지 않으며, 끝까지 읽거나 생성기를 닫을 때까지 커넥션을 사용합니다.
+    """
+    with db_session() as conn:
+        query_sql, params, ranked = _candidate_query_parts(
+            conn, name, organization, position, filter_query, search
+        )
+        order_by = "ORDER BY search_rank ASC, name ASC" if ranked else "ORDER BY name ASC"
+        cursor = conn.execute(_CANDIDATE_LIST_COLUMNS + query_sql + order_by, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
+
+
+def query_candidate_page(
+    page_current: int = 0,
+    page_size: int = 10,
+    sort_by: Optional[List[Dict[str, str]]] = None,
+    filter_query: Optional[str] = None,
+    name: Optional[str] = None,
+    organization: Optional[str] = None,
+    position: Optional[str] = None,
+    search: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    후보자 목록의 한 페이지만 조회합니다. (LIMIT/OFFSET, 서버 측 정렬/필터)
+    자유 검색어가 있고 표 정렬 기준이 없으면 검색 관련도(bm25) 순으로 정렬합니다.
+    반환값은 (현재 페이지 행 목록, 필터 조건에 맞는 전체 행 수)입니다.
+    """
+    page_size = max(int(page_size or 10), 1)
+    page_current = max(int(page_current or 0), 0)
+
+    try:
+        with db_session() as conn:
+            query_sql, params, ranked = _candidate_query_parts(
+                conn, name, organization, position, filter_query, search
+            )
+            order_by = build_order_by(sort_by, rank_expression="search_rank" if ranked else None)
+            total = conn.execute(f"SELECT COUNT(*) {query_sql}", params).fetchone()[0]
+            # 풀의 커넥션은 공유되므로 row_factory는 커서에만 지정
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            rows = cursor.execute(
+                _CANDIDATE_LIST_COLUMNS + f"{query_sql}{order_by} LIMIT ? OFFSET ?",
+                [*params, page_size, page_current * page_size],
+            ).fetchall()
+    except sqlite3.DatabaseError:
+        return [], 0
+    return [dict(row) for row in rows], total
 
 def delete_candidate(candidate_id: str) -> None:
     """특정 후보자를 ID로 삭제합니다."""
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("DELETE FROM candidate_analysis WHERE id = ?", (candidate_id,))
-    conn.commit()
-    conn.close()
+    with db_session() as conn:
+        conn.execute("DELETE FROM candidate_analysis WHERE id = ?", (candidate_id,))
+    report_cache.invalidate(candidate_id)
+    _refresh_analytics_snapshot([candidate_id])
 
 def load_candidate_json(candidate_id: str) -> Optional[Dict[str, Any]]:
     """특정 후보자의 json_data를 dict로 반환."""
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("SELECT json_data FROM candidate_analysis WHERE id = ?", (candidate_id,))
-    row = c.fetchone()
-    conn.close()
+    with db_session() as conn:
+        row = conn.execute(
+            "SELECT json_data FROM candidate_analysis WHERE id = ?", (candidate_id,)
+        ).fetchone()
     if not row:
         return None
     try:
-        return json.loads(row[0])
+        return serialization.loads(row[0])
     except Exception:
         return None
 
 def get_candidate_by_id(candidate_id: str) -> Optional[Dict[str, Any]]:
     """특정 후보자의 모든 정보를 dict로 반환."""
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("SELECT * FROM candidate_analysis WHERE id = ?", (candidate_id,))
-    row = c.fetchone()
-    conn.close()
+    with db_session() as conn:
+        c = conn.execute("SELECT * FROM candidate_analysis WHERE id = ?", (candidate_id,))
+        row = c.fetchone()
     if not row:
         return None
-    
+
     # 컬럼명과 값을 매핑
-    columns = ['id', 'name', 'evaluator', 'interview_date', 'json_data']
+    columns = [description[0] for description in c.description]
     return dict(zip(columns, row))
 
 def load_candidate_raw_llm_text(candidate_id: str) -> Optional[str]:
-    """특정 후보자의 LLM 결과 원문(evaluator 컬럼)을 반환."""
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("SELECT evaluator FROM candidate_analysis WHERE id = ?", (candidate_id,))
-    row = c.fetchone()
-    conn.close()
+    """특정 후보자의 LLM 결과 원문(raw_llm_text 컬럼)을 반환."""
+    with db_session() as conn:
+        row = conn.execute(
+            "SELECT raw_llm_text FROM candidate_analysis WHERE id = ?", (candidate_id,)
+        ).fetchone()
+    if row:
+        return row[0]
+    return None
+
+def load_content_hash(candidate_id: str) -> Optional[str]:
+    """특정 후보자의 content_hash(LLM 원문 + report_json sha256)를 반환."""
+    with db_session() as conn:
+        row = conn.execute(
+            "SELECT content_hash FROM candidate_analysis WHERE id = ?", (candidate_id,)
+        ).fetchone()
     if row:
         return row[0]
     return None
 
+def load_report_with_hash(candidate_id: str) -> "Tuple[Optional[str], Optional[ReportData]]":
+    """
+    후보자의 (content_hash, 검증된 ReportData)를 같은 행에서 읽어 반환합니다. 원문을 다시 파싱하지 않습니다.
+    두 값을 한 번의 SELECT로 읽으므로, 그 사이에 재저장/재파싱되어도 해시와 보고서가 어긋나지 않습니다.
+    (PDF/인쇄/렌더 캐시는 반환된 해시를 키로 사용)
+    1) (id, content_hash) 키로 프로세스 내 LRU 캐시 조회
+    2) 없으면 저장 시 만들어 둔 report_json 컬럼에서 복원 후 캐시에 저장
+    3) report_json이 없는 행(백필 전)이나 현재 스키마로 검증되지 않는 행(스키마 변경 후 reparse 전)만
+       원문을 파싱합니다.
+    후보자가 없으면 (None, None), 원문을 보고서로 변환할 수 없으면 (content_hash, None)을 반환합니다.
+    """
+    with db_session() as conn:
+        row = conn.execute(
+            "SELECT content_hash, report_json FROM candidate_analysis WHERE id = ?", (candidate_id,)
+        ).fetchone()
+    if row is None:
+        report_cache.invalidate(candidate_id)
+        return None, None
+    content_hash, report_json = row
+    key = (candidate_id, content_hash or "")
+    report_data = report_cache.get(key)
+    if report_data is not None:
+        return content_hash, report_data
+
+    from .llm_report_parser import parse_llm_report
+    from .report_schema import ReportData
+
+    from pydantic import ValidationError
+
+    use_raw = report_json is None
+    if report_json:
+        try:
+            report_data = ReportData.model_validate_json(report_json)
+        except ValidationError as e:
+            # 스키마가 바뀐 뒤 reparse 전인 행: 오류 대신 원문을 파싱해서 보여줌
+            print(f"[DB] report_json이 현재 스키마와 맞지 않아 원문을 파싱합니다: {candidate_id} ({e.error_count()}건)")
+            report_cache.invalidate(candidate_id)
+            use_raw = True
+    if use_raw:
+        # 백필 전 행 또는 스키마가 맞지 않는 행: 같은 내용(content_hash)일 때만 원문을 읽어 파싱
+        with db_session() as conn:
+            raw_row = conn.execute(
+                "SELECT raw_llm_text FROM candidate_analysis WHERE id = ? AND content_hash IS ?",
+                (candidate_id, content_hash)
+            ).fetchone()
+        if raw_row and raw_row[0]:
+            parsed_result = parse_llm_report(raw_row[0])
+            report_data = parsed_result if isinstance(parsed_result, ReportData) else None
+    if report_data is None:
+        return content_hash, None
+    report_cache.put(key, report_data)
+    return content_hash, report_data
+
+
+def load_report_data(candidate_id: str) -> "Optional[ReportData]":
+    """
+    후보자의 검증된 ReportData를 반환합니다. (load_report_with_hash 참고)
+    후보자가 없거나 원문을 보고서로 변환할 수 없으면 None을 반환합니다.
+    """
+    return load_report_with_hash(candidate_id)[1]
+
+
+# save_llm_analysis_result(s)의 행 값 순서
+AnalysisRow = Tuple[
+    str, str, str, str, str, Optional[float], Optional[str], str, str, str
+]
+
+# 같은 id로 다시 저장하면 내용만 갱신하고 created_at은 유지
+_UPSERT_ANALYSIS_SQL = (
+    "INSERT INTO candidate_analysis "
+    "(id, name, organization, position, interview_date, "
+    "overall_score, recommendation, raw_llm_text, report_json, content_hash) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET "
+    "name = excluded.name, organization = excluded.organization, "
+    "position = excluded.position, interview_date = excluded.interview_date, "
+    "overall_score = excluded.overall_score, "
+    "recommendation = excluded.recommendation, "
+    "raw_llm_text = excluded.raw_llm_text, report_json = excluded.report_json, "
+    "content_hash = excluded.content_hash"
+)
+
+
+def build_analysis_row(
+    name: str,
+    organization: str,
+    position: str,
+    interview_date: str,
+    raw_llm_text: str,
+    report_fields: Optional[Tuple[str, Optional[float], Optional[str]]] = None,
+) -> AnalysisRow:
+    """
+    저장할 한 행의 값을 만듭니다. report_fields가 없으면 원문을 파싱해 만듭니다.
+    id는 name과 date를 조합하여 생성합니다. (동명이인 구분)
+    """
+    report_json, score, recommendation = (
+        report_fields if report_fields is not None else build_report_fields(raw_llm_text)
+    )
+    return (
+        f"{name}_{interview_date}", name, organization, position, interview_date,
+        score, recommendation, raw_llm_text, report_json, content_hash(raw_llm_text, report_json),
+    )
+
+
+def save_llm_analysis_results(rows: List[AnalysisRow]) -> int:
+    """여러 후보자 행(build_analysis_row 결과)을 하나의 트랜잭션으로 저장하고 저장 행 수를 반환합니다."""
+    with db_session() as conn:
+        conn.executemany(_UPSERT_ANALYSIS_SQL, rows)
+    for row in rows:
+        report_cache.invalidate(row[0])
+    _refresh_analytics_snapshot([row[0] for row in rows])
+    return len(rows)
+
+
 def save_llm_analysis_result(
     name: str,
     organization: str,
@@ -121,25 +509,9 @@ def save_llm_analysis_result(
 ) -> None:
     """
     LLM 분석 탭에서 파싱 및 수정된 후보자 정보를 저장합니다.
-    organization과 position은 json_data에 저장합니다.
-    """
-    conn = get_db_connection()
-    c = conn.cursor()
-    
-    # id는 name과 date를 조합하여 생성 (동명이인 구분)
-    candidate_id = f"{name}_{interview_date}" 
-    
-    # 추가 정보를 JSON으로 묶음
-    json_data = json.dumps({
-        "organization": organization,
-        "position": position
-    }, ensure_ascii=False)
-
-    # 기존 스키마에 맞게 데이터 저장
-    # evaluator 필드에 raw_llm_text를 임시 저장
-    c.execute(
-        "INSERT OR REPLACE INTO candidate_analysis (id, name, evaluator, interview_date, json_data) VALUES (?, ?, ?, ?, ?)",
-        (candidate_id, name, raw_llm_text, interview_date, json_data)
-    )
-    conn.commit()
-    conn.close()
+    저장 시점에 원문을 한 번만 파싱하여 검증된 ReportData JSON과
+    종합점수/채용추천/지원조직/지원직급 컬럼을 함께 저장합니다.
+    """
+    # 파싱은 커넥션을 빌리기 전에 끝내서 쓰기 트랜잭션을 짧게 유지
+    row = build_analysis_row(name, organization, position, interview_date, raw_llm_text)
+    save_llm_analysis_results([row])
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+candidates.db 스키마 마이그레이션
+- PRAGMA user_version 값으로 현재 스키마 버전을 관리합니다.
+- MIGRATIONS 리스트의 i번째 함수가 버전 i+1로 올리는 단계이며, 각 단계는 하나의 트랜잭션으로 실행됩니다.
+- 새 마이그레이션은 리스트 끝에만 추가하고, 이미 배포된 단계는 수정하지 않습니다.
+"""
+
+import hashlib
+import json
+import sqlite3
+from typing import Callable, List
+
+
+def _create_base_table(conn: sqlite3.Connection) -> None:
+    """v1: 최초 candidate_analysis 테이블 (구버전 DB와 동일한 구조)"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS candidate_analysis (
+            id TEXT PRIMARY KEY,
+            name TEXT,
+            evaluator TEXT,
+            interview_date TEXT,
+            json_data TEXT
+        )
+    """)
+
+
+def _add_report_columns(conn: sqlite3.Connection) -> None:
+    """v2: 파싱된 ReportData JSON 및 비정규화 컬럼 추가 후 기존 행 백필"""
+    from .db import backfill_report_columns
+
+    report_columns = {
+        "report_json": "TEXT",
+        "overall_score": "REAL",
+        "recommendation": "TEXT",
+        "organization": "TEXT",
+        "position": "TEXT",
+    }
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(candidate_analysis)")}
+    for column, column_type in report_columns.items():
+        if column not in existing:
+            conn.execute(f"ALTER TABLE candidate_analysis ADD COLUMN {column} {column_type}")
+
+    # json_data에만 있던 지원조직/지원직급을 컬럼으로 이동
+    rows = conn.execute(
+        "SELECT id, json_data FROM candidate_analysis "
+        "WHERE organization IS NULL OR position IS NULL"
+    ).fetchall()
+    for cid, json_text in rows:
+        try:
+            extra = json.loads(json_text) if json_text else {}
+        except (json.JSONDecodeError, TypeError):
+            extra = {}
+        if not isinstance(extra, dict):
+            extra = {}
+        conn.execute(
+            "UPDATE candidate_analysis SET organization = ?, position = ? WHERE id = ?",
+            (extra.get("organization", ""), extra.get("position", ""), cid)
+        )
+    backfill_report_columns(conn, raw_column="evaluator")
+
+
+def _rebuild_typed_table(conn: sqlite3.Connection) -> None:
+    """
+    v3: 타입/기본값이 지정된 컬럼 구조로 테이블을 재구성하고 조회용 인덱스를 생성합니다.
+    - evaluator(실제로는 LLM 원문) 컬럼을 raw_llm_text로 이름 변경
+    - created_at 추가 (기존 행은 마이그레이션 시점으로 기록)
+    """
+    # 중단된 이전 시도가 남긴 임시 테이블이 있으면 지우고 다시 만듦
+    conn.execute("DROP TABLE IF EXISTS candidate_analysis_v3")
+    conn.execute("""
+        CREATE TABLE candidate_analysis_v3 (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL DEFAULT '',
+            organization TEXT NOT NULL DEFAULT '',
+            position TEXT NOT NULL DEFAULT '',
+            interview_date TEXT NOT NULL DEFAULT '',
+            overall_score REAL,
+            recommendation TEXT,
+            raw_llm_text TEXT,
+            report_json TEXT,
+            json_data TEXT,
+            created_at TEXT NOT NULL DEFAULT (datetime('now', 'localtime'))
+        )
+    """)
+    conn.execute("""
+        INSERT INTO candidate_analysis_v3 (
+            id, name, organization, position, interview_date,
+            overall_score, recommendation, raw_llm_text, report_json, json_data
+        )
+        SELECT
+            id, COALESCE(name, ''), COALESCE(organization, ''),
+            COALESCE(position, ''), COALESCE(interview_date, ''),
+            overall_score, recommendation, evaluator, report_json, json_data
+        FROM candidate_analysis
+    """)
+    conn.execute("DROP TABLE candidate_analysis")
+    conn.execute("ALTER TABLE candidate_analysis_v3 RENAME TO candidate_analysis")
+    for column in (
+        "name", "organization", "position", "interview_date",
+        "overall_score", "recommendation", "created_at",
+    ):
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_candidate_analysis_{column} "
+            f"ON candidate_analysis ({column})"
+        )
+
+
+# candidate_search(FTS5) 색인 컬럼
+SEARCH_INDEX_COLUMNS = "name, organization, position, summary, decision_points, analysis"
+
+
+def _search_index_values(row: str) -> str:
+    """
+    candidate_search에 넣을 값 목록 SQL (row는 'new' 또는 테이블명)
+    report_json이 비어 있거나 JSON이 아니면 보고서 본문 컬럼은 빈 문자열로 둡니다.
+    """
+    def from_report(expression: str) -> str:
+        return (
+            f"CASE WHEN json_valid({row}.report_json) "
+            f"THEN COALESCE({expression}, '') ELSE '' END"
+        )
+
+    return ", ".join([
+        f"{row}.rowid", f"{row}.name", f"{row}.organization", f"{row}.position",
+        from_report(f"json_extract({row}.report_json, '$.comprehensive_report.summary')"),
+        from_report(
+            f"(SELECT group_concat(value, ' ') FROM json_tree({row}.report_json, "
+            "'$.decision_points') WHERE type = 'text' AND key IN ('title', 'analysis'))"
+        ),
+        from_report(
+            f"(SELECT group_concat(value, ' ') FROM json_tree({row}.report_json, "
+            "'$.analysis_items') WHERE type = 'text' "
+            "AND key IN ('title', 'analysis', 'evidence'))"
+        ),
+    ])
+
+
+def _create_search_index(conn: sqlite3.Connection) -> None:
+    """
+    v4: 이름/지원조직/지원직급/종합요약/강점·리스크/분석 내용을 색인하는 FTS5 테이블과
+    candidate_analysis 변경 시 색인을 갱신하는 트리거를 생성합니다.
+    - 한글은 형태소 분리 없이 부분일치가 필요하므로 trigram 토크나이저를 사용합니다.
+      (trigram을 지원하지 않는 SQLite는 unicode61로 대체)
+    - FTS5가 없는 SQLite에서는 색인을 만들지 않으며, 검색은 LIKE로 동작합니다.
+    """
+    columns = SEARCH_INDEX_COLUMNS
+    for tokenizer in ("trigram", "unicode61"):
+        try:
+            conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS candidate_search USING fts5("
+                f"{columns}, tokenize = '{tokenizer}')"
+            )
+            break
+        except sqlite3.OperationalError as e:
+            print(f"[DB] FTS5 {tokenizer} 토크나이저 사용 불가: {e}")
+    else:
+        print("[DB] FTS5를 사용할 수 없어 전문 검색 색인을 건너뜁니다.")
+        return
+
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS candidate_search_ai AFTER INSERT ON candidate_analysis BEGIN
+            INSERT INTO candidate_search (rowid, {columns})
+            VALUES ({_search_index_values('new')});
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS candidate_search_ad AFTER DELETE ON candidate_analysis BEGIN
+            DELETE FROM candidate_search WHERE rowid = old.rowid;
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS candidate_search_au
+        AFTER UPDATE OF name, organization, position, report_json ON candidate_analysis
+        BEGIN
+            DELETE FROM candidate_search WHERE rowid = old.rowid;
+            INSERT INTO candidate_search (rowid, {columns})
+            VALUES ({_search_index_values('new')});
+        END
+    """)
+    # 색인이 이미 있던 경우에도 같은 결과가 되도록 비우고 채움
+    conn.execute("DELETE FROM candidate_search")
+    conn.execute(
+        f"INSERT INTO candidate_search (rowid, {columns}) "
+        f"SELECT {_search_index_values('candidate_analysis')} FROM candidate_analysis"
+    )
+
+
+def rebuild_search_index(conn: sqlite3.Connection) -> int:
+    """
+    candidate_search 색인을 candidate_analysis 내용으로 다시 만들고 색인 세그먼트를 병합합니다.
+    색인 테이블이 없으면(FTS5 미지원) 아무것도 하지 않고 0을 반환합니다. 커밋은 호출자가 담당합니다.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'candidate_search'"
+    ).fetchone()
+    if not exists:
+        return 0
+    conn.execute("DELETE FROM candidate_search")
+    conn.execute(
+        f"INSERT INTO candidate_search (rowid, {SEARCH_INDEX_COLUMNS}) "
+        f"SELECT {_search_index_values('candidate_analysis')} FROM candidate_analysis"
+    )
+    conn.execute("INSERT INTO candidate_search (candidate_search) VALUES ('optimize')")
+    return conn.execute("SELECT COUNT(*) FROM candidate_search").fetchone()[0]
+
+
+def _v5_content_hash(raw_llm_text: str) -> str:
+    """
+    v5 당시의 content_hash 정의 (LLM 원문 sha256)
+    db.content_hash는 이후 report_json까지 포함하도록 바뀌었으므로, 이미 배포된 단계의 결과가
+    달라지지 않도록 마이그레이션 안에 고정합니다. (값은 캐시 키로만 쓰이며 저장/재파싱 시 새 정의로 갱신됨)
+    """
+    return hashlib.sha256((raw_llm_text or "").encode("utf-8")).hexdigest()
+
+
+def _add_content_hash(conn: sqlite3.Connection) -> None:
+    """v5: 보고서 캐시 키로 쓰는 LLM 원문 sha256 컬럼 추가 후 기존 행 백필"""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(candidate_analysis)")}
+    if "content_hash" not in existing:
+        conn.execute("ALTER TABLE candidate_analysis ADD COLUMN content_hash TEXT")
+    rows = conn.execute("SELECT id, raw_llm_text FROM candidate_analysis").fetchall()
+    for cid, raw_llm_text in rows:
+        conn.execute(
+            "UPDATE candidate_analysis SET content_hash = ? WHERE id = ?",
+            (_v5_content_hash(raw_llm_text), cid)
+        )
+
+
+MIGRATIONS: List[Callable[[sqlite3.Connection], None]] = [
+    _create_base_table,
+    _add_report_columns,
+    _rebuild_typed_table,
+    _create_search_index,
+    _add_content_hash,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """DB의 현재 스키마 버전(PRAGMA user_version)을 반환합니다."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def run_migrations(conn: sqlite3.Connection) -> int:
+    """
+    아직 적용되지 않은 마이그레이션을 순서대로 적용하고 최종 스키마 버전을 반환합니다.
+    실패한 단계는 롤백되며 user_version은 직전 성공 단계에 머뭅니다.
+    여러 프로세스(gunicorn 워커, CLI)가 동시에 호출해도 각 단계는 쓰기 잠금(BEGIN IMMEDIATE)을 잡은 뒤
+    버전을 다시 읽으므로 한 번만 적용됩니다. (먼저 적용한 프로세스가 있으면 건너뜀)
+    """
+    version = get_schema_version(conn)
+    while version < SCHEMA_VERSION:
+        target_version = version + 1
+        migration = MIGRATIONS[target_version - 1]
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            version = get_schema_version(conn)
+            if version >= target_version:
+                conn.commit()
+                continue
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {target_version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            print(f"[DB] 마이그레이션 v{target_version} ({migration.__name__}) 실패")
+            raise
+        version = target_version
+        print(f"[DB] 마이그레이션 v{target_version} ({migration.__name__}) 적용 완료")
+    return version
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 커넥션 풀
+- 프로세스마다 하나의 풀을 두고, 요청(스레드)은 커넥션을 빌렸다가 반납합니다.
+- 모든 커넥션은 WAL 저널, busy_timeout, synchronous=NORMAL로 설정되어
+  여러 gunicorn 워커가 동시에 읽고 써도 "database is locked" 오류 없이 대기합니다.
+- 커넥션을 재사용하므로 sqlite3 모듈의 prepared statement 캐시(cached_statements)도
+  요청 사이에 유지됩니다.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from typing import List
+
+# 잠금 대기 최대 시간 (밀리초)
+BUSY_TIMEOUT_MS = 5000
+# 커넥션별로 재사용할 prepared statement 개수
+CACHED_STATEMENTS = 256
+# 풀에 보관할 유휴 커넥션 최대 개수 (초과분은 반납 시 닫음)
+DEFAULT_POOL_SIZE = 8
+
+
+def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """새 커넥션에 동시성 관련 PRAGMA를 적용합니다."""
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
+
+class ConnectionPool:
+    """
+    한 DB 파일에 대한 프로세스 내 커넥션 풀입니다.
+    fork 이후 자식 프로세스는 부모의 커넥션을 쓰면 안 되므로 생성한 프로세스 id를 기억해 두고,
+    다른 프로세스에서 사용하면 호출자가 새 풀을 만들어야 합니다. (is_owned_by_current_process)
+    """
+
+    def __init__(self, path: str, max_size: int = DEFAULT_POOL_SIZE):
+        self.path = path
+        self.pid = os.getpid()
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._all: List[sqlite3.Connection] = []
+
+    def is_owned_by_current_process(self) -> bool:
+        return self.pid == os.getpid()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            cached_statements=CACHED_STATEMENTS,
+            # 풀에서 빌린 커넥션은 한 번에 한 스레드만 사용하므로 스레드 간 전달을 허용
+            check_same_thread=False,
+        )
+        configure_connection(conn)
+        with self._lock:
+            self._all.append(conn)
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """유휴 커넥션을 꺼내고, 없으면 새로 만듭니다."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """커넥션을 풀에 반납합니다. 진행 중인 트랜잭션은 롤백합니다."""
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            self._discard(conn)
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if conn in self._all:
+                self._all.remove(conn)
+        conn.close()
+
+    def close(self) -> None:
+        """풀이 만든 모든 커넥션을 닫습니다. (현재 프로세스 소유일 때만)"""
+        if not self.is_owned_by_current_process():
+            return
+        with self._lock:
+            connections, self._all = self._all, []
+        for conn in connections:
+            conn.close()
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
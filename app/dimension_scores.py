@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+통합 인재 평가 모델 5대 차원 점수 계산
+- 분석 항목(category, score) 목록을 차원별 평균 벡터로 변환합니다. (NumPy)
+- 차원 순서는 레이더 차트와 같으며, 항목이 없는 차원은 NaN입니다.
+- 보고서 렌더러(화면/인쇄/PDF)는 dimension_profile()로 보고서당 한 번 DimensionProfile을 만들어
+  차트/표 컴포넌트에 인자로 넘깁니다.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 5대 차원 순서 (레이더 차트 표시 순서와 동일)
+DIMENSIONS = ("CAPABILITY", "PERFORMANCE", "POTENTIAL", "PERSONALITY", "FIT")
+DIMENSION_INDEX = {dimension: i for i, dimension in enumerate(DIMENSIONS)}
+
+# 종합 가중평균 가중치 (llm_report_parser.calculate_weighted_score와 동일)
+DIMENSION_WEIGHTS = np.array([0.25, 0.25, 0.20, 0.15, 0.15])
+
+
+def _dimension_codes(categories: Sequence[str]) -> np.ndarray:
+    """카테고리별 차원 번호 (5대 차원이 아니면 -1)"""
+    return np.fromiter(
+        (DIMENSION_INDEX.get(category, -1) for category in categories),
+        dtype=np.int64, count=len(categories),
+    )
+
+
+def _grouped_means(codes: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(차원별 평균, 차원별 항목 수). 항목이 없는 차원의 평균은 NaN"""
+    valid = codes >= 0
+    totals = np.bincount(codes[valid], weights=values[valid], minlength=len(DIMENSIONS))
+    counts = np.bincount(codes[valid], minlength=len(DIMENSIONS))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, totals / counts, np.nan), counts
+
+
+def dimension_means(categories: Sequence[str], scores: Sequence[float]) -> np.ndarray:
+    """차원별 평균 점수 (길이 5, 항목이 없는 차원은 NaN)"""
+    return _grouped_means(_dimension_codes(categories), np.asarray(scores, dtype=np.float64))[0]
+
+
+def item_dimension_means(analysis_items: Iterable[Any]) -> np.ndarray:
+    """AnalysisItem 또는 dict 목록의 차원별 평균 점수"""
+    return DimensionProfile(analysis_items).means
+
+
+def weighted_score(means: np.ndarray) -> np.ndarray:
+    """
+    차원별 평균(마지막 축 길이 5)의 가중평균. 항목이 없는 차원은 0점으로 계산합니다.
+    (n, 5) 행렬을 넣으면 후보자별 점수 n개를 반환합니다.
+    """
+    return np.round(np.nan_to_num(means, nan=0.0) @ DIMENSION_WEIGHTS, 2)
+
+
+def as_dict(means: np.ndarray) -> Dict[str, float]:
+    """차원별 평균 벡터를 {차원: 점수} dict로 변환합니다. (NaN 차원은 제외)"""
+    return {
+        dimension: float(value)
+        for dimension, value in zip(DIMENSIONS, means)
+        if not np.isnan(value)
+    }
+
+
+class DimensionProfile:
+    """
+    한 보고서의 분석 항목을 5대 차원별로 한 번 집계한 결과입니다.
+    항목 순서는 analysis_items 순서이며, 차원 밖(category가 5대 차원이 아닌) 항목은 code가 -1입니다.
+    """
+
+    def __init__(self, analysis_items: Iterable[Any]):
+        self.items: List[Any] = list(analysis_items)
+        categories: List[str] = []
+        scores: List[float] = []
+        for item in self.items:
+            if isinstance(item, dict):
+                categories.append(item.get("category", ""))
+                scores.append(item.get("score", 0) or 0)
+            else:
+                categories.append(getattr(item, "category", ""))
+                scores.append(getattr(item, "score", 0) or 0)
+        self.codes = _dimension_codes(categories)
+        self.scores = np.asarray(scores, dtype=np.float64)
+        self.means, self.counts = _grouped_means(self.codes, self.scores)
+
+    @property
+    def filled_means(self) -> np.ndarray:
+        """차원별 평균 (항목이 없는 차원은 0점, 레이더 차트용)"""
+        return np.nan_to_num(self.means, nan=0.0)
+
+    def ranked_dimensions(self) -> List[int]:
+        """항목이 있는 차원 번호를 평균 점수 높은 순으로 (같으면 DIMENSIONS 순서)"""
+        present = np.flatnonzero(self.counts)
+        return present[np.argsort(-self.means[present], kind="stable")].tolist()
+
+    def dimension_items(self, dimension: int, by_score: bool = True) -> List[int]:
+        """차원에 속한 항목 번호 (by_score이면 점수 높은 순, 아니면 원래 순서)"""
+        indices = np.flatnonzero(self.codes == dimension)
+        if by_score:
+            indices = indices[np.argsort(-self.scores[indices], kind="stable")]
+        return indices.tolist()
+
+    def top_item(self) -> Optional[Any]:
+        """전체 항목 중 점수가 가장 높은 항목 (같으면 앞의 항목)"""
+        return self.items[int(np.argmax(self.scores))] if self.items else None
+
+    def bottom_item(self) -> Optional[Any]:
+        """전체 항목 중 점수가 가장 낮은 항목 (같으면 앞의 항목)"""
+        return self.items[int(np.argmin(self.scores))] if self.items else None
+
+
+def dimension_profile(analysis_items: Iterable[Any]) -> DimensionProfile:
+    """
+    analysis_items의 DimensionProfile을 만듭니다.
+    보고서 렌더러의 맨 위에서 한 번 호출하고 결과를 컴포넌트에 넘기세요. (컴포넌트에서 다시 부르지 않음)
+    같은 보고서를 다시 그리는 경우는 (id, content_hash) 키의 렌더/PDF 캐시가 담당합니다.
+    """
+    return DimensionProfile(analysis_items)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+보고서 파일 캐시(PDF, 인쇄 HTML) 공통 처리
+- 파일은 같은 디렉터리의 고유한 임시 파일(mkstemp)에 쓴 뒤 os.replace로 바꾸므로,
+  여러 스레드/프로세스가 같은 파일을 동시에 만들어도 서로의 임시 파일을 덮어쓰지 않습니다.
+- 같은 프로세스에서 같은 파일을 동시에 요청하면 key_lock으로 한 번만 만들고 나머지는 결과를 씁니다.
+- 파일 수가 한도를 넘으면 최근 사용 시각(mtime, 조회 시 touch로 갱신)이 오래된 것부터 지웁니다.
+"""
+
+import os
+import tempfile
+import threading
+import weakref
+from typing import Optional
+
+_key_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = weakref.WeakValueDictionary()
+_key_locks_guard = threading.Lock()
+
+
+def key_lock(path: str) -> threading.Lock:
+    """
+    캐시 파일 경로별 잠금 (같은 프로세스 안에서 같은 파일을 한 번만 만들도록)
+    잠금을 쥐고 있는 동안만 유지되며, 아무도 쓰지 않으면 자동으로 사라집니다.
+    """
+    with _key_locks_guard:
+        lock = _key_locks.get(path)
+        if lock is None:
+            lock = threading.Lock()
+            _key_locks[path] = lock
+        return lock
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """path의 디렉터리를 만들고, 고유한 임시 파일에 data를 쓴 뒤 path로 바꿉니다."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def touch(path: str) -> Optional[str]:
+    """
+    캐시 파일의 최근 사용 시각을 갱신해 정리 대상에서 뒤로 미루고 path를 반환합니다.
+    파일이 없으면(그 사이 정리된 경우 포함) None
+    """
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    return path
+
+
+def prune_files(directory: str, suffix: str, max_files: int) -> int:
+    """directory의 suffix 파일이 max_files를 넘으면 오래 쓰지 않은 파일부터 지우고 지운 개수를 반환합니다."""
+    try:
+        entries = [entry for entry in os.scandir(directory) if entry.name.endswith(suffix)]
+    except OSError:
+        return 0
+    if len(entries) <= max_files:
+        return 0
+    mtimes = {}
+    for entry in entries:
+        try:
+            mtimes[entry.path] = entry.stat().st_mtime
+        except OSError:
+            pass
+    removed = 0
+    for path in sorted(mtimes, key=mtimes.get)[:len(mtimes) - max_files]:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+LLM 분석 결과 일괄 가져오기
+- 여러 파일(디렉터리) 또는 JSONL 스트림을 읽어 후보자 정보 추출과 보고서 파싱을 병렬로 수행하고,
+  통과한 레코드를 하나의 트랜잭션으로 저장합니다.
+- CLI(`python -m app.cli import`)와 'LLM 분석 결과 입력' 탭의 파일 업로드가 함께 사용합니다.
+
+JSONL 한 줄은 다음 중 하나입니다.
+- LLM 응답 JSON 객체 그대로 (candidate_info 포함)
+- {"raw_llm_text": "LLM 응답 원문", "name": ..., "organization": ..., "position": ...,
+   "interview_date": ...}  (원문 외 필드는 선택이며, 있으면 추출값 대신 사용)
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypedDict
+)
+
+from .serialization import JSONDecodeError, loads
+
+# 디렉터리에서 읽을 파일 확장자 (.jsonl은 줄 단위 레코드로 처리)
+SUPPORTED_EXTENSIONS = (".txt", ".md", ".json", ".jsonl")
+
+# 저장에 필요한 후보자 정보 필드 (LLM 분석 탭의 필수 입력과 동일)
+REQUIRED_FIELDS = ("name", "organization", "position", "interview_date")
+_FIELD_LABELS = {
+    "name": "이름", "organization": "지원조직",
+    "position": "지원직급", "interview_date": "면접일",
+}
+
+# (출처, LLM 원문, 직접 지정한 후보자 정보)
+ImportRecord = Tuple[str, str, Dict[str, str]]
+
+
+class ImportSummary(TypedDict):
+    total: int
+    imported: int
+    duplicates: int
+    rejected: List[Tuple[str, str]]
+    bytes: int
+    elapsed: float
+
+
+def decode_text(data: bytes) -> str:
+    """업로드/파일 내용을 문자열로 변환합니다. (UTF-8, BOM 포함 UTF-8, CP949 순으로 시도)"""
+    for encoding in ("utf-8-sig", "cp949"):
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return data.decode("utf-8", errors="replace")
+
+
+def iter_jsonl(lines: Iterable[str], source: str = "stdin") -> Iterator[ImportRecord]:
+    """JSONL 줄 스트림을 레코드로 변환합니다. 빈 줄은 건너뜁니다."""
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        label = f"{source}:{line_no}"
+        try:
+            obj = loads(line)
+        except JSONDecodeError:
+            # JSON이 아닌 줄도 원문으로 넘겨 거부 사유가 요약에 남도록 함
+            yield label, line, {}
+            continue
+        if isinstance(obj, dict) and isinstance(obj.get("raw_llm_text"), str):
+            overrides = {
+                field: str(obj[field]) for field in REQUIRED_FIELDS if obj.get(field)
+            }
+            yield label, obj["raw_llm_text"], overrides
+        else:
+            yield label, line, {}
+
+
+def iter_paths(paths: Sequence[str]) -> Iterator[ImportRecord]:
+    """파일/디렉터리 경로 목록을 레코드로 변환합니다. 디렉터리는 지원 확장자 파일만 읽습니다."""
+    for path in paths:
+        if os.path.isdir(path):
+            file_paths = sorted(
+                os.path.join(root, filename)
+                for root, _, filenames in os.walk(path)
+                for filename in filenames
+                if filename.lower().endswith(SUPPORTED_EXTENSIONS)
+            )
+        else:
+            file_paths = [path]
+        for file_path in file_paths:
+            if file_path.lower().endswith(".jsonl"):
+                with open(file_path, "rb") as f:
+                    yield from iter_jsonl(
+                        (decode_text(line) for line in f), source=file_path
+                    )
+            else:
+                with open(file_path, "rb") as f:
+                    yield file_path, decode_text(f.read()), {}
+
+
+def iter_uploads(filenames: Sequence[str], contents: Sequence[str]) -> Iterator[ImportRecord]:
+    """dcc.Upload(multiple=True)의 파일명/내용(data URL) 목록을 레코드로 변환합니다."""
+    import base64
+
+    for filename, content in zip(filenames, contents):
+        data = base64.b64decode(content.split(",", 1)[-1])
+        text = decode_text(data)
+        if filename.lower().endswith(".jsonl"):
+            yield from iter_jsonl(text.splitlines(), source=filename)
+        else:
+            yield filename, text, {}
+
+
+def _prepare_record(record: ImportRecord) -> Tuple[str, Optional[Any], Optional[str]]:
+    """
+    (프로세스 풀 작업자) 레코드 하나를 파싱하여 (출처, 저장할 행, 거부 사유)를 반환합니다.
+    보고서로 변환할 수 없거나 필수 후보자 정보가 없으면 거부합니다.
+    """
+    from .db import build_analysis_row
+    from .llm_report_parser import parse_llm_report
+    from .report_schema import ReportData
+    from .utils_llm_parse import clean_value
+
+    source, raw_llm_text, overrides = record
+    if not raw_llm_text or not raw_llm_text.strip():
+        return source, None, "내용이 비어 있습니다"
+    try:
+        parsed_result = parse_llm_report(raw_llm_text)
+    except Exception as e:
+        return source, None, f"보고서 파싱 오류: {e}"
+    if not isinstance(parsed_result, ReportData):
+        error = parsed_result.get("error") if isinstance(parsed_result, dict) else None
+        return source, None, f"보고서 형식으로 변환할 수 없습니다 ({error or '검증 실패'})"
+
+    # LLM 분석 탭과 같은 방식으로 "자료기준:" 같은 접두어를 제거
+    info = parsed_result.candidate_info
+    candidate = {field: clean_value(getattr(info, field, "") or "") for field in REQUIRED_FIELDS}
+    candidate.update(overrides)
+    missing = [_FIELD_LABELS[field] for field in REQUIRED_FIELDS if not candidate.get(field)]
+    if missing:
+        return source, None, f"필수 정보 누락: {', '.join(missing)}"
+
+    report = parsed_result.comprehensive_report
+    row = build_analysis_row(
+        candidate["name"], candidate["organization"], candidate["position"],
+        candidate["interview_date"], raw_llm_text,
+        report_fields=(parsed_result.model_dump_json(), report.score, report.recommendation),
+    )
+    return source, row, None
+
+
+def _chunks(records: Iterable[ImportRecord], size: int) -> Iterator[List[ImportRecord]]:
+    chunk: List[ImportRecord] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_records(
+    records: Iterable[ImportRecord],
+    workers: int = 1,
+    chunk_size: int = 64,
+    progress: Optional[Any] = None,
+    initializer: Optional[Callable[[], None]] = None,
+) -> ImportSummary:
+    """
+    레코드 스트림을 chunk_size개씩 읽어 workers개 프로세스에서 파싱하고,
+    통과한 레코드 전체를 하나의 트랜잭션으로 저장합니다.
+    같은 id(이름_면접일)가 여러 번 나오면 마지막 레코드를 저장합니다.
+    progress가 주어지면 청크마다 progress(처리 수, 통과 수, 거부 수)를 호출합니다.
+    initializer는 작업자 프로세스 시작 시 실행됩니다. (로그 설정 등)
+    """
+    from .db import save_llm_analysis_results
+
+    started = time.perf_counter()
+    rows: Dict[str, Any] = {}
+    rejected: List[Tuple[str, str]] = []
+    total = duplicates = total_bytes = 0
+
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=initializer)
+    try:
+        for chunk in _chunks(records, chunk_size):
+            total += len(chunk)
+            total_bytes += sum(len(raw.encode("utf-8")) for _, raw, _ in chunk)
+            if executor is not None:
+                map_chunksize = max(len(chunk) // (workers * 4), 1)
+                results = executor.map(_prepare_record, chunk, chunksize=map_chunksize)
+            else:
+                results = map(_prepare_record, chunk)
+            for source, row, reason in results:
+                if row is None:
+                    rejected.append((source, reason or "알 수 없는 오류"))
+                    continue
+                if row[0] in rows:
+                    duplicates += 1
+                rows[row[0]] = row
+            if progress is not None:
+                progress(total, len(rows), len(rejected))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    imported = save_llm_analysis_results(list(rows.values())) if rows else 0
+    return {
+        "total": total,
+        "imported": imported,
+        "duplicates": duplicates,
+        "rejected": rejected,
+        "bytes": total_bytes,
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+def format_import_summary(summary: ImportSummary) -> str:
+    """가져오기 결과를 한 줄 요약 문자열로 만듭니다. (처리량 포함)"""
+    elapsed = max(summary["elapsed"], 1e-9)
+    text = (
+        f"{summary['total']}건 중 {summary['imported']}건 저장, "
+        f"{len(summary['rejected'])}건 거부"
+    )
+    if summary["duplicates"]:
+        text += f", 중복 id {summary['duplicates']}건은 마지막 레코드로 저장"
+    return text + (
+        f" ({summary['elapsed']:.2f}초, {summary['total'] / elapsed:.1f}건/초, "
+        f"{summary['bytes'] / 1024 / 1024 / elapsed:.1f}MB/초)"
+    )
+
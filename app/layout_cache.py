@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+정적 레이아웃 캐시
+- 메인 레이아웃과 탭 레이아웃은 DB 조회 결과 없이 항상 같은 컴포넌트 트리이므로,
+  프로세스마다 한 번만 만들고 Dash가 응답으로 보내는 형태({type, namespace, props} dict)로 바꿔 둡니다.
+- 콜백은 캐시된 dict를 그대로 반환하므로 탭을 옮길 때마다 컴포넌트 생성/속성 검증과
+  to_plotly_json 순회를 반복하지 않습니다. (목록, 그래프 등 동적인 부분은 각 탭의 콜백이 채움)
+- 반환된 dict는 여러 요청이 공유하므로 수정하면 안 됩니다.
+"""
+
+import threading
+from typing import Any, Callable, Dict
+
+from dash.development.base_component import Component
+
+_layouts: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def component_tree(value: Any) -> Any:
+    """컴포넌트(와 그 안의 리스트/dict)를 Dash 응답과 같은 JSON 호환 dict 트리로 바꿉니다."""
+    if isinstance(value, Component):
+        tree = value.to_plotly_json()
+        tree["props"] = {name: component_tree(prop) for name, prop in tree["props"].items()}
+        return tree
+    if isinstance(value, (list, tuple)):
+        return [component_tree(item) for item in value]
+    if isinstance(value, dict):
+        return {key: component_tree(item) for key, item in value.items()}
+    return value
+
+
+def static_layout(name: str, builder: Callable[[], Component]) -> Any:
+    """name으로 캐시된 레이아웃을 반환합니다. 없으면 builder()로 만들어 저장합니다."""
+    layout = _layouts.get(name)
+    if layout is None:
+        with _lock:
+            layout = _layouts.get(name)
+            if layout is None:
+                layout = _layouts[name] = component_tree(builder())
+    return layout
+
@@ -10,6 +10,7 @@ from typing import Dict, Any, List, Optional, Union
 from pydantic import ValidationError
 from app.report_schema import ReportData
 from app.utils_llm_parse import (
+    clean_analysis_report,
     remove_citation_markers,
     safe_json_parse
 )
@@ -246,15 +247,18 @@ def parse_llm_response(response_text: str) -> Union[ReportData, Dict[str, Any]]:
     logger.info("LLM 응답 파싱 시작")
     
     try:
-        # 1. 인용 마커 제거
-        cleaned_text = remove_citation_markers(response_text)
-        logger.info("인용 마커 제거 완료")
-        
-        # 2. JSON 파싱
-        json_data = safe_json_parse(cleaned_text)
+        # 1. JSON 파싱 (원문 그대로)
+        json_data = safe_json_parse(response_text)
         if not json_data:
+            # 문자열 밖에 인용 마커가 끼어 JSON이 깨진 경우에만 원문에서 제거 후 재시도
+            json_data = safe_json_parse(remove_citation_markers(response_text))
+        if not json_data or not isinstance(json_data, dict):
             raise ValueError("JSON 파싱 실패")
         
+        # 2. 인용 마커 제거 (디코딩된 문자열 값에만 적용)
+        json_data = clean_analysis_report(json_data)
+        logger.info("인용 마커 제거 완료")
+        
         # 3. 분석 항목 보정
         if 'analysis_items' in json_data:
             json_data['analysis_items'] = fix_analysis_item_categories(
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""
+채용위원회용 보고서 묶음 (여러 후보자 PDF를 한 파일로)
+- 후보자 id × 보고서 유형마다 pdf_report의 디스크 캐시를 먼저 확인하고,
+  캐시에 없는 문서만 프로세스 풀에서 만듭니다.
+- 모은 PDF는 작업 디렉터리(packets/parts_*)에 하드 링크(안 되면 복사)해 두고 병합하므로,
+  그 사이 다른 요청이 PDF 캐시를 정리해도 묶음에서 빠지지 않습니다.
+- 결과는 책갈피가 있는 하나의 PDF(PyMuPDF로 병합) 또는 문서별 PDF를 담은 zip입니다.
+- 화면에서는 백그라운드 스레드로 만들고, 진행 상태를 작업별 JSON 파일에 기록합니다.
+  (gunicorn 등 여러 프로세스에서도 상태 조회와 다운로드가 같은 파일을 봄)
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypedDict
+
+from . import db
+from .pdf_report import PDF_REPORT_TYPES, cached_pdf_path, get_pdf_path, pdf_cache_dir
+from .serialization import JSONDecodeError, dumps_bytes, loads
+
+PACKET_URL_PREFIX = "/pdf-packet"
+
+# 형식별 MIME 타입
+PACKET_FORMATS = {"pdf": "application/pdf", "zip": "application/zip"}
+
+# 한 묶음에 넣을 수 있는 최대 후보자 수 (PDF 캐시 파일 수 한도보다 작게 유지)
+PACKET_MAX_CANDIDATES = 100
+
+# 다 만든 묶음 파일과 상태 파일을 보관하는 시간 (초)
+PACKET_TTL_SECONDS = 60 * 60
+
+# (DB 경로, 후보자 id, 보고서 유형)
+PacketTask = Tuple[str, str, str]
+# (후보자 id, 보고서 유형, PDF 경로, 오류 메시지)
+PacketResult = Tuple[str, str, Optional[str], Optional[str]]
+
+
+class PacketSummary(TypedDict):
+    documents: int                      # 묶음에 들어간 문서 수
+    cached: int                         # 캐시에서 가져온 문서 수
+    rendered: int                       # 새로 만든 문서 수
+    failed: List[Tuple[str, str, str]]  # (후보자 id, 보고서 유형, 오류 메시지)
+    elapsed: float
+
+
+def packet_dir() -> str:
+    """묶음 파일/작업 상태 디렉터리 (PDF 캐시 디렉터리 아래 packets/)"""
+    return os.path.join(pdf_cache_dir(), "packets")
+
+
+def packet_filename(fmt: str) -> str:
+    return f"interview_reports_{time.strftime('%Y%m%d')}.{fmt}"
+
+
+def _render_task(task: PacketTask) -> PacketResult:
+    """(프로세스 풀 작업자) 후보자 보고서 PDF 한 건을 만들어 캐시에 기록합니다."""
+    db_path, candidate_id, report_type = task
+    # spawn 방식(Windows)에서는 부모의 DB_PATH 변경이 전달되지 않으므로 직접 지정
+    db.DB_PATH = db_path
+    try:
+        path = get_pdf_path(candidate_id, report_type)
+    except Exception as e:
+        return candidate_id, report_type, None, f"{type(e).__name__}: {e}"
+    if path is None:
+        return candidate_id, report_type, None, "후보자가 없거나 보고서로 변환할 수 없습니다"
+    return candidate_id, report_type, path, None
+
+
+def _pin_document(path: str, staging_dir: str, index: int) -> Optional[str]:
+    """
+    캐시 PDF를 작업 디렉터리에 하드 링크(다른 볼륨 등으로 안 되면 복사)하고 그 경로를 반환합니다.
+    캐시 정리(_prune_cache)로 원본이 지워져도 링크는 남습니다. 이미 지워졌으면 None
+    """
+    pinned = os.path.join(staging_dir, f"{index:04d}.pdf")
+    try:
+        os.link(path, pinned)
+    except FileNotFoundError:
+        return None
+    except OSError:
+        try:
+            shutil.copy2(path, pinned)
+        except FileNotFoundError:
+            return None
+    return pinned
+
+
+def _candidate_names(candidate_ids: Sequence[str]) -> Dict[str, str]:
+    with db.db_session() as conn:
+        rows = conn.execute(
+            f"SELECT id, name FROM candidate_analysis "
+            f"WHERE id IN ({', '.join('?' * len(candidate_ids))})",
+            list(candidate_ids),
+        ).fetchall()
+    return {cid: name or cid for cid, name in rows}
+
+
+def _merge_pdf(documents: List[Tuple[str, str, str]], output_path: str) -> None:
+    """문서들을 순서대로 이어 붙이고 후보자/보고서 유형 책갈피를 만듭니다."""
+    import fitz  # PyMuPDF
+
+    merged = fitz.open()
+    toc: List[List[Any]] = []
+    current_name = None
+    for name, report_type, path in documents:
+        if name != current_name:
+            toc.append([1, name, merged.page_count + 1])
+            current_name = name
+        toc.append([2, PDF_REPORT_TYPES[report_type], merged.page_count + 1])
+        with fitz.open(path) as document:
+            merged.insert_pdf(document)
+    merged.set_toc(toc)
+    merged.save(output_path, garbage=3, deflate=True)
+    merged.close()
+
+
+def _write_zip(documents: List[Tuple[str, str, str]], output_path: str) -> None:
+    # PDF는 이미 압축되어 있으므로 다시 압축하지 않음
+    with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_STORED) as archive:
+        for i, (name, report_type, path) in enumerate(documents, 1):
+            archive.write(path, f"{i:03d}_{name}_{PDF_REPORT_TYPES[report_type]}.pdf")
+
+
+def build_packet(
+    candidate_ids: Sequence[str],
+    report_types: Sequence[str],
+    output_path: str,
+    fmt: str = "pdf",
+    workers: int = 1,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> PacketSummary:
+    """
+    후보자 id(순서 유지) × 보고서 유형 문서를 output_path에 fmt('pdf' 또는 'zip')로 저장합니다.
+    캐시에 없는 문서만 workers개 프로세스에서 만들며, 문서가 하나 끝날 때마다
+    progress(완료 수, 전체 수)를 호출합니다. 만들 수 없는 문서는 failed에 담고 건너뜁니다.
+    """
+    if fmt not in PACKET_FORMATS:
+        raise ValueError(f"알 수 없는 묶음 형식: {fmt}")
+    unknown = [report_type for report_type in report_types if report_type not in PDF_REPORT_TYPES]
+    if unknown:
+        raise ValueError(f"알 수 없는 보고서 유형: {', '.join(unknown)}")
+
+    started = time.perf_counter()
+    ids = list(dict.fromkeys(candidate_ids))
+    types = [report_type for report_type in PDF_REPORT_TYPES if report_type in report_types]
+    keys = [(cid, report_type) for cid in ids for report_type in types]
+    positions = {key: i for i, key in enumerate(keys)}
+    total = len(keys)
+
+    os.makedirs(packet_dir(), exist_ok=True)
+    staging_dir = tempfile.mkdtemp(prefix="parts_", dir=packet_dir())
+    try:
+        # 값은 staging_dir 안의 고정된 사본 경로
+        paths: Dict[Tuple[str, str], str] = {}
+        failed: List[Tuple[str, str, str]] = []
+        for key in keys:
+            cached = cached_pdf_path(*key)
+            pinned = _pin_document(cached, staging_dir, positions[key]) if cached is not None else None
+            if pinned is not None:
+                paths[key] = pinned
+        cached_count = len(paths)
+        done = cached_count
+        if progress is not None:
+            progress(done, total)
+
+        def record(result: PacketResult) -> None:
+            nonlocal done
+            cid, report_type, path, error = result
+            pinned = _pin_document(path, staging_dir, positions[(cid, report_type)]) if path else None
+            if path is not None and pinned is None:
+                # 만든 직후 다른 작업이 캐시를 정리한 경우: 한 번 더 만들어 바로 고정
+                cid, report_type, path, error = _render_task((db.DB_PATH, cid, report_type))
+                pinned = _pin_document(path, staging_dir, positions[(cid, report_type)]) if path else None
+                if path is not None and pinned is None:
+                    error = "PDF 캐시에서 정리되어 묶음에 넣지 못했습니다"
+            if pinned is None:
+                failed.append((cid, report_type, error or "알 수 없는 오류"))
+            else:
+                paths[(cid, report_type)] = pinned
+            done += 1
+            if progress is not None:
+                progress(done, total)
+
+        tasks = [(db.DB_PATH, cid, report_type) for cid, report_type in keys if (cid, report_type) not in paths]
+        if workers > 1 and len(tasks) > 1:
+            # 웹 서버 스레드에서 fork하지 않도록 spawn으로 작업자를 띄움 (Windows 기본 방식과 동일)
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(tasks)), mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                for future in as_completed([executor.submit(_render_task, task) for task in tasks]):
+                    record(future.result())
+        else:
+            for task in tasks:
+                record(_render_task(task))
+
+        names = _candidate_names(ids) if ids else {}
+        documents = [
+            (names.get(cid, cid), report_type, paths[(cid, report_type)])
+            for cid, report_type in keys
+            if (cid, report_type) in paths
+        ]
+        if documents:
+            os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+            (_merge_pdf if fmt == "pdf" else _write_zip)(documents, output_path)
+        return {
+            "documents": len(documents),
+            "cached": cached_count,
+            "rendered": len(documents) - cached_count,
+            "failed": failed,
+            "elapsed": time.perf_counter() - started,
+        }
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def format_packet_summary(summary: PacketSummary) -> str:
+    text = (
+        f"문서 {summary['documents']}건 (캐시 {summary['cached']}건, 새로 생성 {summary['rendered']}건)"
+    )
+    if summary["failed"]:
+        text += f", 실패 {len(summary['failed'])}건"
+    return text + f" ({summary['elapsed']:.1f}초)"
+
+
+# ---- 화면용 백그라운드 작업 ----
+
+def _status_path(job_id: str) -> str:
+    return os.path.join(packet_dir(), f"{job_id}.json")
+
+
+def packet_output_path(job_id: str, fmt: str) -> str:
+    return os.path.join(packet_dir(), f"{job_id}.{fmt}")
+
+
+def _write_status(job_id: str, status: Dict[str, Any]) -> None:
+    path = _status_path(job_id)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(dumps_bytes(status))
+    os.replace(tmp_path, path)
+
+
+def load_packet_status(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    작업 상태를 반환합니다. (없으면 None)
+    {"state": "running"|"done"|"error", "done", "total", "format", "message"}
+    """
+    if not job_id or not all(c.isalnum() for c in job_id):
+        return None
+    try:
+        with open(_status_path(job_id), "rb") as f:
+            return loads(f.read())
+    except (OSError, JSONDecodeError):
+        return None
+
+
+def _prune_packets() -> None:
+    """PACKET_TTL_SECONDS보다 오래된 묶음/상태 파일과 (중단된 작업이 남긴) 작업 디렉터리를 지웁니다."""
+    cutoff = time.time() - PACKET_TTL_SECONDS
+    try:
+        entries = list(os.scandir(packet_dir()))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime >= cutoff:
+                continue
+            if entry.is_dir():
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def start_packet_job(
+    candidate_ids: Sequence[str], report_types: Sequence[str], fmt: str = "pdf",
+    workers: Optional[int] = None,
+) -> str:
+    """백그라운드 스레드에서 묶음을 만들기 시작하고 작업 id를 반환합니다."""
+    os.makedirs(packet_dir(), exist_ok=True)
+    _prune_packets()
+    job_id = uuid.uuid4().hex
+    ids = list(dict.fromkeys(candidate_ids))
+    status: Dict[str, Any] = {
+        "state": "running", "done": 0, "total": len(ids) * len(report_types),
+        "format": fmt, "message": "",
+    }
+    _write_status(job_id, status)
+    worker_count = workers or min(os.cpu_count() or 1, 4)
+
+    def progress(done: int, total: int) -> None:
+        _write_status(job_id, {**status, "done": done, "total": total})
+
+    def run() -> None:
+        try:
+            summary = build_packet(
+                ids, report_types, packet_output_path(job_id, fmt), fmt=fmt,
+                workers=worker_count, progress=progress,
+            )
+        except Exception as e:
+            print(f"[PACKET] 묶음 생성 실패: {e}")
+            _write_status(job_id, {**status, "state": "error", "message": str(e)})
+            return
+        print(f"[PACKET] {job_id}: {format_packet_summary(summary)}")
+        state = "done" if summary["documents"] else "error"
+        message = format_packet_summary(summary) if summary["documents"] else "만들 수 있는 문서가 없습니다."
+        _write_status(job_id, {
+            **status, "state": state, "done": status["total"], "message": message,
+        })
+
+    threading.Thread(target=run, name=f"pdf-packet-{job_id}", daemon=True).start()
+    return job_id
+
+
+def packet_url(job_id: str) -> str:
+    return f"{PACKET_URL_PREFIX}/{job_id}"
+
+
+def register_packet_routes(server) -> None:
+    """Dash 앱의 Flask 서버에 /pdf-packet/<작업 id> 다운로드 경로를 등록합니다."""
+    from flask import abort, send_file
+
+    @server.route(f"{PACKET_URL_PREFIX}/<job_id>")
+    def pdf_packet(job_id: str):
+        status = load_packet_status(job_id)
+        if status is None or status["state"] != "done":
+            abort(404)
+        fmt = status["format"]
+        path = packet_output_path(job_id, fmt)
+        if not os.path.exists(path):
+            abort(404)
+        return send_file(
+            path,
+            mimetype=PACKET_FORMATS[fmt],
+            as_attachment=True,
+            download_name=packet_filename(fmt),
+            max_age=0,
+        )
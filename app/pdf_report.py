@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+"""
+서버 측 PDF 보고서 생성 (reportlab)
+- ReportData로 A4 PDF를 직접 만들고, 5대 차원 차트는 reportlab 벡터 그래픽으로 그립니다.
+  (브라우저에서 Dash/Plotly 화면을 띄워 인쇄할 필요 없음)
+- 한글은 reportlab 내장 CID 글꼴(HYGothic-Medium)을 사용하므로 글꼴 파일을 배포하지 않아도 됩니다.
+- 만든 파일은 (content_hash, 보고서 유형, 앱 버전) 이름으로 DB 파일 옆 <DB 이름>_pdf/에 보관하고,
+  같은 보고서를 다시 요청하면 디스크에서 바로 보냅니다. 언제든 지워도 됩니다.
+  (쓰기/동시 요청/정리는 disk_cache 참고)
+"""
+
+import io
+import os
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional
+from urllib.parse import quote
+
+from . import __version__, db
+from .disk_cache import key_lock, prune_files, touch, write_atomic
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .dimension_scores import DimensionProfile
+    from .report_schema import DecisionPointItem, ReportData
+
+PDF_URL_PREFIX = "/pdf-report"
+
+# 보고서 유형: 제목 (/print-report 경로의 유형과 같음)
+PDF_REPORT_TYPES = {
+    "comprehensive": "종합 분석 보고서",
+    "executive": "임원용 요약 보고서",
+    "hr": "HR 상세 분석 보고서",
+}
+
+# 캐시 디렉터리에 남길 최대 파일 수 (넘으면 오래 쓰지 않은 파일부터 삭제)
+PDF_CACHE_MAX_FILES = 500
+
+FONT_NAME = "HYGothic-Medium"
+
+_DIMENSION_LABELS = {
+    "CAPABILITY": "역량",
+    "PERFORMANCE": "성과",
+    "POTENTIAL": "잠재력",
+    "PERSONALITY": "개인특성",
+    "FIT": "적합성",
+}
+
+_BRAND_COLOR = "#1A237E"
+_RISK_COLOR = "#DC3545"
+_STRENGTH_COLOR = "#007BFF"
+
+
+def pdf_url(candidate_id: str, report_type: str) -> str:
+    return f"{PDF_URL_PREFIX}/{quote(candidate_id, safe='')}/{report_type}.pdf"
+
+
+def pdf_cache_dir() -> str:
+    """현재 DB_PATH에 대응하는 PDF 캐시 디렉터리 (예: candidates.db -> candidates_pdf/)"""
+    return os.path.splitext(db.DB_PATH)[0] + "_pdf"
+
+
+def _cache_path(content_hash: str, report_type: str) -> str:
+    return os.path.join(pdf_cache_dir(), f"{content_hash}_{report_type}_{__version__}.pdf")
+
+
+# ---- 문서 구성 요소 ----
+
+def _styles():
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.enums import TA_JUSTIFY
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+
+    if FONT_NAME not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(UnicodeCIDFont(FONT_NAME))
+    base = ParagraphStyle("base", fontName=FONT_NAME, fontSize=10, leading=15, wordWrap="CJK")
+    return {
+        "title": ParagraphStyle("title", parent=base, fontSize=18, leading=24,
+                                textColor=HexColor(_BRAND_COLOR)),
+        "subtitle": ParagraphStyle("subtitle", parent=base, fontSize=12, leading=18,
+                                   textColor=HexColor("#666666")),
+        "h2": ParagraphStyle("h2", parent=base, fontSize=13, leading=20, spaceBefore=10,
+                             spaceAfter=6, textColor=HexColor(_BRAND_COLOR)),
+        "h3": ParagraphStyle("h3", parent=base, fontSize=11, leading=16, spaceBefore=6, spaceAfter=2),
+        "body": ParagraphStyle("body", parent=base, alignment=TA_JUSTIFY, spaceAfter=4),
+        "small": ParagraphStyle("small", parent=base, fontSize=8.5, leading=12,
+                                textColor=HexColor("#666666"), spaceAfter=6),
+        "cell": ParagraphStyle("cell", parent=base, fontSize=9, leading=12),
+    }
+
+
+def _text(value: Any) -> str:
+    """Paragraph 마크업으로 해석되지 않도록 특수문자를 이스케이프하고 줄바꿈을 유지합니다."""
+    from xml.sax.saxutils import escape
+
+    return escape(str(value or "")).replace("\n", "<br/>")
+
+
+def _header(report_data: "ReportData", report_type: str, styles) -> List[Any]:
+    from reportlab.lib.colors import HexColor
+    from reportlab.platypus import HRFlowable, Paragraph, Spacer
+
+    info = report_data.candidate_info
+    return [
+        Paragraph(_text(PDF_REPORT_TYPES[report_type]), styles["title"]),
+        Paragraph(
+            _text(f"후보자: {info.name}  |  {info.organization} · {info.position}  |  면접일 {info.interview_date}"),
+            styles["subtitle"],
+        ),
+        HRFlowable(width="100%", thickness=2, color=HexColor(_BRAND_COLOR), spaceBefore=4, spaceAfter=10),
+        Spacer(1, 4),
+    ]
+
+
+def _summary_table(report_data: "ReportData", styles):
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.units import mm
+    from reportlab.platypus import Paragraph, Table, TableStyle
+
+    report = report_data.comprehensive_report
+    info = report_data.candidate_info
+    rows = [
+        ["최종 추천", report.recommendation, "종합 점수", f"{report.score:.0f} / 100"],
+        ["지원조직", info.organization, "지원직급", info.position],
+        ["경력 요약", Paragraph(_text(info.career_summary), styles["cell"]), "연봉 정보",
+         Paragraph(_text(info.salary_info), styles["cell"])],
+    ]
+    table = Table(rows, colWidths=[22 * mm, 68 * mm, 22 * mm, 68 * mm])
+    table.setStyle(TableStyle([
+        ("FONTNAME", (0, 0), (-1, -1), FONT_NAME),
+        ("FONTSIZE", (0, 0), (-1, -1), 9.5),
+        ("BACKGROUND", (0, 0), (0, -1), HexColor("#F0F4FA")),
+        ("BACKGROUND", (2, 0), (2, -1), HexColor("#F0F4FA")),
+        ("TEXTCOLOR", (1, 0), (1, 0), HexColor(_BRAND_COLOR)),
+        ("TEXTCOLOR", (3, 0), (3, 0), HexColor(_BRAND_COLOR)),
+        ("FONTSIZE", (1, 0), (1, 0), 13),
+        ("FONTSIZE", (3, 0), (3, 0), 13),
+        ("GRID", (0, 0), (-1, -1), 0.5, HexColor("#DEE2E6")),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("TOPPADDING", (0, 0), (-1, -1), 5),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+    ]))
+    return table
+
+
+def _radar_chart(means: "np.ndarray"):
+    """5대 차원 평균 레이더 차트 (벡터, 수치는 옆의 막대 차트에 표시)"""
+    from reportlab.graphics.charts.spider import SpiderChart
+    from reportlab.graphics.shapes import Drawing
+    from reportlab.lib.colors import Color, HexColor
+
+    from .dimension_scores import DIMENSIONS
+
+    drawing = Drawing(240, 200)
+    chart = SpiderChart()
+    chart.x, chart.y, chart.width, chart.height = 30, 15, 180, 170
+    # SpiderChart는 데이터 최댓값에 맞춰 눈금을 정하므로 100점/50점 기준선을 함께 그려 0~100으로 고정
+    chart.data = [
+        [100] * len(DIMENSIONS),
+        [50] * len(DIMENSIONS),
+        [0 if value != value else round(float(value), 1) for value in means],
+    ]
+    chart.labels = [_DIMENSION_LABELS[dimension] for dimension in DIMENSIONS]
+    for i in (0, 1):
+        chart.strands[i].strokeColor = HexColor("#CCCCCC")
+        chart.strands[i].fillColor = None
+        chart.strands[i].strokeWidth = 0.5
+    chart.strands[2].strokeColor = HexColor("#0055A4")
+    chart.strands[2].fillColor = Color(0, 0.33, 0.64, alpha=0.15)
+    chart.strands[2].strokeWidth = 1.5
+    chart.spokes.strokeColor = HexColor("#CCCCCC")
+    chart.spokes.strokeWidth = 0.5
+    chart.spokeLabels.fontName = FONT_NAME
+    chart.spokeLabels.fontSize = 9
+    drawing.add(chart)
+    return drawing
+
+
+def _dimension_bar_chart(means: "np.ndarray"):
+    """5대 차원 평균 가로 막대 차트 (벡터)"""
+    from reportlab.graphics.charts.barcharts import HorizontalBarChart
+    from reportlab.graphics.shapes import Drawing
+    from reportlab.lib.colors import HexColor
+
+    from .dimension_scores import DIMENSIONS
+
+    drawing = Drawing(240, 200)
+    chart = HorizontalBarChart()
+    chart.x, chart.y, chart.width, chart.height = 50, 20, 170, 160
+    # 위에서부터 DIMENSIONS 순서가 되도록 뒤집어서 넣음
+    chart.data = [[0 if value != value else round(float(value), 1) for value in means][::-1]]
+    chart.categoryAxis.categoryNames = [_DIMENSION_LABELS[dimension] for dimension in DIMENSIONS][::-1]
+    chart.categoryAxis.labels.fontName = FONT_NAME
+    chart.categoryAxis.labels.fontSize = 9
+    chart.valueAxis.valueMin, chart.valueAxis.valueMax, chart.valueAxis.valueStep = 0, 100, 20
+    chart.valueAxis.labels.fontSize = 8
+    chart.bars[0].fillColor = HexColor("#3F51B5")
+    chart.barLabelFormat = "%.1f"
+    chart.barLabels.fontSize = 7
+    chart.barLabels.nudge = 10
+    drawing.add(chart)
+    return drawing
+
+
+def _charts_row(profile: "DimensionProfile"):
+    from reportlab.platypus import Table, TableStyle
+
+    table = Table([[_radar_chart(profile.means), _dimension_bar_chart(profile.means)]])
+    table.setStyle(TableStyle([("VALIGN", (0, 0), (-1, -1), "MIDDLE")]))
+    return table
+
+
+def _item_score_table(report_data: "ReportData", styles):
+    """차원별 세부 항목 점수표"""
+    from reportlab.lib.colors import HexColor
+    from reportlab.platypus import Paragraph, Table, TableStyle
+
+    from .dimension_scores import DIMENSIONS
+
+    rows: List[List[Any]] = [["차원", "세부 항목", "점수"]]
+    spans = []
+    for dimension in DIMENSIONS:
+        items = [item for item in report_data.analysis_items if item.category == dimension]
+        if not items:
+            continue
+        start = len(rows)
+        for i, item in enumerate(items):
+            rows.append([
+                _DIMENSION_LABELS[dimension] if i == 0 else "",
+                Paragraph(_text(item.title), styles["cell"]),
+                f"{item.score:.1f}",
+            ])
+        if len(items) > 1:
+            spans.append(("SPAN", (0, start), (0, len(rows) - 1)))
+    table = Table(rows, colWidths=[70, 330, 60], repeatRows=1)
+    table.setStyle(TableStyle([
+        ("FONTNAME", (0, 0), (-1, -1), FONT_NAME),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("BACKGROUND", (0, 0), (-1, 0), HexColor("#F8F9FA")),
+        ("BACKGROUND", (0, 1), (0, -1), HexColor("#F0F8FF")),
+        ("GRID", (0, 0), (-1, -1), 0.5, HexColor("#DEE2E6")),
+        ("ALIGN", (2, 0), (2, -1), "CENTER"),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        *spans,
+    ]))
+    return table
+
+
+def _decision_points(
+    title: str, items: "List[DecisionPointItem]", color: str, styles, with_evidence: bool
+) -> List[Any]:
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import Paragraph
+
+    heading = ParagraphStyle("dp_heading", parent=styles["h2"], textColor=HexColor(color))
+    flowables: List[Any] = [Paragraph(_text(title), heading)]
+    if not items:
+        flowables.append(Paragraph("분석된 항목이 없습니다.", styles["small"]))
+    for item in items:
+        flowables.append(Paragraph(f"<b>{_text(item.title)}</b>: {_text(item.analysis)}", styles["body"]))
+        if with_evidence:
+            flowables.append(Paragraph(_text(f"근거: {item.evidence}"), styles["small"]))
+    return flowables
+
+
+def _executive_story(report_data: "ReportData", profile: "DimensionProfile", styles) -> List[Any]:
+    from reportlab.platypus import PageBreak, Paragraph
+
+    return [
+        _summary_table(report_data, styles),
+        Paragraph("종합 의견", styles["h2"]),
+        Paragraph(_text(report_data.comprehensive_report.summary), styles["body"]),
+        Paragraph("5대 차원 역량 프로필", styles["h2"]),
+        _charts_row(profile),
+        PageBreak(),
+        Paragraph("역량별 상세 점수", styles["h2"]),
+        _item_score_table(report_data, styles),
+    ]
+
+
+def _comprehensive_story(report_data: "ReportData", profile: "DimensionProfile", styles) -> List[Any]:
+    from reportlab.platypus import PageBreak, Paragraph
+
+    story: List[Any] = [
+        _summary_table(report_data, styles),
+        Paragraph("종합 평가 요약", styles["h2"]),
+        Paragraph(_text(report_data.comprehensive_report.summary), styles["body"]),
+        Paragraph("5대 차원 역량 프로필", styles["h2"]),
+        _charts_row(profile),
+        PageBreak(),
+    ]
+    story += _decision_points("강점 및 기회 요인", report_data.decision_points.strengths,
+                              _STRENGTH_COLOR, styles, with_evidence=False)
+    story += _decision_points("리스크 및 우려 사항", report_data.decision_points.risks,
+                              _RISK_COLOR, styles, with_evidence=False)
+    story += [PageBreak(), Paragraph("세부 역량 분석", styles["h2"])]
+    for item in report_data.analysis_items:
+        label = _DIMENSION_LABELS.get(item.category, item.category)
+        story.append(Paragraph(f"<b>[{label}] {_text(item.title)}</b> ({item.score:.1f}/100)", styles["h3"]))
+        story.append(Paragraph(_text(item.analysis), styles["body"]))
+        story.append(Paragraph(_text(f"근거: {item.evidence}"), styles["small"]))
+    return story
+
+
+def _hr_story(report_data: "ReportData", profile: "DimensionProfile", styles) -> List[Any]:
+    from reportlab.platypus import PageBreak, Paragraph
+
+    story: List[Any] = [
+        _summary_table(report_data, styles),
+        Paragraph("5대 차원 역량 프로필", styles["h2"]),
+        _charts_row(profile),
+        _item_score_table(report_data, styles),
+        PageBreak(),
+    ]
+    story += _decision_points("강점 및 기회 요인", report_data.decision_points.strengths,
+                              _STRENGTH_COLOR, styles, with_evidence=True)
+    story += _decision_points("리스크 및 우려 사항", report_data.decision_points.risks,
+                              _RISK_COLOR, styles, with_evidence=True)
+    story += [PageBreak(), Paragraph("자료별 분석 요약", styles["h2"])]
+    for material in report_data.material_analysis:
+        story.append(Paragraph(_text(material.material_name), styles["h3"]))
+        story.append(Paragraph(_text(material.summary), styles["body"]))
+        story.append(Paragraph(_text(f"분석 포인트: {material.analysis_points}"), styles["small"]))
+    reliability = report_data.overall_reliability
+    story += [
+        Paragraph("평가 신뢰도", styles["h2"]),
+        Paragraph(_text(f"일관성: {reliability.consistency}"), styles["body"]),
+        Paragraph(_text(f"완전성: {reliability.completeness}"), styles["body"]),
+        Paragraph(_text(f"객관성: {reliability.objectivity}"), styles["body"]),
+    ]
+    return story
+
+
+_STORY_BUILDERS = {
+    "comprehensive": _comprehensive_story,
+    "executive": _executive_story,
+    "hr": _hr_story,
+}
+
+
+def build_pdf(report_data: "ReportData", report_type: str) -> bytes:
+    """ReportData로 A4 PDF를 만들어 bytes로 반환합니다."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.platypus import SimpleDocTemplate
+
+    from .dimension_scores import dimension_profile
+
+    if report_type not in _STORY_BUILDERS:
+        raise ValueError(f"알 수 없는 보고서 유형: {report_type}")
+    styles = _styles()
+    info = report_data.candidate_info
+    generated = datetime.now().strftime("%Y-%m-%d")
+
+    def _footer(canvas, doc):
+        canvas.saveState()
+        canvas.setFont(FONT_NAME, 8)
+        canvas.setFillColorRGB(0.6, 0.6, 0.6)
+        canvas.drawString(15 * mm, 10 * mm, f"삼양KCI 면접 분석 시스템 · {info.name} · {generated}")
+        canvas.drawRightString(A4[0] - 15 * mm, 10 * mm, f"{doc.page}")
+        canvas.restoreState()
+
+    buffer = io.BytesIO()
+    document = SimpleDocTemplate(
+        buffer, pagesize=A4,
+        leftMargin=15 * mm, rightMargin=15 * mm, topMargin=15 * mm, bottomMargin=18 * mm,
+        title=f"{info.name} {PDF_REPORT_TYPES[report_type]}", author="삼양KCI 면접 분석 시스템",
+    )
+    # 5대 차원 집계는 보고서당 한 번 만들어 차트에 넘김
+    profile = dimension_profile(report_data.analysis_items)
+    story = _header(report_data, report_type, styles) + _STORY_BUILDERS[report_type](report_data, profile, styles)
+    document.build(story, onFirstPage=_footer, onLaterPages=_footer)
+    return buffer.getvalue()
+
+
+# ---- 디스크 캐시 ----
+
+def _prune_cache() -> None:
+    """캐시 파일이 PDF_CACHE_MAX_FILES를 넘으면 오래 쓰지 않은 파일부터 지웁니다."""
+    prune_files(pdf_cache_dir(), ".pdf", PDF_CACHE_MAX_FILES)
+
+
+def remove_cached_files(directory: str, content_hashes: Iterable[str]) -> int:
+    """
+    directory(PDF/인쇄 HTML 캐시)에서 주어진 content_hash로 만든 파일을 지우고 지운 개수를 반환합니다.
+    (재파싱 등으로 더 이상 쓰이지 않는 파일을 용량 한도를 기다리지 않고 정리)
+    """
+    hashes = set(content_hashes)
+    try:
+        entries = list(os.scandir(directory)) if hashes else []
+    except OSError:
+        return 0
+    removed = 0
+    for entry in entries:
+        if entry.is_file() and entry.name.split("_", 1)[0] in hashes:
+            try:
+                os.remove(entry.path)
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def cached_pdf_path(candidate_id: str, report_type: str) -> Optional[str]:
+    """캐시에 이미 있는 PDF 경로를 반환합니다. (없거나 후보자가 없으면 None)"""
+    content_hash = db.load_content_hash(candidate_id)
+    if not content_hash:
+        return None
+    # 최근 사용 시각을 갱신해 정리 대상에서 뒤로 미룸 (없거나 그 사이 정리됐으면 None)
+    return touch(_cache_path(content_hash, report_type))
+
+
+def get_pdf_path(candidate_id: str, report_type: str) -> Optional[str]:
+    """
+    후보자 보고서 PDF 파일 경로를 반환합니다. 캐시에 있으면 바로 반환하고,
+    없으면 저장된 report_json으로 만들어 캐시에 기록합니다.
+    후보자가 없거나 보고서로 변환할 수 없으면 None을 반환합니다.
+    """
+    if report_type not in PDF_REPORT_TYPES:
+        raise ValueError(f"알 수 없는 보고서 유형: {report_type}")
+    cached = cached_pdf_path(candidate_id, report_type)
+    if cached is not None:
+        return cached
+    # 파일 이름의 해시와 PDF 내용이 같은 행에서 나오도록 함께 읽음
+    content_hash, report_data = db.load_report_with_hash(candidate_id)
+    if not content_hash or report_data is None:
+        return None
+    path = _cache_path(content_hash, report_type)
+    # 같은 문서를 동시에 요청하면 먼저 잡은 스레드만 만들고 나머지는 그 파일을 씀
+    with key_lock(path):
+        if touch(path) is not None:
+            return path
+        pdf = build_pdf(report_data, report_type)
+        write_atomic(path, pdf)
+        print(f"[PDF] 생성: {candidate_id} {report_type} ({len(pdf):,} bytes)")
+    _prune_cache()
+    return path
+
+
+def register_pdf_routes(server) -> None:
+    """Dash 앱의 Flask 서버에 /pdf-report/<후보자 id>/<유형>.pdf 경로를 등록합니다."""
+    from flask import abort, send_file
+
+    @server.route(f"{PDF_URL_PREFIX}/<path:candidate_id>/<report_type>.pdf")
+    def pdf_report(candidate_id: str, report_type: str):
+        if report_type not in PDF_REPORT_TYPES:
+            abort(404)
+        path = get_pdf_path(candidate_id, report_type)
+        if path is None:
+            abort(404)
+        # 캐시 파일 이름이 내용(content_hash, 유형, 앱 버전)을 나타내므로 그대로 ETag로 사용
+        return send_file(
+            path,
+            mimetype="application/pdf",
+            download_name=f"{candidate_id}_{report_type}.pdf",
+            conditional=True,
+            etag=os.path.splitext(os.path.basename(path))[0],
+            max_age=0,
+        )
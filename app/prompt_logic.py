@@ -1,5 +1,20 @@
-from typing import List
+from typing import Dict, List, TypedDict
 from .components.prompt_templates import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
+from .config import MATERIAL_TOKEN_ESTIMATES, MATERIAL_TRIM_ORDER, RESERVED_OUTPUT_TOKENS
+
+
+class PromptPlan(TypedDict):
+    prompt: str
+    materials: List[str]                # 프롬프트에 넣은 자료
+    dropped_materials: List[str]        # 예산을 넘어 제외한 자료 (자동 맞춤 모드)
+    instructions_trimmed: bool          # 추가 지시사항을 잘랐는지 여부
+    prompt_tokens: int                  # 시스템 + 사용자 프롬프트
+    material_tokens: Dict[str, int]     # 넣은 자료별 예상 토큰
+    reserved_tokens: int                # 응답용으로 남겨 두는 토큰
+    total_tokens: int
+    budget: int
+    exact: bool                         # prompt_tokens를 tiktoken으로 셌으면 True
+
 
 def generate_custom_prompt(
     name: str,
@@ -33,5 +48,75 @@ def generate_custom_prompt(
 
     # 시스템 프롬프트와 사용자 프롬프트를 결합하여 최종 프롬프트 생성
     final_prompt = f"{SYSTEM_PROMPT}\n\n{user_prompt}"
-    
-    return final_prompt
\ No newline at end of file
+
+    return final_prompt
+
+
+def plan_custom_prompt(
+    name: str,
+    organization: str,
+    position: str,
+    interview_date: str,
+    salary: str,
+    career_year: str,
+    uploaded_materials_list: List[str],
+    extra_instructions: str,
+    budget: int,
+    auto_trim: bool = False,
+) -> PromptPlan:
+    """
+    generate_custom_prompt의 결과와 토큰 사용량(프롬프트 + 자료 예상치 + 응답 예약)을 함께 계산합니다.
+    auto_trim이면 예산 안에 들 때까지 MATERIAL_TRIM_ORDER 순서로 자료를 빼고,
+    그래도 넘으면 추가 지시사항을 남은 토큰만큼 자릅니다. (그래도 넘으면 total_tokens > budget)
+    """
+    from .prompt_tokens import count_tokens, is_exact, truncate_to_tokens
+
+    materials = list(uploaded_materials_list)
+    dropped: List[str] = []
+
+    def material_cost(items: List[str]) -> int:
+        return sum(MATERIAL_TOKEN_ESTIMATES.get(material, 0) for material in items)
+
+    def build(items: List[str], instructions: str) -> str:
+        return generate_custom_prompt(
+            name, organization, position, interview_date, salary, career_year, items, instructions
+        )
+
+    prompt = build(materials, extra_instructions)
+    prompt_tokens = count_tokens(prompt)
+    instructions_trimmed = False
+
+    if auto_trim:
+        # 자료 목록 한 줄은 수 토큰뿐이므로 자료를 뺄 때는 예상치만 비교하고, 끝난 뒤 프롬프트를 다시 셈
+        for material in MATERIAL_TRIM_ORDER:
+            if prompt_tokens + material_cost(materials) + RESERVED_OUTPUT_TOKENS <= budget:
+                break
+            if material in materials:
+                materials.remove(material)
+                dropped.append(material)
+        if dropped:
+            prompt = build(materials, extra_instructions)
+            prompt_tokens = count_tokens(prompt)
+
+        # 지시사항을 줄여서 예산 안에 들 때만 자름 (다 지워도 넘으면 그대로 두고 초과로 표시)
+        overflow = prompt_tokens + material_cost(materials) + RESERVED_OUTPUT_TOKENS - budget
+        instruction_tokens = count_tokens(extra_instructions)
+        if 0 < overflow < instruction_tokens:
+            instructions = truncate_to_tokens(extra_instructions, instruction_tokens - overflow)
+            prompt = build(materials, instructions)
+            prompt_tokens = count_tokens(prompt)
+            instructions_trimmed = True
+
+    material_tokens = {material: MATERIAL_TOKEN_ESTIMATES.get(material, 0) for material in materials}
+    return {
+        "prompt": prompt,
+        "materials": materials,
+        "dropped_materials": dropped,
+        "instructions_trimmed": instructions_trimmed,
+        "prompt_tokens": prompt_tokens,
+        "material_tokens": material_tokens,
+        "reserved_tokens": RESERVED_OUTPUT_TOKENS,
+        "total_tokens": prompt_tokens + sum(material_tokens.values()) + RESERVED_OUTPUT_TOKENS,
+        "budget": budget,
+        "exact": is_exact(),
+    }
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+프롬프트 토큰 수 계산
+- tiktoken(requirements.txt)의 TOKEN_ENCODING으로 셉니다. 모델마다 토크나이저가 조금씩 다르므로
+  예산 판단용 근사치입니다.
+- 인코딩 파일 읽기(처음이면 내려받기)는 수백 ms가 걸리므로 웹 앱의 첫 요청 때 preload_encoding()으로
+  백그라운드에서 시작하고, 입력 콜백은 기다리지 않습니다. 불러오는 중이거나 오프라인 등으로 불러올 수
+  없으면 글자 수 기반 추정(한글 등 비ASCII 1글자 = 1토큰, ASCII 4글자 = 1토큰)으로 대신합니다.
+  추정은 실제보다 조금 크게 나오도록 잡았습니다.
+- 오프라인 배포는 TIKTOKEN_CACHE_DIR 환경 변수로 인코딩 파일을 미리 넣어 둔 폴더를 지정합니다.
+"""
+
+import threading
+from typing import Any, Optional
+
+# GPT-4o 계열 인코딩 (한글을 cl100k_base보다 적은 토큰으로 나눔)
+TOKEN_ENCODING = "o200k_base"
+
+_encoding: Any = None  # None: 아직 불러오지 않음, False: 불러오기 실패
+_load_started = False
+_encoding_lock = threading.Lock()
+
+
+def _load_encoding() -> None:
+    global _encoding
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding(TOKEN_ENCODING)
+    except Exception as e:
+        print(f"[TOKEN] tiktoken 인코딩을 불러올 수 없어 글자 수로 추정합니다: {type(e).__name__}: {e}")
+        encoding = False
+    _encoding = encoding
+
+
+def preload_encoding() -> None:
+    """tiktoken 인코딩을 백그라운드 스레드에서 불러오기 시작합니다. (프로세스당 한 번, 바로 반환)"""
+    global _load_started
+    if _load_started:
+        return
+    with _encoding_lock:
+        if _load_started:
+            return
+        _load_started = True
+    threading.Thread(target=_load_encoding, name="tiktoken-preload", daemon=True).start()
+
+
+def _get_encoding() -> Optional[Any]:
+    """불러온 tiktoken 인코딩 (불러오는 중이거나 실패했으면 None, 기다리지 않음)"""
+    if _encoding is None:
+        preload_encoding()
+    return _encoding or None
+
+
+def is_exact() -> bool:
+    """토큰 수를 tiktoken으로 세는지 여부 (False면 글자 수 추정)"""
+    return _get_encoding() is not None
+
+
+def _char_tokens(char: str) -> float:
+    return 0.25 if char.isascii() else 1.0
+
+
+def estimate_tokens(text: str) -> int:
+    """글자 수 기반 토큰 수 추정"""
+    ascii_count = sum(1 for char in text if char.isascii())
+    return (ascii_count + 3) // 4 + (len(text) - ascii_count)
+
+
+def count_tokens(text: str) -> int:
+    """text의 토큰 수"""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is None:
+        return estimate_tokens(text)
+    # 사용자가 입력한 문자열에 특수 토큰 표기가 있어도 일반 텍스트로 셈
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """text를 앞에서부터 max_tokens 토큰 이내로 자릅니다."""
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding()
+    if encoding is None:
+        used = 0.0
+        for i, char in enumerate(text):
+            used += _char_tokens(char)
+            if used > max_tokens:
+                return text[:i]
+        return text
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    # 잘린 위치의 깨진 글자(멀티바이트 토큰 일부)는 버림
+    return encoding.decode_bytes(tokens[:max_tokens]).decode("utf-8", errors="ignore")
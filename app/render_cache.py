@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+보고서 컴포넌트 트리 렌더링 캐시
+- 키: (content_hash, 보고서 유형, 앱 버전, 변형)
+  변형은 원문 외에 화면을 바꾸는 값(예: 코호트 백분위)을 문자열로 나타낸 것입니다.
+- 값: Dash 컴포넌트 트리를 직렬화한 JSON(bytes). 반복 조회 시 pandas/Plotly/컴포넌트 생성을 건너뜁니다.
+- 전체 바이트 크기로 제한하며 가장 오래 사용하지 않은 항목부터 제거합니다. (LRU)
+- 앱 버전이 키에 포함되므로 보고서 컴포넌트 코드를 바꿀 때는 app.__version__을 올립니다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from plotly.io.json import to_json_plotly
+
+from . import __version__
+from .serialization import loads
+
+# 기본 최대 캐시 크기 (보고서 1건은 직렬화 기준 수십 KB 수준)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+RenderKey = Tuple[str, str, str, str]
+
+
+def render_key(content_hash: str, report_type: str, variant: str = "") -> RenderKey:
+    """렌더링 캐시 키를 만듭니다."""
+    return (content_hash, report_type, __version__, variant)
+
+
+class RenderCache:
+    """스레드 안전한 바이트 크기 제한 LRU 캐시"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[RenderKey, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: RenderKey) -> Optional[Any]:
+        """
+        캐시된 컴포넌트 트리를 반환합니다. (Dash가 그대로 렌더링할 수 있는 dict)
+        호출마다 새 객체로 역직렬화하므로 반환값을 수정해도 캐시에는 영향이 없습니다.
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return loads(payload)
+
+    def put(self, key: RenderKey, component: Any) -> None:
+        """컴포넌트 트리를 직렬화하여 저장합니다. 최대 크기보다 큰 항목은 저장하지 않습니다."""
+        payload = to_json_plotly(component).encode("utf-8")
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= len(previous)
+            self._entries[key] = payload
+            self.current_bytes += len(payload)
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# 앱 전체에서 공유하는 캐시 인스턴스
+render_cache = RenderCache()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+파싱된 보고서(ReportData) 프로세스 내 LRU 캐시
+- 키는 (후보자 id, content_hash)이므로 원문이 바뀌거나 재파싱으로 report_json이 바뀌면
+  이전 항목은 자동으로 무효가 됩니다.
+- 보고서 유형 전환/행 재선택/인쇄 URL 열기 시 원문을 다시 파싱하지 않도록 검증된 객체를 보관합니다.
+- 프로세스 간 공유 캐시는 candidate_analysis.report_json 컬럼(SQLite)이 담당합니다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .report_schema import ReportData
+
+# 기본 최대 보관 개수 (보고서 1건은 수십 KB 수준)
+DEFAULT_MAX_ENTRIES = 64
+
+CacheKey = Tuple[str, str]
+
+
+class ReportCache:
+    """스레드 안전한 크기 제한 LRU 캐시"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, ReportData]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: CacheKey) -> "Optional[ReportData]":
+        with self._lock:
+            report = self._entries.get(key)
+            if report is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return report
+
+    def put(self, key: CacheKey, report: "ReportData") -> None:
+        with self._lock:
+            # 같은 후보자의 이전 원문 항목은 더 이상 조회되지 않으므로 함께 제거
+            for old_key in [k for k in self._entries if k[0] == key[0] and k != key]:
+                del self._entries[old_key]
+            self._entries[key] = report
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, candidate_id: str) -> None:
+        """후보자 id에 해당하는 모든 항목을 제거합니다."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == candidate_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# 앱 전체에서 공유하는 캐시 인스턴스
+report_cache = ReportCache()
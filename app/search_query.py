@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+후보자 전문 검색(FTS5) 조건 변환 모듈
+- 검색 필터 입력값(이름/지원조직/지원직급)과 자유 검색어를 candidate_search 인덱스의
+  MATCH 식으로 변환합니다.
+- trigram 토크나이저는 3글자 미만 검색어를 MATCH로 찾을 수 없으므로,
+  짧은 검색어는 원본 테이블 컬럼에 대한 LIKE 조건으로 대신 처리합니다.
+"""
+
+from typing import Any, List, Optional, Tuple
+
+from .table_query import like_pattern
+
+FTS_TABLE = "candidate_search"
+
+# FTS 인덱스 컬럼 (db_migrations v4와 동일한 순서)
+FTS_COLUMNS = ("name", "organization", "position", "summary", "decision_points", "analysis")
+
+# trigram 토크나이저가 MATCH로 찾을 수 있는 최소 글자 수
+MIN_MATCH_LENGTH = 3
+
+# 짧은 자유 검색어를 LIKE로 찾을 원본 테이블 컬럼
+_FREE_TEXT_LIKE_COLUMNS = ("name", "organization", "position", "report_json")
+
+
+def _fts_phrase(term: str) -> str:
+    """검색어를 FTS5 문구(큰따옴표)로 감싸 연산자로 해석되지 않도록 합니다."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def split_search_terms(search: Optional[str]) -> List[str]:
+    """자유 검색어를 공백 기준으로 나눕니다. (모든 단어를 포함하는 AND 검색)"""
+    return [term for term in (search or "").split() if term]
+
+
+def build_search_conditions(
+    search: Optional[str] = None,
+    name: Optional[str] = None,
+    organization: Optional[str] = None,
+    position: Optional[str] = None,
+    fts_available: bool = True,
+) -> Tuple[Optional[str], List[str], List[Any]]:
+    """
+    검색 입력값을 (FTS MATCH 식, LIKE 조건 리스트, LIKE 파라미터 리스트)로 변환합니다.
+    - 이름/지원조직/지원직급은 해당 컬럼으로 한정한 MATCH(`name : "..."`)로 검색합니다.
+    - 자유 검색어는 인덱스의 모든 컬럼(요약, 강점/리스크, 분석 내용 포함)에서 검색합니다.
+    - FTS 인덱스가 없거나 검색어가 짧으면 LIKE 조건으로 대체합니다.
+    MATCH 식이 없으면 첫 번째 값은 None입니다.
+    """
+    match_terms: List[str] = []
+    conditions: List[str] = []
+    params: List[Any] = []
+
+    for column, keyword in (
+        ("name", name), ("organization", organization), ("position", position)
+    ):
+        keyword = (keyword or "").strip()
+        if not keyword:
+            continue
+        if fts_available and len(keyword) >= MIN_MATCH_LENGTH:
+            match_terms.append(f"{column} : {_fts_phrase(keyword)}")
+        else:
+            conditions.append(f"{column} LIKE ? ESCAPE '\\'")
+            params.append(like_pattern(keyword))
+
+    for term in split_search_terms(search):
+        if fts_available and len(term) >= MIN_MATCH_LENGTH:
+            match_terms.append(_fts_phrase(term))
+        else:
+            conditions.append(
+                "(" + " OR ".join(
+                    f"{column} LIKE ? ESCAPE '\\'" for column in _FREE_TEXT_LIKE_COLUMNS
+                ) + ")"
+            )
+            params.extend([like_pattern(term)] * len(_FREE_TEXT_LIKE_COLUMNS))
+
+    match_expression = " AND ".join(match_terms) if match_terms else None
+    return match_expression, conditions, params
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+JSON 직렬화 공통 모듈
+- orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 동작합니다.
+- 출력은 항상 UTF-8이며 한글을 이스케이프하지 않습니다. (ensure_ascii=False와 동일)
+- 디코딩 오류는 두 경우 모두 json.JSONDecodeError(ValueError의 하위 클래스)로 잡을 수 있습니다.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - requirements.txt에 포함되어 있음
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+# 표준 json처럼 int 등 문자열이 아닌 dict 키도 허용
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """객체를 UTF-8 JSON bytes로 직렬화합니다. indent=True면 2칸 들여쓰기."""
+    if orjson is not None:
+        options = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=options)
+    return dumps(obj, indent=indent).encode("utf-8")
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """객체를 JSON 문자열로 직렬화합니다. indent=True면 2칸 들여쓰기."""
+    if orjson is not None:
+        return dumps_bytes(obj, indent=indent).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """JSON 문자열/bytes를 파싱합니다."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
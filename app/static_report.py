@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+인쇄용 보고서 정적 HTML (/print-report/<후보자 id>/<유형>)
+- components.print_optimized_reports의 인쇄 레이아웃(Dash html 컴포넌트)을 그대로 HTML 문자열로 바꿉니다.
+  스타일은 인라인, 5대 차원 차트는 SVG로 넣으므로 Dash/Plotly 스크립트 없이 열리고,
+  파일로 보관하거나 메일에 첨부해도 그대로 보입니다.
+- 만든 파일은 (content_hash, 보고서 유형, 앱 버전) 이름으로 DB 파일 옆 <DB 이름>_print/에 보관하고
+  ETag/Last-Modified로 조건부 요청에 응답합니다. 언제든 지워도 됩니다.
+  (쓰기/동시 요청/정리는 disk_cache 참고, 파일 수는 PRINT_CACHE_MAX_FILES까지)
+"""
+
+import math
+import os
+from html import escape
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+from urllib.parse import quote
+
+from . import __version__, db
+from .disk_cache import key_lock, prune_files, touch, write_atomic
+from .pdf_report import PDF_REPORT_TYPES
+
+if TYPE_CHECKING:
+    from .dimension_scores import DimensionProfile
+    from .report_schema import ReportData
+
+PRINT_URL_PREFIX = "/print-report"
+
+# 보고서 유형: 제목 (PDF 보고서와 같은 유형)
+PRINT_REPORT_TYPES = PDF_REPORT_TYPES
+
+# 캐시 디렉터리에 남길 최대 파일 수 (재저장/버전 변경으로 쓰이지 않게 된 파일은 오래된 순으로 삭제)
+PRINT_CACHE_MAX_FILES = 500
+
+_DIMENSION_LABELS = {
+    "CAPABILITY": "역량",
+    "PERFORMANCE": "성과",
+    "POTENTIAL": "잠재력",
+    "PERSONALITY": "개인특성",
+    "FIT": "적합성",
+}
+
+# 닫는 태그가 없는 요소
+_VOID_TAGS = {"area", "br", "col", "embed", "hr", "img", "input", "source", "wbr"}
+
+# React처럼 숫자에 px를 붙이지 않는 스타일 속성
+_UNITLESS_STYLES = {"fontWeight", "lineHeight", "opacity", "zIndex", "flex", "flexGrow", "flexShrink", "order"}
+
+# HTML 속성으로 옮기지 않는 Dash 속성
+_SKIPPED_PROPS = {"children", "style", "className", "loading_state", "disable_n_clicks", "setProps"}
+
+_PAGE_CSS = """
+@page { size: A4; margin: 0; }
+body { margin: 0; color: #000;
+       font-family: Pretendard, 'Malgun Gothic', 'Apple SD Gothic Neo', sans-serif; }
+table { border-collapse: collapse; }
+td, th { border: 1px solid #dee2e6; }
+@media print { .no-print { display: none !important; } }
+"""
+
+
+def print_url(candidate_id: str, report_type: str) -> str:
+    return f"{PRINT_URL_PREFIX}/{quote(candidate_id, safe='')}/{report_type}"
+
+
+def print_cache_dir() -> str:
+    """현재 DB_PATH에 대응하는 인쇄 HTML 캐시 디렉터리 (예: candidates.db -> candidates_print/)"""
+    return os.path.splitext(db.DB_PATH)[0] + "_print"
+
+
+def _cache_path(content_hash: str, report_type: str) -> str:
+    return os.path.join(print_cache_dir(), f"{content_hash}_{report_type}_{__version__}.html")
+
+
+# ---- Dash 컴포넌트 → HTML ----
+
+def _css_name(name: str) -> str:
+    return "".join(f"-{c.lower()}" if c.isupper() else c for c in name)
+
+
+def _style_attr(style: Dict[str, Any]) -> str:
+    declarations = []
+    for name, value in style.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and name not in _UNITLESS_STYLES:
+            value = f"{value}px"
+        declarations.append(f"{_css_name(name)}: {value}")
+    return "; ".join(declarations)
+
+
+def component_to_html(component: Any, raw: Optional[Dict[str, str]] = None) -> str:
+    """
+    Dash html 컴포넌트 트리를 HTML 문자열로 바꿉니다.
+    raw: {요소 id: HTML} 이면 해당 id 요소 안에 주어진 HTML(차트 SVG 등)을 그대로 넣습니다.
+    html 네임스페이스가 아닌 컴포넌트(dcc/dbc)는 자식만 div로 감싸 출력합니다.
+    """
+    if component is None or isinstance(component, bool):
+        return ""
+    if isinstance(component, (str, int, float)):
+        return escape(str(component))
+    if isinstance(component, (list, tuple)):
+        return "".join(component_to_html(child, raw) for child in component)
+
+    props = component.to_plotly_json()["props"]
+    is_html = component._namespace == "dash_html_components"
+    tag = component._type.lower() if is_html else "div"
+
+    attrs: List[str] = []
+    if props.get("className"):
+        attrs.append(f'class="{escape(str(props["className"]))}"')
+    if props.get("style"):
+        attrs.append(f'style="{escape(_style_attr(props["style"]))}"')
+    if is_html:
+        for name, value in props.items():
+            if name in _SKIPPED_PROPS or name.startswith("n_clicks") or value is None:
+                continue
+            attr = name if "-" in name else name.lower()
+            attrs.append(f'{attr}="{escape(str(value))}"')
+
+    open_tag = f"<{tag}{' ' if attrs else ''}{' '.join(attrs)}>"
+    if tag in _VOID_TAGS:
+        return open_tag
+    element_id = props.get("id")
+    if raw and element_id in raw:
+        inner = raw[element_id]
+    else:
+        inner = component_to_html(props.get("children"), raw)
+    return f"{open_tag}{inner}</{tag}>"
+
+
+# ---- SVG 차트 ----
+
+def render_dimension_radar_svg(means: Sequence[float], size: int = 300) -> str:
+    """5대 차원 평균(DIMENSIONS 순서, NaN은 0점)의 레이더 차트 SVG"""
+    from .dimension_scores import DIMENSIONS
+
+    center = size / 2
+    radius = size / 2 - 48
+    count = len(DIMENSIONS)
+
+    def point(i: int, value: float) -> str:
+        angle = -math.pi / 2 + 2 * math.pi * i / count
+        r = radius * value / 100
+        return f"{center + r * math.cos(angle):.1f},{center + r * math.sin(angle):.1f}"
+
+    values = [0.0 if value != value else float(value) for value in means]
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" '
+        f'viewBox="0 0 {size} {size}" font-family="inherit" font-size="12">'
+    ]
+    for level in (20, 40, 60, 80, 100):
+        ring = " ".join(point(i, level) for i in range(count))
+        parts.append(f'<polygon points="{ring}" fill="none" stroke="#ddd" stroke-width="1"/>')
+    for i in range(count):
+        parts.append(
+            f'<line x1="{center}" y1="{center}" x2="{point(i, 100).split(",")[0]}" '
+            f'y2="{point(i, 100).split(",")[1]}" stroke="#ddd" stroke-width="1"/>'
+        )
+    polygon = " ".join(point(i, value) for i, value in enumerate(values))
+    parts.append(
+        f'<polygon points="{polygon}" fill="rgba(0,85,164,0.15)" stroke="#0055A4" stroke-width="2"/>'
+    )
+    for i, (dimension, value) in enumerate(zip(DIMENSIONS, values)):
+        x, y = (float(v) for v in point(i, 122).split(","))
+        anchor = "middle" if abs(x - center) < 5 else ("start" if x > center else "end")
+        parts.append(
+            f'<text x="{x:.1f}" y="{y:.1f}" text-anchor="{anchor}" dominant-baseline="middle">'
+            f'{escape(_DIMENSION_LABELS[dimension])} <tspan font-weight="bold">{value:.1f}</tspan></text>'
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def _dimension_chart_html(profile: "DimensionProfile") -> str:
+    means = profile.means
+    return (
+        '<h4 style="font-size: 12pt; margin-bottom: 3mm">5대 차원 역량 프로필</h4>'
+        f'<div style="text-align: center">{render_dimension_radar_svg(means)}</div>'
+    )
+
+
+def render_print_html(report_data: "ReportData", report_type: str) -> str:
+    """인쇄 레이아웃을 완전한 HTML 문서로 만듭니다."""
+    from .components.print_optimized_reports import (
+        PRINT_DIMENSION_CHART_ID, render_print_optimized_report
+    )
+    from .dimension_scores import dimension_profile
+
+    if report_type not in PRINT_REPORT_TYPES:
+        raise ValueError(f"알 수 없는 보고서 유형: {report_type}")
+    # 5대 차원 집계는 보고서당 한 번 만들어 레이아웃과 SVG 차트에 함께 넘김
+    profile = dimension_profile(report_data.analysis_items)
+    body = component_to_html(
+        render_print_optimized_report(report_data, report_type, profile),
+        raw={PRINT_DIMENSION_CHART_ID: _dimension_chart_html(profile)},
+    )
+    title = escape(f"{report_data.candidate_info.name} {PRINT_REPORT_TYPES[report_type]}")
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="ko"><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f"<title>{title}</title><style>{_PAGE_CSS}</style></head>"
+        f"<body>{body}</body></html>\n"
+    )
+
+
+# ---- 디스크 캐시 ----
+
+def _prune_cache() -> None:
+    """캐시 파일이 PRINT_CACHE_MAX_FILES를 넘으면 오래 쓰지 않은 파일부터 지웁니다."""
+    prune_files(print_cache_dir(), ".html", PRINT_CACHE_MAX_FILES)
+
+
+def get_print_html_path(candidate_id: str, report_type: str) -> Optional[str]:
+    """
+    인쇄용 HTML 파일 경로를 반환합니다. 캐시에 없으면 저장된 report_json으로 만들어 기록합니다.
+    후보자가 없거나 보고서로 변환할 수 없으면 None을 반환합니다.
+    """
+    if report_type not in PRINT_REPORT_TYPES:
+        raise ValueError(f"알 수 없는 보고서 유형: {report_type}")
+    content_hash = db.load_content_hash(candidate_id)
+    if not content_hash:
+        return None
+    path = _cache_path(content_hash, report_type)
+    # 최근 사용 시각을 갱신해 정리 대상에서 뒤로 미룸
+    if touch(path) is not None:
+        return path
+
+    # 파일 이름의 해시와 HTML 내용이 같은 행에서 나오도록 함께 읽음 (그 사이 재저장된 경우 포함)
+    content_hash, report_data = db.load_report_with_hash(candidate_id)
+    if not content_hash or report_data is None:
+        return None
+    path = _cache_path(content_hash, report_type)
+    # 같은 문서를 동시에 요청하면 먼저 잡은 스레드만 만들고 나머지는 그 파일을 씀
+    with key_lock(path):
+        if touch(path) is not None:
+            return path
+        document = render_print_html(report_data, report_type).encode("utf-8")
+        write_atomic(path, document)
+        print(f"[PRINT] 생성: {candidate_id} {report_type} ({len(document):,} bytes)")
+    _prune_cache()
+    return path
+
+
+def register_print_routes(server) -> None:
+    """
+    Dash 앱의 Flask 서버에 /print-report/<후보자 id>/<유형> 경로를 등록합니다.
+    (Dash의 전체 경로 처리보다 구체적인 규칙이므로 이 경로가 먼저 선택됨)
+    """
+    from flask import abort, send_file
+
+    @server.route(f"{PRINT_URL_PREFIX}/<path:candidate_id>/<report_type>")
+    def print_report(candidate_id: str, report_type: str):
+        if report_type not in PRINT_REPORT_TYPES:
+            abort(404)
+        path = get_print_html_path(candidate_id, report_type)
+        if path is None:
+            abort(404)
+        # 캐시 파일 이름이 내용(content_hash, 유형, 앱 버전)을 나타내므로 그대로 ETag로 사용
+        return send_file(
+            path,
+            mimetype="text/html",
+            conditional=True,
+            etag=os.path.splitext(os.path.basename(path))[0],
+            last_modified=os.path.getmtime(path),
+            max_age=0,
+        )
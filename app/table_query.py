@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+DataTable 커스텀(서버 측) 필터/정렬 변환 모듈
+- dash_table.DataTable의 filter_query / sort_by 값을 SQL WHERE / ORDER BY 절로 변환합니다.
+- 컬럼명은 화이트리스트로만 허용하고, 값은 항상 바인딩 파라미터로 전달합니다.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# DataTable 컬럼 id -> (SQL 표현식, 숫자 컬럼 여부)
+CANDIDATE_TABLE_COLUMNS: Dict[str, Tuple[str, bool]] = {
+    "name": ("name", False),
+    "organization": ("organization", False),
+    "position": ("position", False),
+    "interview_date": ("interview_date", False),
+    "overall_score": ("COALESCE(overall_score, 0)", True),
+    "recommendation": ("COALESCE(recommendation, 'N/A')", False),
+    "created_at": ("created_at", False),
+}
+
+# Dash filter 연산자 -> SQL 비교 연산자
+_COMPARISON_OPERATORS = {
+    "=": "=", "eq": "=", "ieq": "=", "seq": "=",
+    "!=": "!=", "ne": "!=", "ine": "!=", "sne": "!=",
+    "<": "<", "lt": "<", "ilt": "<", "slt": "<",
+    "<=": "<=", "le": "<=", "ile": "<=", "sle": "<=",
+    ">": ">", "gt": ">", "igt": ">", "sgt": ">",
+    ">=": ">=", "ge": ">=", "ige": ">=", "sge": ">=",
+}
+_CONTAINS_OPERATORS = {"contains", "icontains", "scontains"}
+
+_TERM_PATTERN = re.compile(
+    r"^\{(?P<column>[^}]+)\}\s+"
+    r"(?P<operator>[a-z]+|[<>!=]=?)\s*"
+    r"(?P<value>.*)$"
+)
+
+
+def like_pattern(keyword: str) -> str:
+    """LIKE 검색용 부분일치 패턴 (%, _ 는 문자 그대로 취급)"""
+    escaped = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'`":
+        return value[1:-1]
+    return value
+
+
+def _to_number(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def parse_filter_query(filter_query: Optional[str]) -> Tuple[List[str], List[Any]]:
+    """
+    DataTable filter_query 문자열을 (SQL 조건 리스트, 파라미터 리스트)로 변환합니다.
+    예: '{name} icontains 김 && {overall_score} >= 70'
+    해석할 수 없는 조건은 무시합니다.
+    """
+    conditions: List[str] = []
+    params: List[Any] = []
+    if not filter_query:
+        return conditions, params
+
+    for term in filter_query.split(" && "):
+        match = _TERM_PATTERN.match(term.strip())
+        if not match:
+            continue
+        column = CANDIDATE_TABLE_COLUMNS.get(match.group("column").strip())
+        if column is None:
+            continue
+        expression, is_numeric = column
+        operator = match.group("operator")
+        value = _unquote(match.group("value"))
+        if value == "":
+            continue
+
+        if operator in _CONTAINS_OPERATORS:
+            conditions.append(f"{expression} LIKE ? ESCAPE '\\'")
+            params.append(like_pattern(value))
+        elif operator == "datestartswith":
+            conditions.append(f"{expression} LIKE ? ESCAPE '\\'")
+            params.append(like_pattern(value)[1:])
+        elif operator in _COMPARISON_OPERATORS:
+            number = _to_number(value) if is_numeric else None
+            if is_numeric and number is None:
+                continue
+            conditions.append(f"{expression} {_COMPARISON_OPERATORS[operator]} ?")
+            params.append(number if is_numeric else value)
+    return conditions, params
+
+
+def build_order_by(
+    sort_by: Optional[List[Dict[str, str]]],
+    default: str = "name",
+    rank_expression: Optional[str] = None,
+) -> str:
+    """
+    DataTable sort_by 값을 ORDER BY 절로 변환합니다.
+    정렬 기준이 없으면 rank_expression(전문 검색 관련도) 또는 default 컬럼 순으로 정렬합니다.
+    페이지 경계가 흔들리지 않도록 항상 id를 마지막 정렬 키로 붙입니다.
+    """
+    terms: List[str] = []
+    for sort in sort_by or []:
+        column = CANDIDATE_TABLE_COLUMNS.get(sort.get("column_id", ""))
+        if column is None:
+            continue
+        direction = "DESC" if sort.get("direction") == "desc" else "ASC"
+        terms.append(f"{column[0]} {direction}")
+    if not terms and rank_expression:
+        terms.append(f"{rank_expression} ASC")
+    if not terms:
+        terms.append(f"{CANDIDATE_TABLE_COLUMNS[default][0]} ASC")
+    terms.append("id ASC")
+    return "ORDER BY " + ", ".join(terms)
@@ -0,0 +1,187 @@
+import dash_bootstrap_components as dbc
+import plotly.graph_objects as go
+from dash import dcc, html
+
+from .analytics import GROUP_KEYS, RECOMMENDATION_ORDER, PoolAnalytics
+from .components.radar_chart import DIMENSION_MAP
+from .dimension_scores import DIMENSIONS
+
+# 채용추천 색상 (강력 추천 → 비추천)
+RECOMMENDATION_COLORS = {
+    "강력 추천": "#1A237E",
+    "추천": "#3F51B5",
+    "고려": "#90A4AE",
+    "보류": "#FFB74D",
+    "비추천": "#E57373",
+}
+
+_GRAPH_CONFIG = {"displaylogo": False}
+
+
+def render_analytics_tab() -> html.Div:
+    """'인재풀 분석' 탭의 레이아웃을 렌더링합니다. (그래프는 콜백에서 채움)"""
+    return html.Div(
+        [
+            dbc.Card(
+                [
+                    dbc.CardHeader("인재풀 분석 기준"),
+                    dbc.CardBody(
+                        dbc.RadioItems(
+                            id="analytics-group-by",
+                            options=[
+                                {"label": label, "value": key}
+                                for key, label in GROUP_KEYS.items()
+                            ],
+                            value="organization",
+                            inline=True,
+                        )
+                    ),
+                ],
+                className="mb-4",
+            ),
+            dcc.Loading(html.Div(id="analytics-content")),
+        ]
+    )
+
+
+def _kpi_card(title: str, value: str) -> dbc.Col:
+    return dbc.Col(
+        dbc.Card(
+            dbc.CardBody(
+                [
+                    html.Div(title, className="text-muted small"),
+                    html.Div(value, style={"fontSize": "1.6rem", "fontWeight": 700}),
+                ]
+            )
+        ),
+        md=4,
+    )
+
+
+def create_dimension_heatmap(result: PoolAnalytics) -> go.Figure:
+    """그룹 × 5대 차원 평균 점수 히트맵"""
+    means = result["dimension_means"]
+    values = means.to_numpy().round(1)
+    fig = go.Figure(
+        go.Heatmap(
+            z=values,
+            x=[DIMENSION_MAP[dimension] for dimension in DIMENSIONS],
+            y=list(means.index),
+            text=values,
+            texttemplate="%{text}",
+            colorscale="Blues",
+            zmin=0,
+            zmax=100,
+            hovertemplate="%{y} · %{x}: %{z:.1f}점<extra></extra>",
+        )
+    )
+    fig.update_layout(
+        title="차원별 평균 점수",
+        yaxis={"autorange": "reversed"},
+        height=max(300, 40 * len(means) + 120),
+        margin={"l": 10, "r": 10, "t": 50, "b": 10},
+    )
+    return fig
+
+
+def create_score_distribution(result: PoolAnalytics) -> go.Figure:
+    """그룹별 종합점수 분포 (미리 계산한 사분위수로 그린 상자 그림)"""
+    quantiles = result["score_quantiles"]
+    fig = go.Figure(
+        go.Box(
+            x=list(quantiles.index),
+            lowerfence=quantiles["min"],
+            q1=quantiles["q1"],
+            median=quantiles["median"],
+            q3=quantiles["q3"],
+            upperfence=quantiles["max"],
+            marker_color="#3F51B5",
+            name="종합점수",
+        )
+    )
+    fig.update_layout(
+        title="종합점수 분포",
+        yaxis={"range": [0, 100], "title": "점수"},
+        showlegend=False,
+        margin={"l": 10, "r": 10, "t": 50, "b": 10},
+    )
+    return fig
+
+
+def create_score_histogram(result: PoolAnalytics) -> go.Figure:
+    """전체 후보자 종합점수 구간별 인원"""
+    edges = result["score_histogram"]["edges"]
+    labels = [f"{low}~{high}" for low, high in zip(edges[:-1], edges[1:])]
+    fig = go.Figure(
+        go.Bar(x=labels, y=result["score_histogram"]["counts"], marker_color="#1A237E")
+    )
+    fig.update_layout(
+        title="전체 종합점수 구간별 인원",
+        yaxis={"title": "인원"},
+        margin={"l": 10, "r": 10, "t": 50, "b": 10},
+    )
+    return fig
+
+
+def create_recommendation_mix(result: PoolAnalytics) -> go.Figure:
+    """그룹별 채용추천 구성비 (100% 누적 막대)"""
+    mix = result["recommendation_mix"]
+    fig = go.Figure(
+        [
+            go.Bar(
+                name=recommendation,
+                y=list(mix.index),
+                x=mix[recommendation].round(1),
+                orientation="h",
+                marker_color=RECOMMENDATION_COLORS[recommendation],
+                hovertemplate="%{y} · " + recommendation + ": %{x:.1f}%<extra></extra>",
+            )
+            for recommendation in RECOMMENDATION_ORDER
+        ]
+    )
+    fig.update_layout(
+        title="채용추천 구성비",
+        barmode="stack",
+        xaxis={"range": [0, 100], "ticksuffix": "%"},
+        yaxis={"autorange": "reversed"},
+        legend={"orientation": "h", "y": -0.15},
+        height=max(300, 32 * len(mix) + 140),
+        margin={"l": 10, "r": 10, "t": 50, "b": 10},
+    )
+    return fig
+
+
+def render_analytics_content(result: PoolAnalytics) -> html.Div:
+    """집계 결과로 KPI 카드와 그래프를 구성합니다."""
+    group_label = GROUP_KEYS[result["group_by"]]
+    return html.Div(
+        [
+            dbc.Row(
+                [
+                    _kpi_card("분석 대상 후보자", f"{result['total']:,}명"),
+                    _kpi_card("평균 종합점수", f"{result['mean_score']:.1f}점"),
+                    _kpi_card("추천 이상 비율", f"{result['recommend_ratio']:.1f}%"),
+                ],
+                className="mb-4 g-3",
+            ),
+            html.Div(
+                f"{group_label}별 {len(result['groups'])}개 그룹",
+                className="text-muted small mb-2",
+            ),
+            dcc.Graph(figure=create_dimension_heatmap(result), config=_GRAPH_CONFIG),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dcc.Graph(figure=create_score_distribution(result), config=_GRAPH_CONFIG),
+                        md=7,
+                    ),
+                    dbc.Col(
+                        dcc.Graph(figure=create_score_histogram(result), config=_GRAPH_CONFIG),
+                        md=5,
+                    ),
+                ],
+                className="g-3",
+            ),
+            dcc.Graph(figure=create_recommendation_mix(result), config=_GRAPH_CONFIG),
+        ]
+    )
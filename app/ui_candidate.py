@@ -1,17 +1,32 @@
 from dash.dependencies import Output, Input, State
 import dash
 from dash import dash_table, Dash, html, dcc
-import io
 import base64
-import pandas as pd
-import json
 from datetime import datetime
+from app.serialization import dumps
 from app.utils import export_json_result, try_parse_json
 from app.db import load_candidates
 # 콜백: 선택 삭제, 비교, 다운로드, 피드백 메시지, 비교 요약
 def register_candidate_callbacks(app: Dash):
     # 선택된 행에 따라 버튼 활성/비활성 동적 제어 콜백
-    @app.callback(
+    # (disabled만 바꾸므로 브라우저에서 처리, 표 데이터를 서버로 보내지 않음)
+    app.clientside_callback(
+        """
+        function(selected_rows, data) {
+            // Dash DataTable selected_rows는 null일 수 있음
+            var selected = selected_rows ? selected_rows.length : 0;
+            var hasData = !!(data && data.length > 0);
+            var single = selected === 1 && hasData;
+            return [
+                selected === 0,   // 삭제: 1개 이상 선택 시 활성화
+                selected < 2,     // 비교: 2개 이상 선택 시 활성화
+                !hasData,         // 다운로드: 데이터 1개 이상 있을 때만 활성화
+                !single,          // JSON 내보내기: 1명만 선택 시 활성화
+                !single,          // PDF 출력: 1명만 선택 시 활성화
+                !single           // PPT 출력: 1명만 선택 시 활성화
+            ];
+        }
+        """,
         [
             Output('candidate-delete-btn', 'disabled'),
             Output('candidate-compare-btn', 'disabled'),
@@ -22,21 +37,6 @@ def register_candidate_callbacks(app: Dash):
         ],
         [Input('candidate-table', 'selected_rows'), Input('candidate-table', 'data')]
     )
-    def update_button_states(selected_rows, data):
-        # Dash DataTable selected_rows는 None일 수 있음
-        selected = selected_rows if selected_rows is not None else []
-        # 삭제: 1개 이상 선택 시 활성화
-        delete_disabled = not (len(selected) > 0)
-        # 비교: 2개 이상 선택 시 활성화
-        compare_disabled = not (len(selected) >= 2)
-        # 다운로드: 데이터 1개 이상 있을 때만 활성화
-        has_data = data is not None and len(data) > 0
-        download_disabled = not has_data
-        # JSON 내보내기: 1명만 선택 시 활성화
-        json_export_disabled = not (len(selected) == 1 and has_data)
-        # PDF/PPT 출력: 1명만 선택 시 활성화
-        pdf_ppt_disabled = not (len(selected) == 1 and has_data)
-        return delete_disabled, compare_disabled, download_disabled, json_export_disabled, pdf_ppt_disabled, pdf_ppt_disabled
 
     @app.callback(
         [Output('candidate-table', 'data'),
@@ -112,12 +112,9 @@ def register_candidate_callbacks(app: Dash):
                 raise dash.exceptions.PreventUpdate
             if not data or len(data) == 0:
                 return dash.no_update, [], [], "다운로드할 데이터가 없습니다.", dash.no_update
-            output = io.BytesIO()
-            df = pd.DataFrame(data)
-            df.to_excel(output, index=False)
-            b64 = base64.b64encode(output.getvalue()).decode()
-            href = f"data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}"
-            link = html.A("엑셀 다운로드(여기 클릭)", href=href, download="candidates.xlsx", target="_blank", style={"color": "#0984e3", "fontWeight": 600})
+            # 파일은 서버 경로에서 DB를 바로 스트리밍 (콜백 응답에 base64로 싣지 않음)
+            from app.candidate_export import export_url
+            link = html.A("엑셀 다운로드(여기 클릭)", href=export_url("xlsx"), target="_blank", style={"color": "#0984e3", "fontWeight": 600})
             return dash.no_update, [], [], link, dash.no_update
         
         # PDF 출력 버튼 클릭
@@ -139,12 +136,14 @@ def register_candidate_callbacks(app: Dash):
                 msg = html.Span("선택된 후보자의 분석 데이터가 올바르지 않습니다.", style={"color": "#d63031", "fontWeight": 600})
                 return dash.no_update, [], [], msg, dash.no_update
             
+            # PDF는 서버에서 생성한 파일을 바로 내려받음
+            from app.pdf_report import pdf_url
             msg = html.Div([
                 html.P("PDF 출력 기능이 준비되었습니다.", style={"color": "#28a745", "fontWeight": 600}),
-                html.P("아래 링크를 클릭하여 각 보고서를 새 창에서 열고 브라우저의 인쇄 기능을 사용하세요:"),
-                html.A("📄 종합대시보드 PDF", href=f"/print-report/{candidate['id']}/comprehensive", target="_blank", style={"marginRight": "10px", "color": "#007bff"}),
-                html.A("📊 임원용 보고서 PDF", href=f"/print-report/{candidate['id']}/executive", target="_blank", style={"marginRight": "10px", "color": "#007bff"}),
-                html.A("👥 HR 보고서 PDF", href=f"/print-report/{candidate['id']}/hr", target="_blank", style={"color": "#007bff"})
+                html.P("아래 링크를 클릭하여 각 보고서를 PDF 파일로 내려받으세요:"),
+                html.A("📄 종합대시보드 PDF", href=pdf_url(candidate['id'], "comprehensive"), target="_blank", style={"marginRight": "10px", "color": "#007bff"}),
+                html.A("📊 임원용 보고서 PDF", href=pdf_url(candidate['id'], "executive"), target="_blank", style={"marginRight": "10px", "color": "#007bff"}),
+                html.A("👥 HR 보고서 PDF", href=pdf_url(candidate['id'], "hr"), target="_blank", style={"color": "#007bff"})
             ])
             return dash.no_update, [], [], msg, dash.no_update
             
@@ -167,12 +166,14 @@ def register_candidate_callbacks(app: Dash):
                 msg = html.Span("선택된 후보자의 분석 데이터가 올바르지 않습니다.", style={"color": "#d63031", "fontWeight": 600})
                 return dash.no_update, [], [], msg, dash.no_update
             
+            from app.static_report import print_url
+
             msg = html.Div([
                 html.P("PPT 출력 기능이 준비되었습니다.", style={"color": "#28a745", "fontWeight": 600}),
                 html.P("아래 링크를 클릭하여 각 보고서를 새 창에서 열고 브라우저의 인쇄 기능을 사용하세요:"),
-                html.A("📄 종합대시보드 PPT", href=f"/print-report/{candidate['id']}/comprehensive", target="_blank", style={"marginRight": "10px", "color": "#28a745"}),
-                html.A("📊 임원용 보고서 PPT", href=f"/print-report/{candidate['id']}/executive", target="_blank", style={"marginRight": "10px", "color": "#28a745"}),
-                html.A("👥 HR 보고서 PPT", href=f"/print-report/{candidate['id']}/hr", target="_blank", style={"color": "#28a745"})
+                html.A("📄 종합대시보드 PPT", href=print_url(candidate['id'], "comprehensive"), target="_blank", style={"marginRight": "10px", "color": "#28a745"}),
+                html.A("📊 임원용 보고서 PPT", href=print_url(candidate['id'], "executive"), target="_blank", style={"marginRight": "10px", "color": "#28a745"}),
+                html.A("👥 HR 보고서 PPT", href=print_url(candidate['id'], "hr"), target="_blank", style={"color": "#28a745"})
             ])
             return dash.no_update, [], [], msg, dash.no_update
         
@@ -187,16 +188,10 @@ def register_candidate_callbacks(app: Dash):
         if n_clicks:
             if not selected_rows or len(selected_rows) < 2:
                 return html.Div("2명 이상 선택 시만 비교가 가능합니다.", style={"color": "#d63031", "fontWeight": 600, "marginTop": "8px"})
-            # 간단 비교: 이름, 지원조직, 지원직급, 점수만 요약
-            rows = [data[i] for i in selected_rows]
-            header = html.Tr([html.Th("이름"), html.Th("지원조직"), html.Th("지원직급"), html.Th("점수(요약)")])
-            body = [html.Tr([
-                html.Td(r.get("name")),
-                html.Td(r.get("org")),
-                html.Td(r.get("position")),
-                html.Td(r.get("overall_score"))
-            ]) for r in rows]
-            return html.Table([header] + body, style={"marginTop": "12px", "width": "100%", "borderCollapse": "collapse", "fontSize": "1.05rem"})
+            # 행의 표시 컬럼 대신 id로 스냅샷의 차원 벡터를 조회해 비교 (후보자 비교 탭과 같은 화면)
+            from app.callbacks.comparison_callbacks import render_comparison
+            ids = [data[i].get("id") for i in selected_rows if i < len(data)]
+            return html.Div(render_comparison([cid for cid in ids if cid]), style={"marginTop": "12px"})
         raise dash.exceptions.PreventUpdate
 
     def render_candidate_detail(candidate):
@@ -279,7 +274,7 @@ def register_candidate_callbacks(app: Dash):
         json_data = try_parse_json(result_raw)
         if json_data is None:
             return html.Span("JSON 데이터가 아닙니다.", style={"color": "#d63031", "fontWeight": 600})
-        json_str = json.dumps(json_data, ensure_ascii=False, indent=2)
+        json_str = dumps(json_data, indent=True)
         b64 = base64.b64encode(json_str.encode('utf-8')).decode()
         today = datetime.now().strftime("%Y%m%d")
         filename = f"{candidate.get('name', 'candidate')}_분석결과_{today}.json"
@@ -0,0 +1,86 @@
+import dash_bootstrap_components as dbc
+from dash import dcc, html
+
+from .comparison import MAX_COMPARE_CANDIDATES, MIN_COMPARE_CANDIDATES
+from .pdf_report import PDF_REPORT_TYPES
+
+
+def render_comparison_tab() -> html.Div:
+    """'후보자 비교' 탭의 레이아웃을 렌더링합니다. (비교 화면은 콜백에서 채움)"""
+    return html.Div(
+        [
+            dbc.Card(
+                [
+                    dbc.CardHeader(
+                        f"비교할 후보자 선택 ({MIN_COMPARE_CANDIDATES}~{MAX_COMPARE_CANDIDATES}명)"
+                    ),
+                    dbc.CardBody(
+                        # 옵션은 입력한 검색어로 서버에서 찾아 채움 (전체 후보자를 내려보내지 않음)
+                        dcc.Dropdown(
+                            id="comparison-candidates",
+                            options=[],
+                            value=[],
+                            multi=True,
+                            placeholder="이름, 지원조직, 지원직급으로 검색...",
+                        )
+                    ),
+                ],
+                className="mb-4",
+            ),
+            _render_packet_card(),
+            dcc.Loading(html.Div(id="comparison-content")),
+        ]
+    )
+
+
+def _render_packet_card() -> dbc.Card:
+    """선택한 후보자들의 보고서 PDF를 한 번에 내려받는 카드 (진행률은 작업 상태를 주기적으로 조회)"""
+    return dbc.Card(
+        [
+            dbc.CardHeader("위원회 자료 PDF 묶음"),
+            dbc.CardBody(
+                [
+                    dbc.Row(
+                        [
+                            dbc.Col(
+                                dbc.Checklist(
+                                    id="packet-report-types",
+                                    options=[
+                                        {"label": title, "value": report_type}
+                                        for report_type, title in PDF_REPORT_TYPES.items()
+                                    ],
+                                    value=["comprehensive"],
+                                    inline=True,
+                                ),
+                                md=6,
+                            ),
+                            dbc.Col(
+                                dbc.RadioItems(
+                                    id="packet-format",
+                                    options=[
+                                        {"label": "PDF 하나로", "value": "pdf"},
+                                        {"label": "ZIP (문서별 PDF)", "value": "zip"},
+                                    ],
+                                    value="pdf",
+                                    inline=True,
+                                ),
+                                md=4,
+                            ),
+                            dbc.Col(
+                                dbc.Button("묶음 만들기", id="packet-start-btn",
+                                           color="primary", className="w-100"),
+                                md=2,
+                            ),
+                        ],
+                        className="g-3 align-items-center",
+                    ),
+                    dbc.Progress(id="packet-progress", value=0, label="",
+                                 className="mt-3", style={"display": "none"}),
+                    html.Div(id="packet-result", className="mt-2"),
+                    dcc.Store(id="packet-job-store"),
+                    dcc.Interval(id="packet-poll", interval=700, disabled=True),
+                ]
+            ),
+        ],
+        className="mb-4",
+    )
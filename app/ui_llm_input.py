@@ -77,6 +77,27 @@ def render_llm_input_tab():
                 ])
             ]
         ),
-        html.Div(id="llm-save-msg", className="save-message mt-3")
+        html.Div(id="llm-save-msg", className="save-message mt-3"),
+
+        # 여러 건 일괄 가져오기 (파일 여러 개 또는 JSONL)
+        dbc.Card([
+            dbc.CardHeader("일괄 가져오기: LLM 분석 결과 파일 업로드"),
+            dbc.CardBody([
+                dcc.Upload(
+                    id="llm-bulk-upload",
+                    multiple=True,
+                    accept=".txt,.md,.json,.jsonl",
+                    children=html.Div([
+                        "분석 결과 파일(.txt, .md, .json) 또는 JSONL 파일을 끌어다 놓거나 ",
+                        html.A("선택하세요"),
+                    ]),
+                    style={
+                        "borderWidth": "1px", "borderStyle": "dashed",
+                        "borderRadius": "5px", "padding": "20px", "textAlign": "center",
+                    },
+                ),
+                dcc.Loading(html.Div(id="llm-bulk-upload-msg", className="mt-3")),
+            ])
+        ], className="mt-4"),
 
     ], className="page-container")
@@ -2,9 +2,11 @@ import dash_bootstrap_components as dbc
 from dash import html, dcc, dash_table
 from typing import Optional, Any
 
-from .db import load_candidate_raw_llm_text
+from .db import load_candidate_raw_llm_text, load_content_hash, load_report_with_hash
 from .llm_report_parser import parse_llm_report
 from .report_schema import ReportData
+from .render_cache import render_cache, render_key
+from .cohort_index import CohortPercentiles, cohort_index, percentile_fingerprint
 from .components.executive_visual_report import render_executive_visual_report
 from .components.hr_visual_report import render_hr_visual_report
 from .components.comprehensive_visual_report import (
@@ -22,6 +24,9 @@ def render_report_tab() -> html.Div:
                     dbc.CardBody(
                         dbc.Row(
                             [
+                                dbc.Col(dbc.Input(id="filter-text",
+                                                  placeholder="보고서 내용 검색 (종합요약·강점·리스크·분석 내용, 예: 리더십 리스크)..."),
+                                        width=12),
                                 dbc.Col(dbc.Input(id="filter-name",
                                                   placeholder="이름으로 검색..."),
                                         width=3),
@@ -36,9 +41,22 @@ def render_report_tab() -> html.Div:
                                 dbc.Col(dbc.Button("삭제", id="delete-btn",
                                                    color="danger",
                                                    className="w-100"), width=1),
-                                dbc.Col(dbc.Button("Export", id="export-btn",
-                                                   color="success",
-                                                   className="w-100"), width=1),
+                                dbc.Col(dbc.DropdownMenu(
+                                    [
+                                        # href는 조회 조건이 바뀔 때마다 콜백에서 갱신
+                                        dbc.DropdownMenuItem("Excel (.xlsx)", id="export-xlsx-link",
+                                                             href="/export/candidates.xlsx",
+                                                             external_link=True),
+                                        dbc.DropdownMenuItem("CSV (.csv)", id="export-csv-link",
+                                                             href="/export/candidates.csv",
+                                                             external_link=True),
+                                        dbc.DropdownMenuItem("Parquet (.parquet)", id="export-parquet-link",
+                                                             href="/export/candidates.parquet",
+                                                             external_link=True),
+                                    ],
+                                    label="Export", id="export-btn", color="success",
+                                    toggleClassName="w-100",
+                                ), width=1),
                                 dbc.Col(dbc.Button("PDF", id="report-pdf-btn",
                                                    color="warning",
                                                    className="w-100"), width=1),
@@ -52,7 +70,8 @@ def render_report_tab() -> html.Div:
                 ],
                 className="mb-4",
             ),
-            dcc.Download(id="download-excel"),
+            # 조회 조건(필터 입력값 + 표 필터 행)을 보관, 변경 시 서버에서 첫 페이지부터 다시 조회
+            dcc.Store(id="candidate-query-store", data={}),
             dbc.Row(
                 [
                     dbc.Col(
@@ -68,9 +87,17 @@ def render_report_tab() -> html.Div:
                             ],
                             data=[],
                             row_selectable='single',
-                            sort_action='native',
-                            page_action='native',
+                            # 정렬/필터/페이지 이동은 서버(SQLite)에서 처리하고
+                            # 현재 페이지의 행만 브라우저로 전송
+                            sort_action='custom',
+                            sort_mode='single',
+                            sort_by=[],
+                            filter_action='custom',
+                            filter_query='',
+                            page_action='custom',
+                            page_current=0,
                             page_size=10,
+                            page_count=1,
                             export_format='xlsx',
                             export_headers='display',
                             style_as_list_view=True,
@@ -116,6 +143,15 @@ def render_report_tab() -> html.Div:
     )
 
 
+def _load_percentiles(candidate_id: str) -> Optional[CohortPercentiles]:
+    """백분위 조회 실패(스냅샷 오류 등)는 보고서 표시를 막지 않음"""
+    try:
+        return cohort_index.percentiles(candidate_id)
+    except Exception as e:
+        print(f"[REPORT] 코호트 백분위 조회 실패: {e}")
+        return None
+
+
 def update_report_content(
     candidate_id: Optional[str], report_type: Optional[str]
 ) -> Any:
@@ -127,33 +163,56 @@ def update_report_content(
         )
 
     try:
-        raw_llm_text = load_candidate_raw_llm_text(candidate_id)
-        if not raw_llm_text:
-            return dbc.Alert(
-                f"오류: 후보자(ID: {candidate_id})의 LLM 분석 원문 데이터를 "
-                "찾을 수 없습니다.",
-                color="danger"
-            )
+        # 동일 조직·직급 내 백분위 (정렬 색인에서 O(log n) 조회, 헤더에 표시)
+        percentiles = _load_percentiles(candidate_id)
 
-        parsed_result = parse_llm_report(raw_llm_text)
+        # 같은 원문/보고서 유형/백분위를 이미 렌더링했다면 직렬화된 컴포넌트 트리를 그대로 반환
+        content_hash = load_content_hash(candidate_id)
+        cache_key = (
+            render_key(content_hash, report_type, percentile_fingerprint(percentiles))
+            if content_hash else None
+        )
+        if cache_key is not None:
+            cached_report = render_cache.get(cache_key)
+            if cached_report is not None:
+                return cached_report
 
-        if isinstance(parsed_result, dict):
-            try:
-                report_data = ReportData(**parsed_result)
-            except Exception as validation_error:
-                error_str = f"```\n{str(validation_error)}\n```"
+        # 캐시 또는 저장 시 만들어 둔 report_json에서 복원 (원문 재파싱 없음)
+        # 렌더 캐시에는 보고서와 같은 행에서 읽은 해시로 저장 (그 사이 재저장된 경우 포함)
+        content_hash, report_data = load_report_with_hash(candidate_id)
+        cache_key = (
+            render_key(content_hash, report_type, percentile_fingerprint(percentiles))
+            if content_hash else None
+        )
+        if report_data is None:
+            raw_llm_text = load_candidate_raw_llm_text(candidate_id)
+            if not raw_llm_text:
                 return dbc.Alert(
-                    [
-                        html.H4("데이터 검증 오류", className="alert-heading"),
-                        html.P("LLM 분석 결과를 보고서 형식으로 변환 중 오류 발생"),
-                        html.P("관리자에게 다음 오류 메시지를 전달해주세요:"),
-                        dcc.Markdown(error_str,
-                                       className="mt-2 p-2 border rounded"),
-                    ],
-                    color="danger",
+                    f"오류: 후보자(ID: {candidate_id})의 LLM 분석 원문 데이터를 "
+                    "찾을 수 없습니다.",
+                    color="danger"
                 )
-        else:
-            report_data = parsed_result
+
+            # 보고서로 변환할 수 없는 원문: 오류 내용을 보여주기 위해서만 다시 파싱
+            parsed_result = parse_llm_report(raw_llm_text)
+
+            if isinstance(parsed_result, dict):
+                try:
+                    report_data = ReportData(**parsed_result)
+                except Exception as validation_error:
+                    error_str = f"```\n{str(validation_error)}\n```"
+                    return dbc.Alert(
+                        [
+                            html.H4("데이터 검증 오류", className="alert-heading"),
+                            html.P("LLM 분석 결과를 보고서 형식으로 변환 중 오류 발생"),
+                            html.P("관리자에게 다음 오류 메시지를 전달해주세요:"),
+                            dcc.Markdown(error_str,
+                                           className="mt-2 p-2 border rounded"),
+                        ],
+                        color="danger",
+                    )
+            else:
+                report_data = parsed_result
 
         if not hasattr(report_data, 'candidate_info') or \
            not report_data.candidate_info:
@@ -163,16 +222,21 @@ def update_report_content(
             )
 
         if report_type == "comprehensive":
-            return create_comprehensive_visual_report(report_data)
+            report_content = create_comprehensive_visual_report(report_data, percentiles)
         elif report_type == "executive_visual":
-            return render_executive_visual_report(report_data)
+            report_content = render_executive_visual_report(report_data)
         elif report_type == "hr_visual":
-            return render_hr_visual_report(report_data)
+            report_content = render_hr_visual_report(report_data, percentiles)
         else:
             return dbc.Alert(
                 f"알 수 없는 보고서 유형: {report_type}", color="warning"
             )
 
+        # 정상 렌더링된 보고서만 캐시 (오류 안내는 캐시하지 않음)
+        if cache_key is not None:
+            render_cache.put(cache_key, report_content)
+        return report_content
+
     except Exception as e:
         error_message = f"보고서 생성 중 오류 발생 (ID: {candidate_id}): {e}"
         return dbc.Alert(
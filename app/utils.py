@@ -1,7 +1,8 @@
 import os
-import json
 from datetime import datetime
 
+from .serialization import dumps_bytes, loads
+
 def safe_num(value, default=None):
     """
     입력값을 숫자로 안전하게 변환합니다.
@@ -40,8 +41,8 @@ def export_json_result(candidate_name: str, json_data: dict, export_dir: str = "
     today = datetime.now().strftime("%Y%m%d")
     filename = f"{candidate_name}_분석결과_{today}.json"
     filepath = os.path.join(export_dir, filename)
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(json_data, f, ensure_ascii=False, indent=2)
+    with open(filepath, "wb") as f:
+        f.write(dumps_bytes(json_data, indent=True))
     return filepath
 
 
@@ -50,6 +51,6 @@ def try_parse_json(data: str):
     문자열이 JSON이면 파싱해서 반환, 아니면 None 반환
     """
     try:
-        return json.loads(data)
+        return loads(data)
     except Exception:
         return None
@@ -3,6 +3,8 @@ import re
 from typing import Dict, Any, List, TypedDict, cast
 import logging
 
+from .serialization import JSONDecodeError, loads
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -30,7 +32,7 @@ def parse_llm_analysis(raw_result: str) -> List[Dict[str, Any]]:
            'analysis': ..., 'evidence': ..., 'reliability': ...}, ...]
     """
     try:
-        data = json.loads(raw_result)
+        data = loads(raw_result)
     except Exception:
         return []
     results: List[Dict[str, Any]] = []
@@ -56,8 +58,11 @@ def parse_llm_analysis(raw_result: str) -> List[Dict[str, Any]]:
 #     print(item)
 
 
-def _clean_value(value: Any) -> Any:
-    """ "자료기준:" 같은 접두어를 제거하는 헬퍼 함수 """
+def clean_value(value: Any) -> Any:
+    """
+    후보자 정보 값에서 "자료기준:" 같은 접두어를 제거합니다.
+    LLM 분석 탭(extract_candidate_info_from_text)과 일괄 가져오기(importer)가 같은 규칙을 씁니다.
+    """
     if isinstance(value, str):
         return value.split(":", 1)[-1].strip()
     return value
@@ -76,9 +81,6 @@ def extract_candidate_info_from_text(text: str) -> Dict[str, str]:
         "date": ""
     }
 
-    print(f"[DEBUG] 추출 시작 - 텍스트 길이: {len(text)}")
-    print(f"[DEBUG] 텍스트 시작 500자: {text[:500]}")
-
     json_found_and_parsed = False
 
     # 1. JSON 추출 및 파싱 시도
@@ -88,7 +90,6 @@ def extract_candidate_info_from_text(text: str) -> Dict[str, str]:
         match = re.search(r"```json\s*([\s\S]+?)\s*```", text)
         if match:
             json_text = match.group(1).strip()
-            print("[DEBUG] JSON 코드 블록 발견")
 
         # 텍스트에서 첫 '{'를 찾아 JSON 파싱 시작점으로 설정
         start_index = json_text.find('{')
@@ -101,29 +102,26 @@ def extract_candidate_info_from_text(text: str) -> Dict[str, str]:
             )
             
             if candidate_info_match:
-                print("[DEBUG] candidate_info 블록 발견")
                 candidate_info_text = '{"candidate_info": {' + candidate_info_match.group(1) + '}}'
                 try:
-                    data = json.loads(candidate_info_text)
+                    data = loads(candidate_info_text)
                     candidate_info = data.get("candidate_info", {})
                     
-                    info["name"] = _clean_value(candidate_info.get("name", ""))
-                    info["organization"] = _clean_value(
+                    info["name"] = clean_value(candidate_info.get("name", ""))
+                    info["organization"] = clean_value(
                         candidate_info.get("organization", "")
                     )
-                    info["position"] = _clean_value(
+                    info["position"] = clean_value(
                         candidate_info.get("position", "")
                     )
-                    info["date"] = _clean_value(
+                    info["date"] = clean_value(
                         candidate_info.get("interview_date", "")
                     )
-                    print(f"[DEBUG] candidate_info에서 추출: {info}")
                     
                     if any(info.values()):
                         json_found_and_parsed = True
-                        print(f"[DEBUG] candidate_info 파싱 성공: {info}")
-                except json.JSONDecodeError as inner_e:
-                    print(f"[DEBUG] candidate_info 파싱 실패: {inner_e}")
+                except json.JSONDecodeError:
+                    pass  # 아래에서 전체 JSON 파싱을 시도
             
             # candidate_info가 실패했다면 전체 JSON 파싱 시도
             if not json_found_and_parsed:
@@ -132,47 +130,43 @@ def extract_candidate_info_from_text(text: str) -> Dict[str, str]:
                         json_text[start_index:]
                     )
                     data = cast(LLMResult, decoded_obj)
-                    print(f"[DEBUG] 전체 JSON 파싱 성공: {list(data.keys())}")
                     
                     # candidate_info 블록에서 정보 추출
                     candidate_info = data.get("candidate_info")
                     if candidate_info:
-                        info["name"] = _clean_value(candidate_info.get("name", ""))
-                        info["organization"] = _clean_value(
+                        info["name"] = clean_value(candidate_info.get("name", ""))
+                        info["organization"] = clean_value(
                             candidate_info.get("organization", "")
                         )
-                        info["position"] = _clean_value(
+                        info["position"] = clean_value(
                             candidate_info.get("position", "")
                         )
-                        info["date"] = _clean_value(
+                        info["date"] = clean_value(
                             candidate_info.get("interview_date", "")
                         )
-                        print(f"[DEBUG] 전체 JSON candidate_info에서 추출: {info}")
 
                     # 루트 레벨 정보 추출 (백업)
                     if not info["name"] and "name" in data:
-                        info["name"] = _clean_value(data.get("name", ""))
+                        info["name"] = clean_value(data.get("name", ""))
                     if not info["organization"] and "organization" in data:
-                        info["organization"] = _clean_value(
+                        info["organization"] = clean_value(
                             data.get("organization", "")
                         )
                     if not info["position"] and "position" in data:
-                        info["position"] = _clean_value(data.get("position", ""))
+                        info["position"] = clean_value(data.get("position", ""))
                     if not info["date"] and "interview_date" in data:
-                        info["date"] = _clean_value(
+                        info["date"] = clean_value(
                             data.get("interview_date", "")
                         )
 
                     # JSON에서 하나라도 정보를 성공적으로 추출했다면 플래그 설정
                     if any(info.values()):
                         json_found_and_parsed = True
-                        print(f"[DEBUG] 전체 JSON에서 정보 추출 성공: {info}")
                         
-                except (json.JSONDecodeError, StopIteration, TypeError) as inner_e:
-                    print(f"[DEBUG] 전체 JSON 파싱도 실패: {inner_e}")
+                except (json.JSONDecodeError, StopIteration, TypeError):
+                    pass  # 아래 정규표현식 파싱으로 넘어감
 
-    except Exception as e:
-        print(f"[DEBUG] JSON 추출 과정에서 오류: {e}")
+    except Exception:
         pass
 
     # JSON에서 정보를 성공적으로 찾았다면, 여기서 결과 반환
@@ -245,9 +239,19 @@ def extract_candidate_info_from_text(text: str) -> Dict[str, str]:
     return info
 
 
+# 인용 마커 ([cite_start], [cite_end], [cite: 1, 2], [ref: 3], [source: 4], [evidence: 5])를
+# 하나의 패턴으로 찾습니다. ('['로 시작하므로 마커가 없는 구간은 빠르게 건너뜀)
+_CITATION_PATTERN = re.compile(
+    r"\[(?:cite_start|cite_end|(?:cite|ref|source|evidence):\s*\d+(?:\s*,\s*\d+)*)\]",
+    re.IGNORECASE,
+)
+
+
 def remove_citation_markers(text: str) -> str:
     """
     텍스트에서 인용 마커를 제거합니다.
+    마커 양옆의 공백은 하나만 남기고, 줄바꿈/들여쓰기는 유지하므로
+    여러 줄 근거(evidence) 텍스트도 그대로 남습니다.
     
     Args:
         text (str): 원본 텍스트
@@ -255,36 +259,21 @@ def remove_citation_markers(text: str) -> str:
     Returns:
         str: 인용 마커가 제거된 텍스트
     """
-    if not text:
-        return text
-    
-    # 인용 마커 패턴들을 정의
-    citation_patterns = [
-        r'\[cite_start\]',
-        r'\[cite_end\]',
-        r'\[cite:\s*\d+(?:,\s*\d+)*\]',
-        r'\[ref:\s*\d+(?:,\s*\d+)*\]',
-        r'\[source:\s*\d+(?:,\s*\d+)*\]',
-        r'\[evidence:\s*\d+(?:,\s*\d+)*\]',
-    ]
-    
-    # 각 패턴을 순차적으로 제거
-    cleaned_text = text
-    for pattern in citation_patterns:
-        cleaned_text = re.sub(pattern, '', cleaned_text, flags=re.IGNORECASE)
-    
-    # 연속된 공백을 단일 공백으로 정리
-    cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
-    
-    # 앞뒤 공백 제거
-    cleaned_text = cleaned_text.strip()
-    
-    return cleaned_text
+    if not text or "[" not in text:
+        return text.strip() if text else text
+    parts = _CITATION_PATTERN.split(text)
+    pieces = [parts[0]]
+    for part in parts[1:]:
+        # "문장 [cite: 1] 다음" -> "문장 다음", "문장 [cite: 1]\n" -> "문장\n"
+        if pieces[-1][-1:] in (" ", "\t") and (not part or part[0] in " \t\r\n"):
+            pieces[-1] = pieces[-1].rstrip(" \t")
+        pieces.append(part)
+    return "".join(pieces).strip()
 
 
 def clean_analysis_report(report_dict: Dict[str, Any]) -> Dict[str, Any]:
     """
-    분석 보고서에서 인용 마커를 제거합니다.
+    분석 보고서(JSON 디코딩 결과)의 모든 문자열 값에서 인용 마커를 제거합니다.
     
     Args:
         report_dict (Dict[str, Any]): 분석 보고서 딕셔너리
@@ -294,32 +283,18 @@ def clean_analysis_report(report_dict: Dict[str, Any]) -> Dict[str, Any]:
     """
     if not isinstance(report_dict, dict):
         return report_dict
-    
-    cleaned_report: Dict[str, Any] = {}
-    
-    for key, value in report_dict.items():
-        if isinstance(value, str):
-            # 문자열인 경우 인용 마커 제거
-            cleaned_report[key] = remove_citation_markers(value)
-        elif isinstance(value, list):
-            # 리스트인 경우 각 요소에 대해 재귀적으로 처리
-            cleaned_list: List[Any] = []
-            for item in value:
-                if isinstance(item, dict):
-                    cleaned_list.append(clean_analysis_report(item))
-                elif isinstance(item, str):
-                    cleaned_list.append(remove_citation_markers(item))
-                else:
-                    cleaned_list.append(item)
-            cleaned_report[key] = cleaned_list
-        elif isinstance(value, dict):
-            # 딕셔너리인 경우 재귀적으로 처리
-            cleaned_report[key] = clean_analysis_report(value)
-        else:
-            # 기타 타입은 그대로 유지
-            cleaned_report[key] = value
-    
-    return cleaned_report
+    return _strip_citations(report_dict)
+
+
+def _strip_citations(value: Any) -> Any:
+    """dict/list를 재귀적으로 따라가며 문자열 값에만 remove_citation_markers를 적용합니다."""
+    if isinstance(value, str):
+        return remove_citation_markers(value)
+    if isinstance(value, dict):
+        return {key: _strip_citations(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_strip_citations(item) for item in value]
+    return value
 
 
 def safe_json_parse(json_str: str, default_value: Any = None) -> Any:
@@ -327,7 +302,7 @@ def safe_json_parse(json_str: str, default_value: Any = None) -> Any:
     안전한 JSON 파싱 함수 - 삼양KCI 개발 원칙 11번, 12번 적용
     
     Args:
-        json_str (str): 파싱할 JSON 문자열
+        json_str (str): 파싱할 JSON 문자열 (LLM 응답 전체도 가능)
         default_value (Any): 파싱 실패 시 반환할 기본값
         
     Returns:
@@ -335,117 +310,167 @@ def safe_json_parse(json_str: str, default_value: Any = None) -> Any:
         
     원칙 적용:
     - 방어적 코딩: 파싱 실패 시 기본값 반환
-    - JSON 데이터 일관성: 마크다운 코드블록, 불필요한 문자 정제
+    - JSON 데이터 일관성: 코드블록/앞뒤 설명문은 건너뛰고 바깥쪽 JSON 객체만 추출
     """
     if not json_str:
         logger.warning("빈 JSON 문자열 입력")
         return default_value if default_value is not None else {}
     
     try:
-        # 1. 마크다운 코드블록 정제 (원칙 12번)
-        cleaned_json = clean_json_string(json_str)
-        
-        # 2. JSON 파싱 시도
-        parsed_data = json.loads(cleaned_json)
-        
-        logger.debug(f"JSON 파싱 성공: {len(str(parsed_data))} 문자")
+        parsed_data = extract_json_object(json_str)
+        logger.debug("JSON 파싱 성공")
         return parsed_data
-        
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         logger.error(f"JSON 파싱 실패: {e}")
         logger.debug(f"원본 JSON (처음 200자): {json_str[:200]}")
-        
-        # 3. 추가 정제 시도
-        try:
-            # 추가적인 정제 시도
-            extra_cleaned = extra_clean_json_string(json_str)
-            parsed_data = json.loads(extra_cleaned)
-            logger.info("추가 정제 후 JSON 파싱 성공")
-            return parsed_data
-        except Exception as extra_e:
-            logger.error(f"추가 정제 후에도 파싱 실패: {extra_e}")
-    
     except Exception as e:
         logger.error(f"JSON 파싱 중 예상치 못한 오류: {e}")
     
-    # 4. 모든 파싱 시도 실패 시 기본값 반환 (방어적 코딩)
+    # 모든 파싱 시도 실패 시 기본값 반환 (방어적 코딩)
     logger.warning("JSON 파싱 실패, 기본값 반환")
     return default_value if default_value is not None else {}
 
 
-def clean_json_string(json_str: str) -> str:
+# strict=False: 문자열 안의 줄바꿈/탭 같은 제어 문자를 허용 (LLM이 자주 그대로 출력함)
+_JSON_DECODER = json.JSONDecoder(strict=False)
+_JSON_FENCE_PATTERN = re.compile(r"```(?:json)?[ \t]*", re.IGNORECASE)
+
+# 문자열 밖에서 따옴표로 쓰인 문자 -> 짝이 되는 닫는 따옴표
+_QUOTE_PAIRS = {
+    '"': '"', "'": "'",
+    "\u201c": "\u201d", "\u201d": "\u201d",  # “ ” (닫는 기호로 여는 경우 포함)
+    "\u2018": "\u2019", "\u2019": "\u2019",  # ‘ ’
+}
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t"}
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CLOSERS = {"{": "}", "[": "]"}
+# 문자열 안에서 처리가 필요한 문자 (그 사이 구간은 한 번에 복사)
+_STRING_SPECIAL_PATTERN = re.compile("[\\\\\"'\u201d\u2019\n\r\t]")
+
+
+def _find_json_start(text: str) -> int:
+    """```json 코드블록이 있으면 그 안에서, 없으면 문서 전체에서 첫 '{' 위치를 찾습니다."""
+    fence = _JSON_FENCE_PATTERN.search(text)
+    if fence:
+        start = text.find("{", fence.end())
+        if start != -1:
+            return start
+    return text.find("{")
+
+
+def _drop_trailing_comma(out: List[str]) -> None:
+    """출력 버퍼 끝의 (공백을 건너뛴) 쉼표를 제거합니다."""
+    idx = len(out) - 1
+    while idx >= 0 and out[idx].isspace():
+        idx -= 1
+    if idx >= 0 and out[idx] == ",":
+        del out[idx]
+
+
+def repair_json_object(text: str, start: int = 0) -> str:
     """
-    JSON 문자열에서 불필요한 문자들을 정제 - 삼양KCI 개발 원칙 12번 적용
-    
-    Args:
-        json_str (str): 정제할 JSON 문자열
-        
-    Returns:
-        str: 정제된 JSON 문자열
+    text[start]의 '{'부터 바깥쪽 객체가 닫힐 때까지 한 번만 훑으며 흔한 LLM 출력 결함을 고칩니다.
+    - 문자열 안의 줄바꿈/탭 이스케이프, 닫는 괄호 앞 쉼표 제거
+    - 작은따옴표/둥근 따옴표(“ ” ‘ ’) 문자열을 큰따옴표로 변환, True/False/None -> true/false/null
+    - 응답이 중간에 끊긴 경우 열린 문자열/괄호를 닫아줍니다.
+    한글 등 비ASCII 문자는 그대로 유지합니다.
     """
-    if not json_str:
-        return json_str
-    
-    # 1. 마크다운 코드블록 제거 (```json ... ```)
-    cleaned = re.sub(r'```json\s*', '', json_str, 
-                     flags=re.IGNORECASE)
-    cleaned = re.sub(r'```\s*$', '', cleaned, 
-                     flags=re.MULTILINE)
-    
-    # 2. 기타 마크다운 코드블록 제거 (``` ... ```)
-    cleaned = re.sub(r'```[^`]*```', '', cleaned, 
-                     flags=re.DOTALL)
-    
-    # 3. 불필요한 escape 문자 정제
-    cleaned = cleaned.replace('\\"', '"')
-    cleaned = cleaned.replace('\\n', '\n')
-    cleaned = cleaned.replace('\\r', '\r')
-    cleaned = cleaned.replace('\\t', '\t')
-    
-    # 4. 앞뒤 공백 정리
-    cleaned = cleaned.strip()
-    
-    return cleaned
+    out: List[str] = []
+    stack: List[str] = []
+    closing_quote = ""
+    in_string = False
+    i, n = start, len(text)
+    while i < n:
+        ch = text[i]
+        if in_string:
+            special = _STRING_SPECIAL_PATTERN.search(text, i)
+            if special is None:
+                out.append(text[i:])
+                break
+            if special.start() > i:
+                out.append(text[i:special.start()])
+                i = special.start()
+            ch = text[i]
+            if ch == "\\":
+                escaped = text[i + 1:i + 2]
+                # 작은따옴표 문자열의 \' 는 JSON에서 이스케이프가 필요 없음
+                out.append(escaped if escaped == "'" else ch + escaped)
+                i += 2
+                continue
+            if ch == closing_quote:
+                out.append('"')
+                in_string = False
+            elif ch == '"':
+                out.append('\\"')
+            else:
+                out.append(_CONTROL_ESCAPES.get(ch, ch))
+            i += 1
+            continue
+
+        if ch in _QUOTE_PAIRS:
+            closing_quote = _QUOTE_PAIRS[ch]
+            in_string = True
+            out.append('"')
+        elif ch in _CLOSERS:
+            stack.append(_CLOSERS[ch])
+            out.append(ch)
+        elif ch in "}]":
+            _drop_trailing_comma(out)
+            out.append(stack.pop() if stack else ch)
+            if not stack:
+                break
+        elif ch.isalpha():
+            word_end = i
+            while word_end < n and (text[word_end].isalnum() or text[word_end] == "_"):
+                word_end += 1
+            word = text[i:word_end]
+            out.append(_PYTHON_LITERALS.get(word, word))
+            i = word_end
+            continue
+        else:
+            out.append(ch)
+        i += 1
+
+    # 응답이 끊긴 경우 열린 문자열/괄호를 닫음
+    if in_string:
+        out.append('"')
+    while stack:
+        _drop_trailing_comma(out)
+        out.append(stack.pop())
+    return "".join(out)
 
 
-def extra_clean_json_string(json_str: str) -> str:
+def extract_json_object(text: str) -> Any:
     """
-    추가적인 JSON 문자열 정제 - 더 강력한 정제 시도
-    
-    Args:
-        json_str (str): 정제할 JSON 문자열
-        
-    Returns:
-        str: 정제된 JSON 문자열
+    LLM 응답에서 바깥쪽 JSON 객체를 찾아 파싱합니다.
+    1) 코드블록/앞 설명문을 건너뛰고 첫 '{'부터 표준 디코더로 한 번에 파싱 (뒤쪽 설명문은 무시)
+    2) 실패하면 repair_json_object로 한 번 훑어 결함을 고친 뒤 다시 파싱
+    JSON 객체를 찾지 못하면 ValueError를 발생시킵니다.
     """
-    if not json_str:
-        return json_str
-    
-    # 1. 기본 정제 먼저 수행
-    cleaned = clean_json_string(json_str)
-    
-    # 2. 첫 번째 { 찾기
-    start_idx = cleaned.find('{')
-    if start_idx == -1:
-        return cleaned
-    
-    # 3. 마지막 } 찾기
-    end_idx = cleaned.rfind('}')
-    if end_idx == -1:
-        return cleaned
-    
-    # 4. 중간 부분만 추출
-    json_part = cleaned[start_idx:end_idx+1]
-    
-    # 5. 추가 정제
-    # str(dict) 형태의 잘못된 문자열 정제
-    json_part = re.sub(r"'([^']+)':", r'"\1":', json_part)  
-    json_part = re.sub(r":\s*'([^']*)'", r': "\1"', json_part)  
-    
-    # 6. 불필요한 문자 제거
-    json_part = re.sub(r'[^\x00-\x7F]+', '', json_part)  
-    
-    return json_part
+    stripped = text.strip()
+    # 응답 전체가 올바른 JSON 객체이면 orjson으로 바로 파싱
+    if stripped.startswith("{"):
+        try:
+            return loads(stripped)
+        except JSONDecodeError:
+            pass
+    # JSON 문자열로 한 번 더 감싸진 응답("{\"name\": ...}")은 풀어서 다시 처리
+    if stripped.startswith('"'):
+        try:
+            inner = loads(stripped)
+        except JSONDecodeError:
+            inner = None
+        if isinstance(inner, str):
+            return extract_json_object(inner)
+
+    start = _find_json_start(text)
+    if start == -1:
+        raise ValueError("JSON 객체('{')를 찾을 수 없습니다")
+    try:
+        return _JSON_DECODER.raw_decode(text, start)[0]
+    except json.JSONDecodeError as e:
+        logger.info(f"JSON 결함 보정 시도: {e}")
+    return _JSON_DECODER.decode(repair_json_object(text, start))
 
 
 def safe_get_nested_value(data: Dict[str, Any], keys: List[str], 
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""테스트 공용 픽스처: 임시 DB와 LLM 분석 원문 생성"""
+
+import json
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+from app import db
+from app.report_cache import report_cache
+
+_CATEGORIES = ["CAPABILITY", "CAPABILITY", "PERFORMANCE", "POTENTIAL", "PERSONALITY", "FIT"]
+
+
+def make_report(index: int, organization: str = "삼양KCI", position: str = "팀장",
+                score: int = 80, recommendation: str = "추천") -> Dict[str, Any]:
+    """보고서 스키마(ReportData)를 만족하는 LLM 분석 결과"""
+    return {
+        "candidate_info": {
+            "name": f"후보{index:03d}", "organization": organization, "position": position,
+            "career_summary": "화학 업계 10년 경력", "salary_info": "6000만원",
+            "interview_date": "2025-07-08",
+        },
+        "material_analysis": [
+            {"material_name": "이력서", "summary": "요약", "analysis_points": "포인트"},
+        ],
+        "comprehensive_report": {
+            "summary": "전문성이 높습니다.", "recommendation": recommendation, "score": score,
+        },
+        "analysis_items": [
+            {"category": category, "title": f"항목 {k + 1}", "analysis": "분석 내용",
+             "evidence": "근거", "score": 50 + (index * 7 + k * 11) % 50}
+            for k, category in enumerate(_CATEGORIES)
+        ],
+        "decision_points": {
+            "strengths": [{"title": "전문성", "analysis": "규제 대응 경험", "evidence": "이력서"}],
+            "risks": [{"title": "리더십 리스크", "analysis": "팀 운영 경험 부족", "evidence": "평판"}],
+        },
+        "overall_reliability": {"consistency": "높음", "completeness": "보통", "objectivity": "높음"},
+    }
+
+
+def make_llm_text(index: int, **kwargs: Any) -> str:
+    """LLM 응답 형식(설명 + ```json 코드블록)의 원문"""
+    body = json.dumps(make_report(index, **kwargs), ensure_ascii=False, indent=2)
+    return f"분석 결과입니다.\n\n```json\n{body}\n```\n"
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch) -> str:
+    """DB_PATH를 임시 디렉터리의 새 DB로 바꿉니다. (캐시 디렉터리도 그 옆에 생김)"""
+    path = str(tmp_path / "candidates.db")
+    monkeypatch.setattr(db, "DB_PATH", path)
+    report_cache.clear()
+    yield path
+    db.close_db_pool()
+    report_cache.clear()
+
+
+@pytest.fixture
+def save_candidates(temp_db) -> Callable[..., List[str]]:
+    """save_candidates(개수, **make_report 인자) -> 저장한 후보자 id 목록"""
+
+    def save(count: int, start: int = 0, **kwargs: Any) -> List[str]:
+        for index in range(start, start + count):
+            db.save_llm_analysis_result(
+                f"후보{index:03d}", kwargs.get("organization", "삼양KCI"),
+                kwargs.get("position", "팀장"), "2025-07-08", make_llm_text(index, **kwargs),
+            )
+        with db.db_session() as conn:
+            rows = conn.execute(
+                "SELECT id FROM candidate_analysis WHERE name IN "
+                f"({', '.join('?' * count)}) ORDER BY name",
+                [f"후보{index:03d}" for index in range(start, start + count)],
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    return save
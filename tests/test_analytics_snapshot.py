@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""분석 스냅샷(Arrow 파일)의 생성, 증분 갱신, 실패 시 재생성 검사"""
+
+import pytest
+
+from app import analytics_snapshot, db
+
+
+def _names():
+    return sorted(analytics_snapshot.load_snapshot("candidates")["name"].to_pylist())
+
+
+@pytest.fixture
+def no_rebuild(monkeypatch):
+    """이후 조회가 전체 재생성 없이 증분 갱신된 파일을 읽는지 확인"""
+
+    def fail_rebuild():
+        raise AssertionError("증분 갱신 대신 전체 재생성")
+
+    monkeypatch.setattr(analytics_snapshot, "rebuild_snapshot", fail_rebuild)
+
+
+def test_first_load_builds_snapshot(save_candidates):
+    save_candidates(3)
+    candidates = analytics_snapshot.load_snapshot("candidates")
+    items = analytics_snapshot.load_snapshot("items")
+
+    assert candidates.schema.equals(analytics_snapshot.CANDIDATE_SCHEMA, check_metadata=True)
+    assert candidates.num_rows == 3 and items.num_rows == 3 * 6
+    row = [row for row in candidates.to_pylist() if row["name"] == "후보000"][0]
+    assert row["overall_score"] == 80 and row["item_count"] == 6
+    assert row["strengths"] == ["전문성"] and row["risks"] == ["리더십 리스크"]
+    assert row["content_hash"] == db.load_content_hash(row["id"])
+    with pytest.raises(ValueError):
+        analytics_snapshot.load_snapshot("unknown")
+
+
+def test_saves_and_deletes_update_snapshot_in_place(save_candidates, request):
+    ids = save_candidates(3)
+    assert _names() == ["후보000", "후보001", "후보002"]
+    request.getfixturevalue("no_rebuild")
+
+    save_candidates(1, start=3)
+    save_candidates(1, start=0, score=55)  # 같은 id 재저장은 행을 교체
+    db.delete_candidate(ids[1])
+
+    assert _names() == ["후보000", "후보002", "후보003"]
+    candidates = analytics_snapshot.load_snapshot("candidates")
+    scores = dict(zip(candidates["id"].to_pylist(), candidates["overall_score"].to_pylist()))
+    assert scores[ids[0]] == 55
+    items = analytics_snapshot.load_snapshot("items")
+    assert ids[1] not in set(items["candidate_id"].to_pylist())
+    assert items.num_rows == 3 * 6
+
+
+def test_failed_update_marks_snapshot_stale(save_candidates, monkeypatch):
+    save_candidates(2)
+    assert len(_names()) == 2
+
+    def broken_write(*args, **kwargs):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(analytics_snapshot, "_write_snapshot", broken_write)
+        save_candidates(1, start=2)  # 저장은 성공하고 스냅샷만 갱신 필요로 표시
+    assert db.query_candidate_page()[1] == 3
+
+    assert not analytics_snapshot._is_current()
+    assert _names() == ["후보000", "후보001", "후보002"]
+    assert analytics_snapshot._is_current()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""후보자 목록 스트리밍 내보내기(candidate_export) 검사"""
+
+import csv
+import io
+
+import pytest
+from flask import Flask
+
+from app import candidate_export, db
+
+
+def test_iter_csv_streams_each_batch():
+    batches = iter([[("a", "가")], [("b", "나"), ("c", "다")]])
+    chunks = list(candidate_export.iter_csv(batches))
+    assert len(chunks) == 2
+    assert chunks[0].startswith(b"\xef\xbb\xbf") and not chunks[1].startswith(b"\xef\xbb\xbf")
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8-sig"))))
+    assert rows[0] == list(db.CANDIDATE_EXPORT_COLUMNS)
+    assert rows[1:] == [["a", "가"], ["b", "나"], ["c", "다"]]
+
+    # 결과가 없어도 머리글은 내보냄
+    empty = b"".join(candidate_export.iter_csv(iter([]))).decode("utf-8-sig")
+    assert empty.strip() == ",".join(db.CANDIDATE_EXPORT_COLUMNS)
+
+
+def test_export_url_keeps_only_filters():
+    assert candidate_export.export_url("csv") == "/export/candidates.csv"
+    assert candidate_export.export_url(
+        "xlsx", {"search": "리더십", "name": "", "page_current": 3}
+    ) == "/export/candidates.xlsx?search=%EB%A6%AC%EB%8D%94%EC%8B%AD"
+
+
+def test_iter_candidate_rows_reads_in_batches(save_candidates):
+    save_candidates(5)
+    batches = list(db.iter_candidate_rows(batch_size=2))
+    assert [len(rows) for rows in batches] == [2, 2, 1]
+    assert [row[1] for rows in batches for row in rows] == [f"후보{i:03d}" for i in range(5)]
+
+
+@pytest.mark.parametrize("fmt", ["csv", "xlsx", "parquet"])
+def test_write_export(save_candidates, tmp_path, fmt):
+    save_candidates(3)
+    save_candidates(2, start=3, organization="삼양사")
+    path = str(tmp_path / f"out.{fmt}")
+    assert candidate_export.write_export(fmt, path, {"organization": "삼양사"}) == 2
+
+    if fmt == "csv":
+        with open(path, encoding="utf-8-sig") as f:
+            names = [row["name"] for row in csv.DictReader(f)]
+    elif fmt == "xlsx":
+        from openpyxl import load_workbook
+
+        rows = list(load_workbook(path, read_only=True)["candidates"].values)
+        names = [row[1] for row in rows[1:]]
+    else:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        assert table.schema.field("overall_score").type == "double"
+        names = table["name"].to_pylist()
+    assert names == ["후보003", "후보004"]
+
+
+def test_export_route(save_candidates):
+    save_candidates(3)
+    server = Flask(__name__)
+    candidate_export.register_export_routes(server)
+    client = server.test_client()
+
+    response = client.get(candidate_export.export_url("csv", {"name": "후보001"}))
+    assert response.status_code == 200 and response.mimetype == "text/csv"
+    assert response.headers["Cache-Control"] == "no-store"
+    assert "attachment" in response.headers["Content-Disposition"]
+    lines = response.get_data().decode("utf-8-sig").splitlines()
+    assert len(lines) == 2 and lines[1].startswith("후보001_")
+
+    parquet = client.get(candidate_export.export_url("parquet"))
+    assert parquet.status_code == 200 and parquet.get_data()[:4] == b"PAR1"
+    assert client.get("/export/candidates.json").status_code == 404
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""코호트 백분위 색인(cohort_index)의 삽입/삭제와 저장 시 증분 갱신 검사"""
+
+import pytest
+
+from app import db
+from app.cohort_index import METRICS, CohortIndex, cohort_index, percentile_rank
+
+COHORT = ("삼양KCI", "팀장")
+
+
+def _scores(overall, *dimensions):
+    return (overall, *dimensions, *[None] * (len(METRICS) - 1 - len(dimensions)))
+
+
+def test_percentile_rank_counts_ties_as_half():
+    assert percentile_rank([60, 70, 80, 90], 90) == 87.5
+    assert percentile_rank([60, 70, 70, 90], 70) == 50.0
+    assert percentile_rank([60, 70, 80], 65) == pytest.approx(100 / 3)
+
+
+def test_insert_and_remove_keep_sorted_lists():
+    index = CohortIndex()
+    index._insert("a", COHORT, _scores(80, 3.0))
+    index._insert("b", COHORT, _scores(60, None))
+    index._insert("c", ("삼양사", "책임"), _scores(None, 4.0))
+    assert index._scores[COHORT]["overall"] == [60, 80]
+    assert index._scores[COHORT][METRICS[1]] == [3.0]
+    assert index._sizes == {COHORT: 2, ("삼양사", "책임"): 1}
+
+    # 같은 id를 다시 넣으면 이전 값을 빼고 넣음 (코호트가 바뀐 경우 포함)
+    index._insert("a", ("삼양사", "책임"), _scores(70, 2.0))
+    assert index._scores[COHORT]["overall"] == [60]
+    assert index._scores[COHORT][METRICS[1]] == []
+    assert index._scores[("삼양사", "책임")][METRICS[1]] == [2.0, 4.0]
+
+    index._remove("b")
+    index._remove("없는 id")
+    assert COHORT not in index._scores and COHORT not in index._sizes
+    assert set(index._members) == {"a", "c"}
+
+
+@pytest.fixture
+def fresh_index(temp_db):
+    cohort_index.invalidate()
+    yield cohort_index
+    cohort_index.invalidate()
+
+
+def test_percentiles_follow_saves_and_deletes(save_candidates, fresh_index, monkeypatch):
+    ids = [save_candidates(1, start=i, score=score)[0] for i, score in enumerate((60, 70, 80))]
+    other = save_candidates(1, start=3, score=90, position="책임")[0]
+
+    top = fresh_index.percentiles(ids[2])
+    assert top["cohort_size"] == 3 and top["overall"] == pytest.approx(500 / 6)
+    assert set(top["dimensions"]) <= set(METRICS[1:]) and top["dimensions"]
+    assert fresh_index.percentiles(other)["overall"] is None  # 코호트 인원 부족
+    assert fresh_index.percentiles("없는 후보자") is None
+
+    # 색인을 만든 뒤의 저장/삭제는 스냅샷에서 다시 만들지 않고 바뀐 후보자만 반영
+    def fail_rebuild():
+        raise AssertionError("증분 갱신 대신 전체 재구성")
+
+    monkeypatch.setattr(fresh_index, "_rebuild", fail_rebuild)
+    new_id = save_candidates(1, start=4, score=95)[0]
+    assert fresh_index.percentiles(ids[2])["overall"] == 62.5
+    assert fresh_index.percentiles(new_id)["cohort_size"] == 4
+
+    db.delete_candidate(new_id)
+    db.delete_candidate(ids[0])
+    assert fresh_index.percentiles(new_id) is None
+    assert fresh_index.percentiles(ids[2]) == {
+        **top, "cohort_size": 2, "overall": None, "dimensions": {},
+    }
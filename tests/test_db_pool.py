@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""SQLite 커넥션 풀(ConnectionPool)과 db_session의 반납/롤백 검사"""
+
+import sqlite3
+
+import pytest
+
+from app import db
+from app.db_pool import ConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), max_size=2)
+    conn = pool.acquire()
+    conn.execute("CREATE TABLE t (v INTEGER)")
+    conn.commit()
+    pool.release(conn)
+    yield pool
+    pool.close()
+
+
+def _count(pool):
+    conn = pool.acquire()
+    try:
+        return conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+    finally:
+        pool.release(conn)
+
+
+def test_connection_is_configured_and_reused(pool):
+    conn = pool.acquire()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    pool.release(conn)
+    assert pool.acquire() is conn  # 마지막에 반납한 커넥션을 먼저 재사용
+
+
+def test_release_rolls_back_open_transaction(pool):
+    conn = pool.acquire()
+    conn.execute("INSERT INTO t VALUES (1)")
+    assert conn.in_transaction
+    pool.release(conn)
+    assert not conn.in_transaction
+    assert _count(pool) == 0
+
+
+def test_release_closes_connections_beyond_max_size(pool):
+    connections = [pool.acquire() for _ in range(3)]
+    for conn in connections:
+        pool.release(conn)
+    with pytest.raises(sqlite3.ProgrammingError):
+        connections[-1].execute("SELECT 1")  # 유휴 한도(2)를 넘은 커넥션은 닫힘
+    assert len(pool._all) == 2
+
+
+def test_close_closes_every_connection(pool):
+    idle, borrowed = pool.acquire(), pool.acquire()
+    pool.release(idle)
+    pool.close()
+    for conn in (idle, borrowed):
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_db_session_commits_or_rolls_back(temp_db):
+    with db.db_session() as conn:
+        conn.execute("INSERT INTO candidate_analysis (id, name) VALUES ('a', '가')")
+
+    with pytest.raises(RuntimeError):
+        with db.db_session() as conn:
+            conn.execute("INSERT INTO candidate_analysis (id, name) VALUES ('b', '나')")
+            raise RuntimeError("중간 실패")
+
+    with db.db_session() as conn:
+        assert conn.execute("SELECT id FROM candidate_analysis").fetchall() == [("a",)]
+        assert not conn.in_transaction
+
+
+def test_pool_follows_db_path(temp_db, tmp_path, monkeypatch):
+    with db.db_session() as conn:
+        conn.execute("INSERT INTO candidate_analysis (id, name) VALUES ('a', '가')")
+    first = db._get_pool()
+
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "other.db"))
+    with db.db_session() as conn:
+        # 새 경로의 DB도 첫 사용 시 최신 스키마로 마이그레이션됨
+        assert conn.execute("SELECT COUNT(*) FROM candidate_analysis").fetchone()[0] == 0
+    assert db._get_pool() is not first and first._all == []
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+웹 워커 기동(app.app 임포트) 시간 예산 검사
+`python -m app.cli importtime`과 같은 측정을 CI에서 pytest로 수행합니다.
+"""
+
+import pytest
+
+from app.cli import (
+    IMPORT_TIME_BUDGET_MS,
+    STARTUP_LAZY_MODULES,
+    cumulative_import_ms,
+    eager_lazy_modules,
+    measure_import_time,
+)
+
+# 측정 잡음(디스크 캐시, CI 러너 부하) 때문에 예산을 넘으면 최대 이 횟수까지 다시 재고 최솟값으로 판단
+MAX_MEASUREMENTS = 3
+
+
+@pytest.fixture(scope="module")
+def app_import_entries():
+    return measure_import_time("app.app")
+
+
+def test_app_import_within_budget(app_import_entries):
+    total_ms = cumulative_import_ms(app_import_entries, "app.app")
+    for _ in range(MAX_MEASUREMENTS - 1):
+        if total_ms <= IMPORT_TIME_BUDGET_MS:
+            break
+        total_ms = min(total_ms, cumulative_import_ms(measure_import_time("app.app"), "app.app"))
+    assert total_ms <= IMPORT_TIME_BUDGET_MS, (
+        f"app.app 임포트 {total_ms:.0f}ms > 예산 {IMPORT_TIME_BUDGET_MS}ms"
+    )
+
+
+def test_app_import_skips_lazy_modules(app_import_entries):
+    eager = eager_lazy_modules(app_import_entries)
+    assert not eager, f"기동 시 로드되면 안 되는 모듈: {', '.join(eager)} (STARTUP_LAZY_MODULES: {STARTUP_LAZY_MODULES})"
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""일괄 가져오기(importer)의 후보자 정보 정리와 거부/중복 집계 검사"""
+
+import json
+
+from app import db, importer
+from app.utils_llm_parse import clean_value, extract_candidate_info_from_text
+
+from conftest import make_llm_text, make_report
+
+
+def test_clean_value_strips_source_prefix():
+    assert clean_value("자료기준: 홍길동") == "홍길동"
+    assert clean_value(" 삼양KCI ") == "삼양KCI"
+    assert clean_value(None) is None
+
+
+def test_importer_and_llm_tab_extract_same_candidate_info(temp_db):
+    report = make_report(1)
+    report["candidate_info"]["name"] = "이력서 기준: 후보001"
+    raw = json.dumps(report, ensure_ascii=False)
+
+    extracted = extract_candidate_info_from_text(raw)
+    summary = importer.import_records([("a.json", raw, {})])
+
+    assert summary["imported"] == 1 and summary["rejected"] == []
+    row = db.load_report_data(f"{extracted['name']}_{extracted['date']}")
+    assert row is not None and extracted["name"] == "후보001"
+
+
+def test_import_records_counts_rejected_and_duplicates(temp_db):
+    jsonl = [
+        json.dumps({"raw_llm_text": make_llm_text(1)}, ensure_ascii=False),
+        "",
+        "JSON이 아닌 줄",
+        json.dumps({"raw_llm_text": make_llm_text(1), "position": "책임"}, ensure_ascii=False),
+        json.dumps({"raw_llm_text": "   "}),
+        json.dumps({"raw_llm_text": make_llm_text(2)}, ensure_ascii=False),
+    ]
+    progress = []
+    summary = importer.import_records(
+        importer.iter_jsonl(jsonl, source="batch.jsonl"), chunk_size=2,
+        progress=lambda *args: progress.append(args),
+    )
+
+    assert summary["total"] == 5
+    assert summary["imported"] == 2 and summary["duplicates"] == 1
+    assert [source for source, _ in summary["rejected"]] == ["batch.jsonl:3", "batch.jsonl:5"]
+    assert summary["rejected"][1][1] == "내용이 비어 있습니다"
+    assert progress[-1] == (5, 2, 2)
+    assert "5건 중 2건 저장, 2건 거부" in importer.format_import_summary(summary)
+    with db.db_session() as conn:
+        position = conn.execute(
+            "SELECT position FROM candidate_analysis WHERE name = '후보001'"
+        ).fetchone()[0]
+    assert position == "책임"  # 같은 id는 마지막 레코드로 저장
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""구버전(v1) candidates.db를 최신 스키마까지 올리는 마이그레이션 검사"""
+
+import hashlib
+import json
+import sqlite3
+
+import pytest
+
+from app import db_migrations
+
+from conftest import make_llm_text
+
+
+def _columns(conn):
+    return {row[1] for row in conn.execute("PRAGMA table_info(candidate_analysis)")}
+
+
+def _search(conn, term):
+    return [
+        row[0] for row in conn.execute(
+            "SELECT c.id FROM candidate_search s JOIN candidate_analysis c ON c.rowid = s.rowid "
+            "WHERE candidate_search MATCH ? ORDER BY c.id",
+            (f'"{term}"',),
+        )
+    ]
+
+
+@pytest.fixture
+def v1_conn(tmp_path):
+    """v1 구조(LLM 원문이 evaluator, 지원조직/직급이 json_data에 있음)의 DB"""
+    conn = sqlite3.connect(str(tmp_path / "old.db"))
+    db_migrations._create_base_table(conn)
+    rows = [
+        ("후보001_2025-07-08", "후보001", make_llm_text(1), "2025-07-08",
+         json.dumps({"organization": "삼양KCI", "position": "팀장"}, ensure_ascii=False)),
+        ("후보002_2025-07-09", "후보002", "보고서가 아닌 원문", "2025-07-09", None),
+    ]
+    conn.executemany("INSERT INTO candidate_analysis VALUES (?, ?, ?, ?, ?)", rows)
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def test_upgrade_v1_to_latest(v1_conn):
+    conn = v1_conn
+    assert db_migrations.run_migrations(conn) == db_migrations.SCHEMA_VERSION
+    assert db_migrations.get_schema_version(conn) == db_migrations.SCHEMA_VERSION
+
+    columns = _columns(conn)
+    assert "evaluator" not in columns
+    assert {
+        "raw_llm_text", "report_json", "overall_score", "recommendation",
+        "organization", "position", "created_at", "content_hash",
+    } <= columns
+
+    rows = {
+        row[0]: row[1:] for row in conn.execute(
+            "SELECT id, organization, position, overall_score, report_json, raw_llm_text, content_hash "
+            "FROM candidate_analysis"
+        )
+    }
+    organization, position, score, report_json, raw, digest = rows["후보001_2025-07-08"]
+    assert (organization, position, score) == ("삼양KCI", "팀장", 80)
+    assert json.loads(report_json)["candidate_info"]["name"] == "후보001"
+    # v5는 당시 정의(LLM 원문 sha256)로 백필
+    assert digest == hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    assert rows["후보002_2025-07-09"][-1] == hashlib.sha256("보고서가 아닌 원문".encode("utf-8")).hexdigest()
+
+    # 이미 최신이면 아무것도 바꾸지 않음
+    assert db_migrations.run_migrations(conn) == db_migrations.SCHEMA_VERSION
+    assert conn.execute("SELECT COUNT(*) FROM candidate_analysis").fetchone()[0] == 2
+
+
+def test_search_triggers_follow_table_changes(v1_conn):
+    conn = v1_conn
+    db_migrations.run_migrations(conn)
+    triggers = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    }
+    if not triggers:
+        pytest.skip("이 SQLite는 FTS5를 지원하지 않음")
+    assert triggers == {"candidate_search_ai", "candidate_search_ad", "candidate_search_au"}
+
+    # 기존 행은 마이그레이션 시 색인됨 (보고서 본문 포함)
+    assert _search(conn, "규제 대응") == ["후보001_2025-07-08"]
+
+    conn.execute(
+        "INSERT INTO candidate_analysis (id, name, organization, position) "
+        "VALUES ('후보003_2025-07-10', '후보003', '삼양바이오팜', '책임')"
+    )
+    assert _search(conn, "삼양바이오팜") == ["후보003_2025-07-10"]
+
+    conn.execute("UPDATE candidate_analysis SET organization = '삼양홀딩스' WHERE name = '후보003'")
+    assert _search(conn, "삼양바이오팜") == []
+    assert _search(conn, "삼양홀딩스") == ["후보003_2025-07-10"]
+
+    conn.execute("DELETE FROM candidate_analysis WHERE name = '후보001'")
+    assert _search(conn, "규제 대응") == []
+    conn.commit()
+
+    assert db_migrations.rebuild_search_index(conn) == 2
+    assert _search(conn, "삼양홀딩스") == ["후보003_2025-07-10"]
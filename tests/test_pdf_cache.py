@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""PDF 보고서 디스크 캐시 쓰기 경로 (동시 요청, 정리) 검사"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from app import disk_cache, pdf_report
+
+
+def _run_concurrently(func, count):
+    barrier = threading.Barrier(count)
+    results, errors = [], []
+
+    def worker():
+        barrier.wait()
+        try:
+            results.append(func())
+        except Exception as e:  # 실패한 스레드도 기록해 한꺼번에 확인
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_requests_render_once(save_candidates, monkeypatch):
+    (candidate_id,) = save_candidates(1)
+    calls = []
+    original = pdf_report.build_pdf
+
+    def counting_build(report_data, report_type):
+        calls.append(report_type)
+        time.sleep(0.05)  # 다른 스레드가 같은 문서를 요청할 시간을 줌
+        return original(report_data, report_type)
+
+    monkeypatch.setattr(pdf_report, "build_pdf", counting_build)
+    results, errors = _run_concurrently(lambda: pdf_report.get_pdf_path(candidate_id, "executive"), 6)
+
+    assert errors == []
+    assert len(set(results)) == 1 and os.path.exists(results[0])
+    assert calls == ["executive"]
+    leftovers = [name for name in os.listdir(pdf_report.pdf_cache_dir()) if name.endswith(".tmp")]
+    assert leftovers == []
+    with open(results[0], "rb") as f:
+        assert f.read(5) == b"%PDF-"
+
+
+def test_cached_pdf_path_after_file_removed(save_candidates):
+    (candidate_id,) = save_candidates(1)
+    path = pdf_report.get_pdf_path(candidate_id, "hr")
+    assert pdf_report.cached_pdf_path(candidate_id, "hr") == path
+    os.remove(path)  # 다른 요청의 _prune_cache가 지운 경우
+    assert pdf_report.cached_pdf_path(candidate_id, "hr") is None
+    assert pdf_report.get_pdf_path(candidate_id, "hr") == path
+
+
+def test_unknown_candidate_and_type(temp_db):
+    assert pdf_report.get_pdf_path("없는 후보자", "hr") is None
+    with pytest.raises(ValueError):
+        pdf_report.get_pdf_path("없는 후보자", "unknown")
+
+
+def test_prune_files_keeps_recently_used(tmp_path):
+    now = time.time()
+    for i in range(5):
+        path = tmp_path / f"{i}.pdf"
+        path.write_bytes(b"x")
+        os.utime(path, (now - 100 + i, now - 100 + i))
+    (tmp_path / "other.txt").write_bytes(b"x")
+    assert disk_cache.touch(str(tmp_path / "0.pdf")) is not None  # 가장 오래된 파일을 다시 사용
+
+    assert disk_cache.prune_files(str(tmp_path), ".pdf", 3) == 2
+    assert sorted(os.listdir(tmp_path)) == ["0.pdf", "3.pdf", "4.pdf", "other.txt"]
+    assert disk_cache.touch(str(tmp_path / "1.pdf")) is None
+
+
+def test_write_atomic_leaves_no_temp_file_on_error(tmp_path, monkeypatch):
+    target = str(tmp_path / "cache" / "a.pdf")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(disk_cache.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        disk_cache.write_atomic(target, b"data")
+    assert os.listdir(tmp_path / "cache") == []
+
+
+def test_pdf_route(save_candidates):
+    from flask import Flask
+
+    (candidate_id,) = save_candidates(1)
+    server = Flask(__name__)
+    pdf_report.register_pdf_routes(server)
+    client = server.test_client()
+    url = pdf_report.pdf_url(candidate_id, "executive")
+
+    response = client.get(url)
+    assert response.status_code == 200 and response.mimetype == "application/pdf"
+    assert response.get_data()[:5] == b"%PDF-"
+    assert client.get(url, headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+    assert client.get(pdf_report.pdf_url("없는 후보자", "executive")).status_code == 404
+    assert client.get(pdf_report.pdf_url(candidate_id, "unknown")).status_code == 404
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""채용위원회용 보고서 묶음(pdf_packet) 생성과 다운로드 경로 검사"""
+
+import os
+import time
+import zipfile
+
+import pytest
+from flask import Flask
+
+from app import pdf_packet, pdf_report
+
+
+def test_build_pdf_packet_reuses_cache_and_keeps_order(save_candidates, tmp_path):
+    fitz = pytest.importorskip("fitz")
+    first, second = save_candidates(2)
+    pdf_report.get_pdf_path(second, "hr")  # 미리 만든 문서는 캐시에서 가져옴
+    progress = []
+
+    summary = pdf_packet.build_packet(
+        [second, first, second, "없는 후보자"], ["hr", "executive"], str(tmp_path / "packet.pdf"),
+        progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert (summary["documents"], summary["cached"], summary["rendered"]) == (4, 1, 3)
+    assert [(cid, report_type) for cid, report_type, _ in summary["failed"]] == [
+        ("없는 후보자", "executive"), ("없는 후보자", "hr"),
+    ]
+    assert progress[0] == (1, 6) and progress[-1] == (6, 6)
+    with fitz.open(str(tmp_path / "packet.pdf")) as document:
+        toc = [(level, title) for level, title, _ in document.get_toc()]
+    # 후보자는 요청 순서, 보고서 유형은 PDF_REPORT_TYPES 순서
+    assert toc == [
+        (1, "후보001"), (2, "임원용 요약 보고서"), (2, "HR 상세 분석 보고서"),
+        (1, "후보000"), (2, "임원용 요약 보고서"), (2, "HR 상세 분석 보고서"),
+    ]
+    assert [name for name in os.listdir(pdf_packet.packet_dir()) if name.startswith("parts_")] == []
+
+
+def test_build_zip_packet(save_candidates, tmp_path):
+    (candidate_id,) = save_candidates(1)
+    summary = pdf_packet.build_packet([candidate_id], ["comprehensive"], str(tmp_path / "p.zip"), fmt="zip")
+    assert summary["documents"] == 1
+    with zipfile.ZipFile(tmp_path / "p.zip") as archive:
+        assert archive.namelist() == ["001_후보000_종합 분석 보고서.pdf"]
+        assert archive.read(archive.namelist()[0])[:5] == b"%PDF-"
+
+
+def test_build_packet_rejects_unknown_format_and_type(temp_db, tmp_path):
+    with pytest.raises(ValueError):
+        pdf_packet.build_packet(["a"], ["hr"], str(tmp_path / "p.tar"), fmt="tar")
+    with pytest.raises(ValueError):
+        pdf_packet.build_packet(["a"], ["unknown"], str(tmp_path / "p.pdf"))
+
+
+def test_packet_job_and_download_route(save_candidates):
+    ids = save_candidates(2)
+    job_id = pdf_packet.start_packet_job(ids, ["executive"], fmt="zip", workers=1)
+    deadline = time.time() + 30
+    while pdf_packet.load_packet_status(job_id)["state"] == "running" and time.time() < deadline:
+        time.sleep(0.05)
+    status = pdf_packet.load_packet_status(job_id)
+    assert status["state"] == "done" and status["done"] == status["total"] == 2
+
+    server = Flask(__name__)
+    pdf_packet.register_packet_routes(server)
+    client = server.test_client()
+    response = client.get(pdf_packet.packet_url(job_id))
+    assert response.status_code == 200 and response.mimetype == "application/zip"
+    assert "attachment" in response.headers["Content-Disposition"]
+    assert client.get(pdf_packet.packet_url("0" * 32)).status_code == 404
+    assert pdf_packet.load_packet_status("../x") is None
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""인쇄용 HTML 디스크 캐시 (동시 요청, 정리)와 /print-report 경로 검사"""
+
+import os
+import threading
+import time
+
+from flask import Flask
+
+from app import static_report
+
+
+def test_concurrent_requests_render_once(save_candidates, monkeypatch):
+    (candidate_id,) = save_candidates(1)
+    calls = []
+    original = static_report.render_print_html
+
+    def counting_render(report_data, report_type):
+        calls.append(report_type)
+        time.sleep(0.05)
+        return original(report_data, report_type)
+
+    monkeypatch.setattr(static_report, "render_print_html", counting_render)
+    barrier = threading.Barrier(6)
+    results, errors = [], []
+
+    def worker():
+        barrier.wait()
+        try:
+            results.append(static_report.get_print_html_path(candidate_id, "comprehensive"))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(set(results)) == 1 and calls == ["comprehensive"]
+    assert not [name for name in os.listdir(static_report.print_cache_dir()) if name.endswith(".tmp")]
+
+
+def test_cache_is_pruned_to_limit(save_candidates, monkeypatch):
+    ids = save_candidates(3)
+    monkeypatch.setattr(static_report, "PRINT_CACHE_MAX_FILES", 4)
+    for candidate_id in ids:
+        for report_type in ("comprehensive", "executive"):
+            path = static_report.get_print_html_path(candidate_id, report_type)
+            assert os.path.exists(path)  # 방금 만든 파일은 정리 대상이 아님
+    files = [name for name in os.listdir(static_report.print_cache_dir()) if name.endswith(".html")]
+    assert len(files) == 4
+
+
+def test_print_route(save_candidates):
+    (candidate_id,) = save_candidates(1)
+    server = Flask(__name__)
+    static_report.register_print_routes(server)
+    client = server.test_client()
+
+    response = client.get(static_report.print_url(candidate_id, "hr"))
+    assert response.status_code == 200
+    assert response.mimetype == "text/html"
+    assert "후보000" in response.get_data(as_text=True)
+    etag = response.headers["ETag"]
+
+    cached = client.get(static_report.print_url(candidate_id, "hr"), headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert client.get(static_report.print_url("없는 후보자", "hr")).status_code == 404
+    assert client.get(static_report.print_url(candidate_id, "unknown")).status_code == 404
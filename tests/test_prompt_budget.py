@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""모델별 토큰 예산과 자동 맞춤(plan_custom_prompt) 검사"""
+
+import pytest
+
+from app.config import MATERIAL_LABELS, MODEL_TOKEN_BUDGETS, RESERVED_OUTPUT_TOKENS
+from app.prompt_logic import plan_custom_prompt
+
+
+def _plan(budget, instructions="", auto_trim=True):
+    return plan_custom_prompt(
+        "홍길동", "삼양KCI", "팀장", "2025-07-08", "6000만원", "10",
+        list(MATERIAL_LABELS), instructions, budget, auto_trim=auto_trim,
+    )
+
+
+@pytest.mark.parametrize("model", list(MODEL_TOKEN_BUDGETS))
+def test_every_model_fits_required_materials(model):
+    budget = MODEL_TOKEN_BUDGETS[model]
+    plan = _plan(budget)
+    assert plan["total_tokens"] <= budget
+    assert plan["reserved_tokens"] == RESERVED_OUTPUT_TOKENS < budget // 2
+    assert {"이력서", "면접평가표(1차)", "면접 녹취록(1차)"} <= set(plan["materials"])
+
+
+def test_auto_trim_drops_materials_then_instructions():
+    budget = min(MODEL_TOKEN_BUDGETS.values())
+    untrimmed = _plan(budget, "추가 확인 사항 " * 400, auto_trim=False)
+    assert untrimmed["total_tokens"] > budget and untrimmed["dropped_materials"] == []
+
+    plan = _plan(budget, "추가 확인 사항 " * 400)
+    assert plan["dropped_materials"][0] == "포트폴리오"
+    assert plan["instructions_trimmed"] and plan["total_tokens"] <= budget
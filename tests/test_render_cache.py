@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""보고서 컴포넌트 트리 렌더링 캐시(render_cache) 검사"""
+
+from dash import html
+
+from app import db, ui_report
+from app.render_cache import RenderCache, render_cache, render_key
+
+
+def test_render_cache_is_bounded_by_bytes():
+    cache = RenderCache(max_bytes=400)
+    for i in range(3):
+        cache.put(render_key(f"h{i}", "hr"), html.Div("x" * 100, id=f"c{i}"))
+    cache.put(render_key("large", "hr"), html.Div("x" * 1000))  # 한도보다 큰 항목은 저장 안 함
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 400 and stats["evictions"] == 1
+    assert cache.get(render_key("h0", "hr")) is None
+    assert cache.get(render_key("large", "hr")) is None
+    cached = cache.get(render_key("h2", "hr"))
+    assert cached["props"]["id"] == "c2"
+
+    # 반환값을 고쳐도 캐시에는 영향 없음
+    cached["props"]["id"] = "changed"
+    assert cache.get(render_key("h2", "hr"))["props"]["id"] == "c2"
+
+
+def test_report_content_is_rendered_once_per_content_hash(save_candidates, monkeypatch):
+    (candidate_id,) = save_candidates(1)
+    render_cache.clear()
+    first = ui_report.update_report_content(candidate_id, "hr_visual")
+
+    def fail_load(candidate_id):
+        raise AssertionError("렌더 캐시 대신 보고서를 다시 불러옴")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(ui_report, "load_report_with_hash", fail_load)
+        cached = ui_report.update_report_content(candidate_id, "hr_visual")
+    assert isinstance(cached, dict) and cached["type"] == type(first).__name__
+    assert render_cache.stats()["hits"] == 1
+
+    # 원문이 바뀌면 content_hash가 바뀌어 다시 렌더링
+    with db.db_session() as conn:
+        conn.execute(
+            "UPDATE candidate_analysis SET content_hash = 'changed' WHERE id = ?", (candidate_id,)
+        )
+    db.report_cache.clear()
+    assert not isinstance(ui_report.update_report_content(candidate_id, "hr_visual"), dict)
+    render_cache.clear()
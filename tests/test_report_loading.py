@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""db.load_report_with_hash: report_json 복원, 캐시, 원문 대체 파싱 검사"""
+
+from app import db
+from app.report_cache import report_cache
+
+
+def _set_report_json(candidate_id, report_json):
+    # content_hash는 그대로 두고 report_json만 바꿈 (스키마 변경 후 reparse 전 상태 재현)
+    with db.db_session() as conn:
+        conn.execute(
+            "UPDATE candidate_analysis SET report_json = ? WHERE id = ?", (report_json, candidate_id)
+        )
+    report_cache.clear()
+
+
+def test_returns_hash_and_report_from_same_row(save_candidates):
+    (candidate_id,) = save_candidates(1)
+    content_hash, report = db.load_report_with_hash(candidate_id)
+    assert content_hash == db.load_content_hash(candidate_id)
+    assert report.candidate_info.name == "후보000"
+    # 두 번째 조회는 프로세스 내 캐시에서 같은 객체
+    assert db.load_report_with_hash(candidate_id)[1] is report
+    assert db.load_report_with_hash("없는 후보자") == (None, None)
+
+
+def test_invalid_report_json_falls_back_to_raw_text(save_candidates):
+    (candidate_id,) = save_candidates(1)
+    _set_report_json(candidate_id, '{"candidate_info": 1}')
+    content_hash, report = db.load_report_with_hash(candidate_id)
+    assert content_hash
+    assert report is not None and report.candidate_info.name == "후보000"
+
+
+def test_backfill_row_without_report_json(save_candidates):
+    (candidate_id,) = save_candidates(1)
+    _set_report_json(candidate_id, None)
+    assert db.load_report_data(candidate_id).candidate_info.name == "후보000"
+
+
+def test_empty_report_json_means_unparseable(save_candidates):
+    (candidate_id,) = save_candidates(1)
+    _set_report_json(candidate_id, "")
+    content_hash, report = db.load_report_with_hash(candidate_id)
+    assert content_hash and report is None
+
+
+def test_report_cache_is_bounded_lru():
+    from app.report_cache import ReportCache
+
+    cache = ReportCache(max_entries=2)
+    cache.put(("a", "1"), "A1")
+    cache.put(("b", "1"), "B1")
+    assert cache.get(("a", "1")) == "A1"  # a를 최근 사용으로
+    cache.put(("c", "1"), "C1")
+    assert cache.get(("b", "1")) is None and cache.get(("c", "1")) == "C1"
+
+    # 같은 후보자의 새 해시가 들어오면 이전 해시 항목은 제거
+    cache.put(("a", "2"), "A2")
+    assert cache.get(("a", "1")) is None and cache.get(("a", "2")) == "A2"
+    cache.invalidate("a")
+    assert cache.stats() == {"entries": 1, "max_entries": 2, "hits": 3, "misses": 2}
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""보고서 렌더러가 차원 집계(DimensionProfile)를 보고서당 한 번만 만드는지 검사"""
+
+import pytest
+
+from app import dimension_scores, pdf_report, static_report, ui_report
+
+
+@pytest.fixture
+def count_profiles(monkeypatch):
+    calls = []
+    original = dimension_scores.dimension_profile
+
+    def counting(items):
+        calls.append(len(items))
+        return original(items)
+
+    monkeypatch.setattr(dimension_scores, "dimension_profile", counting)
+    for module in ("executive_visual_report", "hr_visual_report", "comprehensive_visual_report", "full_report"):
+        monkeypatch.setattr(f"app.components.{module}.dimension_profile", counting)
+    return calls
+
+
+@pytest.mark.parametrize("report_type", ["comprehensive", "executive_visual", "hr_visual"])
+def test_screen_report_builds_profile_once(save_candidates, count_profiles, report_type):
+    (candidate_id,) = save_candidates(1)
+    assert ui_report.update_report_content(candidate_id, report_type) is not None
+    assert len(count_profiles) == 1
+
+
+@pytest.mark.parametrize("report_type", sorted(pdf_report.PDF_REPORT_TYPES))
+def test_pdf_and_print_build_profile_once(save_candidates, count_profiles, report_type):
+    (candidate_id,) = save_candidates(1)
+    assert pdf_report.get_pdf_path(candidate_id, report_type) is not None
+    assert len(count_profiles) == 1
+    assert static_report.get_print_html_path(candidate_id, report_type) is not None
+    assert len(count_profiles) == 2
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""전문 검색 조건 변환(search_query)과 FTS 검색/LIKE 대체 검사"""
+
+import pytest
+
+from app import db
+from app.search_query import build_search_conditions, split_search_terms
+
+_LIKE_ANY = (
+    "(name LIKE ? ESCAPE '\\' OR organization LIKE ? ESCAPE '\\' "
+    "OR position LIKE ? ESCAPE '\\' OR report_json LIKE ? ESCAPE '\\')"
+)
+
+
+def test_split_search_terms():
+    assert split_search_terms(None) == []
+    assert split_search_terms("  리더십   리스크 ") == ["리더십", "리스크"]
+
+
+def test_long_terms_use_match():
+    match, conditions, params = build_search_conditions(
+        "리더십 리스크", name="후보001", organization='삼양"KCI',
+    )
+    assert match == 'name : "후보001" AND organization : "삼양""KCI" AND "리더십" AND "리스크"'
+    assert conditions == [] and params == []
+
+
+def test_short_terms_fall_back_to_like():
+    match, conditions, params = build_search_conditions("팀장 KC", position="책임")
+    assert match is None
+    assert conditions == ["position LIKE ? ESCAPE '\\'", _LIKE_ANY, _LIKE_ANY]
+    assert params == ["%책임%"] + ["%팀장%"] * 4 + ["%KC%"] * 4
+
+
+def test_without_fts_everything_uses_like():
+    match, conditions, params = build_search_conditions("리더십", name="후보001", fts_available=False)
+    assert match is None
+    assert conditions == ["name LIKE ? ESCAPE '\\'", _LIKE_ANY]
+    assert params == ["%후보001%"] + ["%리더십%"] * 4
+
+
+@pytest.fixture
+def searchable(save_candidates):
+    save_candidates(2, organization="삼양KCI")
+    save_candidates(2, start=2, organization="삼양바이오팜", position="책임")
+
+
+@pytest.mark.parametrize("fts_available", [True, False])
+def test_search_finds_same_rows_with_and_without_index(searchable, monkeypatch, fts_available):
+    if fts_available:
+        with db.db_session() as conn:
+            if not db._search_index_exists(conn):
+                pytest.skip("이 SQLite는 FTS5를 지원하지 않음")
+    else:
+        monkeypatch.setattr(db, "_search_index_exists", lambda conn: False)
+
+    def names(**kwargs):
+        rows, total = db.query_candidate_page(page_size=50, **kwargs)
+        assert total == len(rows)
+        return sorted(row["name"] for row in rows)
+
+    assert names(organization="바이오팜") == ["후보002", "후보003"]
+    assert names(search="삼양 책임") == ["후보002", "후보003"]
+    assert names(search="규제 대응", name="후보001") == ["후보001"]  # 보고서 본문(강점)까지 검색
+    assert names(search="팀", organization="KCI") == ["후보000", "후보001"]
+    assert names(search="없는검색어") == []
+
+
+def test_search_index_follows_delete(searchable):
+    rows, _ = db.query_candidate_page(search="바이오팜")
+    db.delete_candidate(rows[0]["id"])
+    rows, total = db.query_candidate_page(search="바이오팜")
+    assert total == 1
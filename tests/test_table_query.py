@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""DataTable filter_query/sort_by 변환(table_query)과 서버 측 페이지 조회 검사"""
+
+import pytest
+
+from app import db
+from app.table_query import build_order_by, like_pattern, parse_filter_query
+
+
+@pytest.mark.parametrize(
+    "filter_query, conditions, params",
+    [
+        (None, [], []),
+        ("{name} icontains 김", ["name LIKE ? ESCAPE '\\'"], ["%김%"]),
+        ("{overall_score} >= 70", ["COALESCE(overall_score, 0) >= ?"], [70.0]),
+        ("{overall_score} ge 70.5", ["COALESCE(overall_score, 0) >= ?"], [70.5]),
+        ("{position} = '팀장'", ["position = ?"], ["팀장"]),
+        ("{interview_date} datestartswith 2025-07", ["interview_date LIKE ? ESCAPE '\\'"], ["2025-07%"]),
+        (
+            '{name} contains "김" && {recommendation} ne 보류',
+            ["name LIKE ? ESCAPE '\\'", "COALESCE(recommendation, 'N/A') != ?"],
+            ["%김%", "보류"],
+        ),
+    ],
+)
+def test_parse_filter_query(filter_query, conditions, params):
+    assert parse_filter_query(filter_query) == (conditions, params)
+
+
+@pytest.mark.parametrize(
+    "filter_query",
+    [
+        "{id} = 1",                                 # 화이트리스트에 없는 컬럼
+        "{overall_score} > 높음",                    # 숫자 컬럼에 숫자가 아닌 값
+        "{name} icontains ''",                      # 빈 값
+        "{name} between 1",                         # 지원하지 않는 연산자
+        "name = 김",                                 # 형식이 맞지 않음
+    ],
+)
+def test_parse_filter_query_ignores_invalid_terms(filter_query):
+    assert parse_filter_query(filter_query) == ([], [])
+
+
+def test_parse_filter_query_binds_values():
+    value = "1; DROP TABLE candidate_analysis"
+    assert parse_filter_query("{name} = " + value) == (["name = ?"], [value])
+
+
+def test_like_pattern_escapes_wildcards():
+    assert like_pattern("10%_a\\b") == "%10\\%\\_a\\\\b%"
+
+
+def test_build_order_by():
+    assert build_order_by(None) == "ORDER BY name ASC, id ASC"
+    assert build_order_by(None, rank_expression="search_rank") == "ORDER BY search_rank ASC, id ASC"
+    assert build_order_by(
+        [{"column_id": "overall_score", "direction": "desc"}, {"column_id": "evil", "direction": "asc"}],
+        rank_expression="search_rank",
+    ) == "ORDER BY COALESCE(overall_score, 0) DESC, id ASC"
+
+
+def test_query_candidate_page(save_candidates):
+    save_candidates(5, score=60)
+    save_candidates(7, start=5, score=90, position="책임")
+
+    rows, total = db.query_candidate_page(
+        page_current=1, page_size=3, filter_query="{overall_score} >= 70",
+        sort_by=[{"column_id": "name", "direction": "desc"}],
+    )
+    assert total == 7
+    assert [row["name"] for row in rows] == ["후보008", "후보007", "후보006"]
+    assert rows[0]["position"] == "책임" and rows[0]["overall_score"] == 90
+
+    rows, total = db.query_candidate_page(page_current=5, page_size=10)
+    assert rows == [] and total == 12
+
+    rows, total = db.query_candidate_page(filter_query="{position} icontains 팀")
+    assert total == 5 and [row["name"] for row in rows] == [f"후보{i:03d}" for i in range(5)]
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""LLM 응답 JSON 추출/복구(extract_json_object, repair_json_object) 검사"""
+
+import json
+
+import pytest
+
+from app.utils_llm_parse import extract_json_object, repair_json_object, safe_json_parse
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        # 문자열 안 줄바꿈/탭
+        ('{"a": "첫 줄\n둘째\t줄"}', {"a": "첫 줄\n둘째\t줄"}),
+        # 닫는 괄호 앞 쉼표
+        ('{"a": [1, 2,], "b": {"c": 3,},}', {"a": [1, 2], "b": {"c": 3}}),
+        # 작은따옴표 문자열과 \' 이스케이프
+        ("{'a': 'it\\'s', 'b': '\"인용\"'}", {"a": "it's", "b": '"인용"'}),
+        # 둥근 큰따옴표 “ ”, 닫는 기호로 여는 경우 ” ”
+        ('{“a”: “값”, ”b”: ”값2”}', {"a": "값", "b": "값2"}),
+        # 둥근 작은따옴표 ‘ ’, 닫는 기호로 여는 경우 ’ ’
+        ("{‘a’: ‘값’, ’b’: ’값2’}", {"a": "값", "b": "값2"}),
+        # 큰따옴표 문자열 안의 ’ 는 그대로 유지
+        ('{"a": "don’t", "b": ‘“인용”’}', {"a": "don’t", "b": "“인용”"}),
+        # Python 리터럴
+        ("{'a': True, 'b': False, 'c': None}", {"a": True, "b": False, "c": None}),
+        # 응답이 끊긴 경우
+        ('{"a": [1, {"b": "끊긴 문자열', {"a": [1, {"b": "끊긴 문자열"}]}),
+    ],
+)
+def test_repair_json_object(text, expected):
+    assert json.loads(repair_json_object(text)) == expected
+
+
+def test_repair_starts_at_given_brace_and_stops_after_object():
+    text = "분석 결과입니다: {'score': 4,} 이상입니다. {'other': 1}"
+    assert json.loads(repair_json_object(text, text.index("{"))) == {"score": 4}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '```json\n{"a": "한글", "b": [1, 2]}\n```',
+        '응답:\n{"a": "한글", "b": [1, 2]}\n설명은 여기까지입니다.',
+        "{‘a’: ‘한글’, ‘b’: [1, 2,],}",
+        '"{\\"a\\": \\"한글\\", \\"b\\": [1, 2]}"',
+    ],
+)
+def test_extract_json_object(text):
+    assert extract_json_object(text) == {"a": "한글", "b": [1, 2]}
+
+
+def test_safe_json_parse_returns_default_without_object():
+    assert safe_json_parse("JSON이 없는 응답", default_value={}) == {}